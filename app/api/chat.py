@@ -15,7 +15,8 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
 
-from ..database import get_db_cursor, get_idea_by_id
+from ..database import get_idea_by_id
+from ..async_db import read_transaction, write_transaction
 from ..models import (
     ChatSessionCreate, ChatSessionResponse,
     ChatMessageCreate, ChatMessageResponse
@@ -52,6 +53,30 @@ class ChatConnectionManager:
 manager = ChatConnectionManager()
 
 
+def store_chat_message(cursor, session_id: int, role: str, content: str) -> Dict[str, Any]:
+    """
+    Insert a chat message and return the stored row.
+    
+    Args:
+        cursor: Cursor of the current write transaction
+        session_id: Chat session ID
+        role: Message author ('user' or 'assistant')
+        content: Message text
+        
+    Returns:
+        Dict[str, Any]: Created message row
+    """
+    cursor.execute(
+        """
+        INSERT INTO chat_messages (session_id, role, content)
+        VALUES (?, ?, ?)
+        """,
+        (session_id, role, content)
+    )
+    cursor.execute("SELECT * FROM chat_messages WHERE id = ?", (cursor.lastrowid,))
+    return dict(cursor.fetchone())
+
+
 @router.post("/sessions", response_model=ChatSessionResponse)
 async def create_chat_session(session: ChatSessionCreate):
     """
@@ -63,60 +88,67 @@ async def create_chat_session(session: ChatSessionCreate):
     Returns:
         ChatSessionResponse: Created session
     """
-    try:
-        with get_db_cursor() as cursor:
-            # Verify project exists
-            cursor.execute("SELECT id FROM projects WHERE id = ?", (session.project_id,))
-            if not cursor.fetchone():
-                raise HTTPException(status_code=404, detail="Project not found")
-            
-            # Create session
-            cursor.execute(
-                """
-                INSERT INTO chat_sessions (project_id, title)
-                VALUES (?, ?)
-                """,
-                (session.project_id, session.title)
-            )
-            session_id = cursor.lastrowid
-            
-            # Add initial message if provided
-            if session.initial_message:
-                cursor.execute(
-                    """
-                    INSERT INTO chat_messages (session_id, role, content)
-                    VALUES (?, ?, ?)
-                    """,
-                    (session_id, 'user', session.initial_message)
-                )
-                
-                # Generate Claude response
-                await generate_claude_response(session_id, session.initial_message)
-            
-            # Get created session
-            cursor.execute("SELECT * FROM chat_sessions WHERE id = ?", (session_id,))
-            session_data = dict(cursor.fetchone())
-            
-            # Get message count and last message
-            cursor.execute(
-                "SELECT COUNT(*) FROM chat_messages WHERE session_id = ?",
-                (session_id,)
-            )
-            session_data['message_count'] = cursor.fetchone()[0]
-            
+    def insert_session(cursor) -> int:
+        # Verify project exists
+        cursor.execute("SELECT id FROM projects WHERE id = ?", (session.project_id,))
+        if not cursor.fetchone():
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        # Create session
+        cursor.execute(
+            """
+            INSERT INTO chat_sessions (project_id, title)
+            VALUES (?, ?)
+            """,
+            (session.project_id, session.title)
+        )
+        session_id = cursor.lastrowid
+        
+        # Add initial message if provided
+        if session.initial_message:
             cursor.execute(
                 """
-                SELECT content FROM chat_messages 
-                WHERE session_id = ? 
-                ORDER BY timestamp DESC 
-                LIMIT 1
+                INSERT INTO chat_messages (session_id, role, content)
+                VALUES (?, ?, ?)
                 """,
-                (session_id,)
+                (session_id, 'user', session.initial_message)
             )
-            last_msg = cursor.fetchone()
-            session_data['last_message'] = last_msg[0] if last_msg else None
-            
-            return ChatSessionResponse(**session_data)
+        return session_id
+    
+    def load_session(cursor, session_id: int) -> ChatSessionResponse:
+        cursor.execute("SELECT * FROM chat_sessions WHERE id = ?", (session_id,))
+        session_data = dict(cursor.fetchone())
+        
+        # Get message count and last message
+        cursor.execute(
+            "SELECT COUNT(*) FROM chat_messages WHERE session_id = ?",
+            (session_id,)
+        )
+        session_data['message_count'] = cursor.fetchone()[0]
+        
+        cursor.execute(
+            """
+            SELECT content FROM chat_messages 
+            WHERE session_id = ? 
+            ORDER BY timestamp DESC 
+            LIMIT 1
+            """,
+            (session_id,)
+        )
+        last_msg = cursor.fetchone()
+        session_data['last_message'] = last_msg[0] if last_msg else None
+        
+        return ChatSessionResponse(**session_data)
+    
+    try:
+        session_id = await write_transaction(insert_session)
+        
+        # Generate Claude response once the session is committed
+        if session.initial_message:
+            await generate_claude_response(session_id, session.initial_message)
+        
+        # Get created session
+        return await read_transaction(lambda cursor: load_session(cursor, session_id))
             
     except HTTPException:
         raise
@@ -136,44 +168,46 @@ async def get_project_chat_sessions(project_id: int, limit: int = 20):
     Returns:
         List[ChatSessionResponse]: Project chat sessions
     """
-    try:
-        with get_db_cursor() as cursor:
+    def load_sessions(cursor) -> List[ChatSessionResponse]:
+        cursor.execute(
+            """
+            SELECT * FROM chat_sessions 
+            WHERE project_id = ?
+            ORDER BY updated_at DESC
+            LIMIT ?
+            """,
+            (project_id, limit)
+        )
+        
+        sessions = []
+        for row in cursor.fetchall():
+            session_data = dict(row)
+            
+            # Get message count and last message
+            cursor.execute(
+                "SELECT COUNT(*) FROM chat_messages WHERE session_id = ?",
+                (session_data['id'],)
+            )
+            session_data['message_count'] = cursor.fetchone()[0]
+            
             cursor.execute(
                 """
-                SELECT * FROM chat_sessions 
-                WHERE project_id = ?
-                ORDER BY updated_at DESC
-                LIMIT ?
+                SELECT content FROM chat_messages 
+                WHERE session_id = ? 
+                ORDER BY timestamp DESC 
+                LIMIT 1
                 """,
-                (project_id, limit)
+                (session_data['id'],)
             )
+            last_msg = cursor.fetchone()
+            session_data['last_message'] = last_msg[0][:100] + "..." if last_msg and len(last_msg[0]) > 100 else (last_msg[0] if last_msg else None)
             
-            sessions = []
-            for row in cursor.fetchall():
-                session_data = dict(row)
-                
-                # Get message count and last message
-                cursor.execute(
-                    "SELECT COUNT(*) FROM chat_messages WHERE session_id = ?",
-                    (session_data['id'],)
-                )
-                session_data['message_count'] = cursor.fetchone()[0]
-                
-                cursor.execute(
-                    """
-                    SELECT content FROM chat_messages 
-                    WHERE session_id = ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                    """,
-                    (session_data['id'],)
-                )
-                last_msg = cursor.fetchone()
-                session_data['last_message'] = last_msg[0][:100] + "..." if last_msg and len(last_msg[0]) > 100 else (last_msg[0] if last_msg else None)
-                
-                sessions.append(ChatSessionResponse(**session_data))
-                
-            return sessions
+            sessions.append(ChatSessionResponse(**session_data))
+            
+        return sessions
+    
+    try:
+        return await read_transaction(load_sessions)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get chat sessions: {str(e)}")
@@ -192,24 +226,21 @@ async def get_chat_messages(session_id: int, limit: int = 100, offset: int = 0):
     Returns:
         List[ChatMessageResponse]: Chat messages
     """
+    def load_messages(cursor) -> List[ChatMessageResponse]:
+        cursor.execute(
+            """
+            SELECT * FROM chat_messages 
+            WHERE session_id = ?
+            ORDER BY timestamp ASC
+            LIMIT ? OFFSET ?
+            """,
+            (session_id, limit, offset)
+        )
+        
+        return [ChatMessageResponse(**dict(row)) for row in cursor.fetchall()]
+    
     try:
-        with get_db_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT * FROM chat_messages 
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ? OFFSET ?
-                """,
-                (session_id, limit, offset)
-            )
-            
-            messages = []
-            for row in cursor.fetchall():
-                message_data = dict(row)
-                messages.append(ChatMessageResponse(**message_data))
-                
-            return messages
+        return await read_transaction(load_messages)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get chat messages: {str(e)}")
@@ -227,45 +258,36 @@ async def send_chat_message(session_id: int, message: ChatMessageCreate):
     Returns:
         ChatMessageResponse: Created message
     """
+    def insert_message(cursor) -> Dict[str, Any]:
+        # Verify session exists
+        cursor.execute("SELECT project_id FROM chat_sessions WHERE id = ?", (session_id,))
+        session = cursor.fetchone()
+        if not session:
+            raise HTTPException(status_code=404, detail="Chat session not found")
+        
+        # Update session timestamp
+        cursor.execute(
+            "UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            (session_id,)
+        )
+        
+        # Store user message
+        return store_chat_message(cursor, session_id, message.role, message.content)
+    
     try:
-        with get_db_cursor() as cursor:
-            # Verify session exists
-            cursor.execute("SELECT project_id FROM chat_sessions WHERE id = ?", (session_id,))
-            session = cursor.fetchone()
-            if not session:
-                raise HTTPException(status_code=404, detail="Chat session not found")
-            
-            # Store user message
-            cursor.execute(
-                """
-                INSERT INTO chat_messages (session_id, role, content)
-                VALUES (?, ?, ?)
-                """,
-                (session_id, message.role, message.content)
-            )
-            message_id = cursor.lastrowid
-            
-            # Update session timestamp
-            cursor.execute(
-                "UPDATE chat_sessions SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                (session_id,)
-            )
-            
-            # Get created message
-            cursor.execute("SELECT * FROM chat_messages WHERE id = ?", (message_id,))
-            message_data = dict(cursor.fetchone())
-            
-            # Broadcast message to WebSocket connections
-            await manager.send_message({
-                "type": "message",
-                "data": message_data
-            }, session_id)
-            
-            # Generate Claude response if user message
-            if message.role == 'user':
-                await generate_claude_response(session_id, message.content)
-            
-            return ChatMessageResponse(**message_data)
+        message_data = await write_transaction(insert_message)
+        
+        # Broadcast message to WebSocket connections
+        await manager.send_message({
+            "type": "message",
+            "data": message_data
+        }, session_id)
+        
+        # Generate Claude response if user message
+        if message.role == 'user':
+            await generate_claude_response(session_id, message.content)
+        
+        return ChatMessageResponse(**message_data)
             
     except HTTPException:
         raise
@@ -315,81 +337,64 @@ async def generate_claude_response(session_id: int, user_message: str):
         session_id: Chat session ID
         user_message: User's message content
     """
+    def load_context(cursor):
+        # Get session and project context
+        cursor.execute(
+            """
+            SELECT cs.*, p.name, p.folder_path, p.description
+            FROM chat_sessions cs
+            JOIN projects p ON cs.project_id = p.id
+            WHERE cs.id = ?
+            """,
+            (session_id,)
+        )
+        session_data = dict(cursor.fetchone())
+        
+        # Get connected ideas for context
+        cursor.execute(
+            """
+            SELECT i.title, i.summary, i.description
+            FROM ideas i
+            JOIN idea_projects ip ON i.id = ip.idea_id
+            WHERE ip.project_id = ?
+            """,
+            (session_data['project_id'],)
+        )
+        return session_data, [dict(row) for row in cursor.fetchall()]
+    
     try:
-        with get_db_cursor() as cursor:
-            # Get session and project context
-            cursor.execute(
-                """
-                SELECT cs.*, p.name, p.folder_path, p.description
-                FROM chat_sessions cs
-                JOIN projects p ON cs.project_id = p.id
-                WHERE cs.id = ?
-                """,
-                (session_id,)
-            )
-            session_data = dict(cursor.fetchone())
-            
-            # Get connected ideas for context
-            cursor.execute(
-                """
-                SELECT i.title, i.summary, i.description
-                FROM ideas i
-                JOIN idea_projects ip ON i.id = ip.idea_id
-                WHERE ip.project_id = ?
-                """,
-                (session_data['project_id'],)
-            )
-            connected_ideas = [dict(row) for row in cursor.fetchall()]
-            
-            # Build context for Claude
-            context = build_claude_context(session_data, connected_ideas, user_message)
-            
-            # Call Claude Code CLI
-            claude_response = await call_claude_cli(context, session_data['folder_path'])
-            
-            # Store Claude's response
-            cursor.execute(
-                """
-                INSERT INTO chat_messages (session_id, role, content)
-                VALUES (?, ?, ?)
-                """,
-                (session_id, 'assistant', claude_response)
-            )
-            claude_message_id = cursor.lastrowid
-            
-            # Get created message
-            cursor.execute("SELECT * FROM chat_messages WHERE id = ?", (claude_message_id,))
-            message_data = dict(cursor.fetchone())
-            
-            # Broadcast Claude's response
-            await manager.send_message({
-                "type": "message",
-                "data": message_data
-            }, session_id)
+        session_data, connected_ideas = await read_transaction(load_context)
+        
+        # Build context for Claude
+        context = build_claude_context(session_data, connected_ideas, user_message)
+        
+        # Call Claude Code CLI
+        claude_response = await call_claude_cli(context, session_data['folder_path'])
+        
+        # Store Claude's response
+        message_data = await write_transaction(
+            lambda cursor: store_chat_message(cursor, session_id, 'assistant', claude_response)
+        )
+        
+        # Broadcast Claude's response
+        await manager.send_message({
+            "type": "message",
+            "data": message_data
+        }, session_id)
             
     except Exception as e:
         print(f"Failed to generate Claude response: {e}")
         
         # Send error message
         error_response = "I apologize, but I encountered an error processing your message. Please try again."
+        message_data = await write_transaction(
+            lambda cursor: store_chat_message(cursor, session_id, 'assistant', error_response)
+        )
         
-        with get_db_cursor() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO chat_messages (session_id, role, content)
-                VALUES (?, ?, ?)
-                """,
-                (session_id, 'assistant', error_response)
-            )
-            message_id = cursor.lastrowid
-            
-            cursor.execute("SELECT * FROM chat_messages WHERE id = ?", (message_id,))
-            message_data = dict(cursor.fetchone())
-            
-            await manager.send_message({
-                "type": "message",
-                "data": message_data
-            }, session_id)
+        await manager.send_message({
+            "type": "message",
+            "data": message_data
+        }, session_id)
 
 
 def build_claude_context(session_data: Dict, connected_ideas: List[Dict], user_message: str) -> str:
@@ -493,26 +498,27 @@ async def delete_chat_session(session_id: int):
     Returns:
         dict: Success message
     """
-    try:
-        with get_db_cursor() as cursor:
-            cursor.execute("SELECT title FROM chat_sessions WHERE id = ?", (session_id,))
-            session = cursor.fetchone()
-            
-            if not session:
-                raise HTTPException(status_code=404, detail="Chat session not found")
-                
-            session_title = session[0]
-            
-            # Delete session (CASCADE will handle messages)
-            cursor.execute("DELETE FROM chat_sessions WHERE id = ?", (session_id,))
-            
-            # Disconnect any active WebSocket connections
-            if session_id in manager.active_connections:
-                for connection in manager.active_connections[session_id][:]:
-                    await connection.close()
-                del manager.active_connections[session_id]
+    def remove_session(cursor) -> str:
+        cursor.execute("SELECT title FROM chat_sessions WHERE id = ?", (session_id,))
+        session = cursor.fetchone()
+        
+        if not session:
+            raise HTTPException(status_code=404, detail="Chat session not found")
             
-            return {"message": f"Chat session '{session_title}' deleted successfully"}
+        # Delete session (CASCADE will handle messages)
+        cursor.execute("DELETE FROM chat_sessions WHERE id = ?", (session_id,))
+        return session[0]
+    
+    try:
+        session_title = await write_transaction(remove_session)
+        
+        # Disconnect any active WebSocket connections
+        if session_id in manager.active_connections:
+            for connection in manager.active_connections[session_id][:]:
+                await connection.close()
+            del manager.active_connections[session_id]
+        
+        return {"message": f"Chat session '{session_title}' deleted successfully"}
             
     except HTTPException:
         raise
@@ -531,52 +537,54 @@ async def export_chat_session(session_id: int):
     Returns:
         StreamingResponse: Chat export file
     """
+    def load_export(cursor):
+        # Get session info
+        cursor.execute(
+            """
+            SELECT cs.title, cs.created_at, p.name as project_name
+            FROM chat_sessions cs
+            JOIN projects p ON cs.project_id = p.id
+            WHERE cs.id = ?
+            """,
+            (session_id,)
+        )
+        session_info = cursor.fetchone()
+        
+        if not session_info:
+            raise HTTPException(status_code=404, detail="Chat session not found")
+        
+        # Get all messages
+        cursor.execute(
+            """
+            SELECT role, content, timestamp
+            FROM chat_messages
+            WHERE session_id = ?
+            ORDER BY timestamp ASC
+            """,
+            (session_id,)
+        )
+        return session_info, cursor.fetchall()
+    
     try:
-        with get_db_cursor() as cursor:
-            # Get session info
-            cursor.execute(
-                """
-                SELECT cs.title, cs.created_at, p.name as project_name
-                FROM chat_sessions cs
-                JOIN projects p ON cs.project_id = p.id
-                WHERE cs.id = ?
-                """,
-                (session_id,)
-            )
-            session_info = cursor.fetchone()
-            
-            if not session_info:
-                raise HTTPException(status_code=404, detail="Chat session not found")
-            
-            # Get all messages
-            cursor.execute(
-                """
-                SELECT role, content, timestamp
-                FROM chat_messages
-                WHERE session_id = ?
-                ORDER BY timestamp ASC
-                """,
-                (session_id,)
-            )
-            messages = cursor.fetchall()
-            
-            # Generate export content
-            def generate_export():
-                yield f"Chat Session: {session_info[0]}\n"
-                yield f"Project: {session_info[2]}\n"
-                yield f"Created: {session_info[1]}\n"
-                yield f"Messages: {len(messages)}\n"
-                yield "\n" + "="*50 + "\n\n"
-                
-                for role, content, timestamp in messages:
-                    role_display = "You" if role == "user" else "Claude"
-                    yield f"[{timestamp}] {role_display}:\n{content}\n\n"
-            
-            return StreamingResponse(
-                generate_export(),
-                media_type="text/plain",
-                headers={"Content-Disposition": f"attachment; filename=chat_session_{session_id}.txt"}
-            )
+        session_info, messages = await read_transaction(load_export)
+        
+        # Generate export content
+        def generate_export():
+            yield f"Chat Session: {session_info[0]}\n"
+            yield f"Project: {session_info[2]}\n"
+            yield f"Created: {session_info[1]}\n"
+            yield f"Messages: {len(messages)}\n"
+            yield "\n" + "="*50 + "\n\n"
+            
+            for role, content, timestamp in messages:
+                role_display = "You" if role == "user" else "Claude"
+                yield f"[{timestamp}] {role_display}:\n{content}\n\n"
+        
+        return StreamingResponse(
+            generate_export(),
+            media_type="text/plain",
+            headers={"Content-Disposition": f"attachment; filename=chat_session_{session_id}.txt"}
+        )
             
     except HTTPException:
         raise
@@ -5,16 +5,23 @@ Handles filter-related endpoints including available tags,
 filter combinations, and filter validation.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Dict, Any, Optional
 import logging
 
-from ..models import TagSummary
-from ..database import get_available_tags, count_ideas_with_filters
+from ..models import TagSummary, Facet, FacetValue, FacetsResponse
+from ..database import get_available_tags, count_ideas_with_filters, get_facet_counts, PUBLIC_FILTER_KEYS
+from ..async_db import run_read
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Options offered even before any idea uses them
+DEFAULT_TAG_VALUES = {
+    'complexity': ['mvp', 'medium', 'complex'],
+    'target_market': ['b2b', 'b2c', 'enterprise', 'consumer'],
+}
+
 
 @router.get("/tags/", response_model=List[TagSummary])
 async def get_available_tags_endpoint():
@@ -25,7 +32,7 @@ async def get_available_tags_endpoint():
         List[TagSummary]: Available tags organized by category
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         
         tag_summaries = []
         for category, values in tags_by_category.items():
@@ -42,6 +49,63 @@ async def get_available_tags_endpoint():
         raise HTTPException(status_code=500, detail="Failed to retrieve available tags")
 
 
+@router.get("/facets/", response_model=FacetsResponse)
+async def get_filter_facets(
+    q: Optional[str] = Query(None, description="Search query"),
+    industry: Optional[List[str]] = Query(None, description="Industry filters"),
+    target_market: Optional[List[str]] = Query(None, description="Target market filters"),
+    complexity: Optional[List[str]] = Query(None, description="Complexity filters"),
+    technology: Optional[List[str]] = Query(None, description="Technology filters")
+):
+    """
+    Retrieve every filter category with per-value idea counts.
+    
+    Counts for a category reflect all other applied filters, so the
+    filter sidebar can be rendered from this single request. Default
+    complexity and target market values are included with count 0 until
+    ideas use them.
+    
+    Args:
+        q: Text search query
+        industry: List of industry filters
+        target_market: List of target market filters
+        complexity: List of complexity filters
+        technology: List of technology filters
+        
+    Returns:
+        FacetsResponse: Facets with conditional counts
+    """
+    try:
+        filters = {
+            'search': q,
+            'industry': industry,
+            'target_market': target_market,
+            'complexity': complexity,
+            'technology': technology
+        }
+        result = await run_read(get_facet_counts, filters)
+        
+        counts_by_category = {category: dict(values) for category, values in result['facets'].items()}
+        for category, defaults in DEFAULT_TAG_VALUES.items():
+            values = counts_by_category.setdefault(category, {})
+            for value in defaults:
+                values.setdefault(value, 0)
+        
+        facets = [
+            Facet(
+                category=category,
+                values=[FacetValue(value=value, count=count) for value, count in sorted(values.items())]
+            )
+            for category, values in sorted(counts_by_category.items())
+        ]
+        
+        return FacetsResponse(facets=facets, total_count=result['total_count'])
+        
+    except Exception as e:
+        logger.error(f"Failed to get filter facets: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve filter facets")
+
+
 @router.get("/tags/{category}", response_model=List[str])
 async def get_tags_by_category(category: str):
     """
@@ -57,7 +121,7 @@ async def get_tags_by_category(category: str):
         HTTPException: 404 if category not found
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         
         if category not in tags_by_category:
             raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
@@ -80,7 +144,7 @@ async def get_available_industries():
         List[str]: Available industry tags
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         return tags_by_category.get('industry', [])
         
     except Exception as e:
@@ -97,7 +161,7 @@ async def get_available_technologies():
         List[str]: Available technology tags
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         return tags_by_category.get('technology', [])
         
     except Exception as e:
@@ -114,19 +178,19 @@ async def get_complexity_levels():
         List[str]: Available complexity levels
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         complexity_levels = tags_by_category.get('complexity', [])
         
         # If no complexity levels in database, return defaults
         if not complexity_levels:
-            return ['mvp', 'medium', 'complex']
+            return DEFAULT_TAG_VALUES['complexity']
             
         return complexity_levels
         
     except Exception as e:
         logger.error(f"Failed to get complexity levels: {str(e)}")
         # Return defaults on error
-        return ['mvp', 'medium', 'complex']
+        return DEFAULT_TAG_VALUES['complexity']
 
 
 @router.get("/target-markets/", response_model=List[str])
@@ -138,19 +202,19 @@ async def get_target_markets():
         List[str]: Available target market categories
     """
     try:
-        tags_by_category = get_available_tags()
+        tags_by_category = await run_read(get_available_tags)
         target_markets = tags_by_category.get('target_market', [])
         
         # If no target markets in database, return defaults
         if not target_markets:
-            return ['b2b', 'b2c', 'enterprise', 'consumer']
+            return DEFAULT_TAG_VALUES['target_market']
             
         return target_markets
         
     except Exception as e:
         logger.error(f"Failed to get target markets: {str(e)}")
         # Return defaults on error
-        return ['b2b', 'b2c', 'enterprise', 'consumer']
+        return DEFAULT_TAG_VALUES['target_market']
 
 
 @router.post("/validate/")
@@ -165,13 +229,12 @@ async def validate_filter_combination(filters: Dict[str, Any]):
         Dict: Validation result with expected result count
     """
     try:
-        # Remove pagination parameters for count
-        clean_filters = filters.copy()
-        clean_filters.pop('limit', None)
-        clean_filters.pop('offset', None)
+        # Only count by public filters; pagination and internal keys
+        # (idea_ids, cursor) are dropped
+        clean_filters = {key: filters[key] for key in PUBLIC_FILTER_KEYS if key in filters}
         
         # Get count of matching ideas
-        count = count_ideas_with_filters(clean_filters)
+        count = await run_read(count_ideas_with_filters, clean_filters)
         
         return {
             'valid': count > 0,
@@ -7,17 +7,24 @@ filtering, and detailed view data.
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
+import asyncio
 import logging
 import subprocess
 import sys
 import os
 from pathlib import Path
 
-from ..models import IdeaResponse, IdeaCardResponse, FilteredIdeasResponse, SystemStatus
+from ..models import (
+    IdeaResponse, IdeaCardResponse, IdeaBatchRequest, IdeaBulkRequest, IdeaBulkResponse,
+    FilteredIdeasResponse, SystemStatus
+)
 from ..database import (
-    get_ideas_with_filters, get_idea_by_id, get_random_idea, get_system_stats,
-    count_ideas_with_filters
+    get_idea_cards_with_filters, get_idea_by_id, get_ideas_by_ids, get_random_idea, get_random_ideas,
+    get_system_stats, count_ideas_with_filters, encode_idea_cursor, bulk_insert_ideas,
+    truncate_card_summary, invalidate_caches
 )
+from ..async_db import run_read, run_write
+from ..responses import trusted_json_response
 from datetime import datetime, timedelta
 
 router = APIRouter()
@@ -27,43 +34,64 @@ logger = logging.getLogger(__name__)
 @router.get("/", response_model=List[IdeaCardResponse])
 async def get_ideas(
     limit: int = Query(50, ge=1, le=100, description="Number of ideas to return"),
-    offset: int = Query(0, ge=0, description="Number of ideas to skip")
+    offset: int = Query(0, ge=0, description="Number of ideas to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from X-Next-Cursor (replaces offset)")
 ):
     """
     Retrieve paginated list of ideas for card display.
     
+    When more ideas exist, the X-Next-Cursor response header carries a
+    cursor for fetching the next page.
+    
     Args:
         limit: Maximum number of ideas to return
         offset: Number of ideas to skip for pagination
+        cursor: Keyset pagination cursor from a previous page
         
     Returns:
         List[IdeaCardResponse]: List of idea cards
     """
     try:
-        filters = {'limit': limit, 'offset': offset}
-        ideas = get_ideas_with_filters(filters)
-        
-        # Convert to IdeaCardResponse format
-        card_responses = []
-        for idea in ideas:
-            # Truncate summary for card display
-            summary = idea['summary'][:150] + '...' if len(idea['summary']) > 150 else idea['summary']
-            
-            card_responses.append(IdeaCardResponse(
-                id=idea['id'],
-                title=idea['title'],
-                summary=summary,
-                tags=idea.get('tags', []),
-                generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date']
-            ))
-            
-        return card_responses
+        # Fetch one extra idea to know whether another page exists
+        filters = {'limit': limit + 1, 'offset': offset, 'cursor': cursor}
+        ideas = await run_read(get_idea_cards_with_filters, filters)
+        
+        headers = {}
+        if len(ideas) > limit:
+            ideas = ideas[:limit]
+            headers['X-Next-Cursor'] = encode_idea_cursor(ideas[-1])
+        
+        return trusted_json_response([build_idea_card(idea) for idea in ideas], headers=headers)
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to retrieve ideas: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve ideas")
 
 
+def build_idea_response(idea: dict) -> IdeaResponse:
+    """
+    Convert a hydrated idea dictionary into a detail response.
+    
+    Args:
+        idea: Idea dictionary with tags and market_data
+        
+    Returns:
+        IdeaResponse: Complete idea details
+    """
+    return IdeaResponse(
+        id=idea['id'],
+        title=idea['title'],
+        summary=idea['summary'],
+        description=idea['description'],
+        supporting_logic=idea['supporting_logic'],
+        generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date'],
+        tags=idea.get('tags', []),
+        market_data=idea['market_data']
+    )
+
+
 @router.get("/{idea_id}", response_model=IdeaResponse)
 async def get_idea_detail(idea_id: int):
     """
@@ -79,30 +107,12 @@ async def get_idea_detail(idea_id: int):
         HTTPException: 404 if idea not found
     """
     try:
-        idea = get_idea_by_id(idea_id)
+        idea = await run_read(get_idea_by_id, idea_id)
         
         if not idea:
             raise HTTPException(status_code=404, detail="Idea not found")
             
-        # Convert market_data competitors from JSON string to list if needed
-        market_data = idea.get('market_data')
-        if market_data and isinstance(market_data.get('competitors'), str):
-            import json
-            try:
-                market_data['competitors'] = json.loads(market_data['competitors'])
-            except json.JSONDecodeError:
-                market_data['competitors'] = []
-                
-        return IdeaResponse(
-            id=idea['id'],
-            title=idea['title'],
-            summary=idea['summary'],
-            description=idea['description'],
-            supporting_logic=idea['supporting_logic'],
-            generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date'],
-            tags=idea.get('tags', []),
-            market_data=market_data
-        )
+        return trusted_json_response(build_idea_response(idea))
         
     except HTTPException:
         raise
@@ -111,6 +121,49 @@ async def get_idea_detail(idea_id: int):
         raise HTTPException(status_code=500, detail="Failed to retrieve idea details")
 
 
+@router.post("/batch", response_model=List[IdeaResponse])
+async def get_ideas_batch(request: IdeaBatchRequest):
+    """
+    Retrieve complete details for several ideas in one request.
+    
+    Args:
+        request: Idea IDs to fetch (at most 100)
+        
+    Returns:
+        List[IdeaResponse]: Ideas in request order; unknown IDs are omitted
+    """
+    try:
+        ideas = await run_read(get_ideas_by_ids, request.ids)
+        return trusted_json_response([build_idea_response(idea) for idea in ideas])
+        
+    except Exception as e:
+        logger.error(f"Failed to retrieve idea batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve ideas")
+
+
+@router.post("/bulk", response_model=IdeaBulkResponse)
+async def bulk_create_ideas(request: IdeaBulkRequest):
+    """
+    Import many ideas at once.
+    
+    All ideas are stored in a single transaction: if any row fails, none
+    are kept.
+    
+    Args:
+        request: Ideas to insert (at most 10000)
+        
+    Returns:
+        IdeaBulkResponse: Number and IDs of inserted ideas
+    """
+    try:
+        idea_ids = await run_write(bulk_insert_ideas, [idea.model_dump() for idea in request.ideas])
+        return IdeaBulkResponse(inserted_count=len(idea_ids), ids=idea_ids)
+        
+    except Exception as e:
+        logger.error(f"Failed to bulk insert ideas: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to insert ideas")
+
+
 @router.get("/search/", response_model=FilteredIdeasResponse)
 async def search_ideas(
     q: Optional[str] = Query(None, description="Search query"),
@@ -118,29 +171,40 @@ async def search_ideas(
     target_market: Optional[List[str]] = Query(None, description="Target market filters"),
     complexity: Optional[List[str]] = Query(None, description="Complexity filters"),
     technology: Optional[List[str]] = Query(None, description="Technology filters"),
+    sort: str = Query("date", pattern="^(date|relevance)$", description="Order by date or search relevance"),
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Results offset")
+    offset: int = Query(0, ge=0, description="Results offset"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor (replaces offset)")
 ):
     """
     Search and filter ideas based on multiple criteria.
     
+    The text query supports "quoted phrases"; other words match as prefixes.
+    
     Args:
         q: Text search query
         industry: List of industry filters
         target_market: List of target market filters  
         complexity: List of complexity filters
         technology: List of technology filters
+        sort: 'date' (newest first) or 'relevance' (bm25 rank, requires q)
         limit: Maximum number of results
         offset: Results offset for pagination
+        cursor: Keyset pagination cursor (date order only)
         
     Returns:
         FilteredIdeasResponse: Filtered ideas with metadata
     """
+    if cursor and sort == 'relevance':
+        raise HTTPException(status_code=400, detail="Cursor pagination is only supported for sort=date")
+        
     try:
         # Build filters dictionary
         filters = {
-            'limit': limit,
-            'offset': offset
+            'limit': limit + 1,  # One extra idea tells us whether another page exists
+            'offset': offset,
+            'sort': sort,
+            'cursor': cursor
         }
         
         if q:
@@ -155,39 +219,66 @@ async def search_ideas(
             filters['technology'] = technology
             
         # Get filtered ideas
-        ideas = get_ideas_with_filters(filters)
+        ideas = await run_read(get_idea_cards_with_filters, filters)
+        has_more = len(ideas) > limit
+        ideas = ideas[:limit]
         
         # Get total count for pagination
-        total_count = count_ideas_with_filters(filters)
+        total_count = await run_read(count_ideas_with_filters, filters)
         
-        # Convert to card responses
-        card_responses = []
-        for idea in ideas:
-            summary = idea['summary'][:150] + '...' if len(idea['summary']) > 150 else idea['summary']
-            
-            card_responses.append(IdeaCardResponse(
-                id=idea['id'],
-                title=idea['title'],
-                summary=summary,
-                tags=idea.get('tags', []),
-                generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date']
-            ))
-            
-        return FilteredIdeasResponse(
-            ideas=card_responses,
+        return trusted_json_response(FilteredIdeasResponse(
+            ideas=[build_idea_card(idea) for idea in ideas],
             total_count=total_count,
-            has_more=(offset + limit) < total_count
-        )
+            has_more=has_more,
+            next_cursor=encode_idea_cursor(ideas[-1]) if has_more and sort == 'date' else None
+        ))
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to search ideas: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to search ideas")
 
 
+def build_idea_card(idea: dict) -> IdeaCardResponse:
+    """
+    Convert an idea row into a card response with a truncated summary.
+    
+    Args:
+        idea: Idea dictionary with tags, and either the stored card_summary
+            (card queries) or the full summary
+        
+    Returns:
+        IdeaCardResponse: Idea card
+    """
+    summary = idea.get('card_summary')
+    if summary is None:
+        summary = truncate_card_summary(idea['summary'])
+    
+    return IdeaCardResponse(
+        id=idea['id'],
+        title=idea['title'],
+        summary=summary,
+        tags=idea.get('tags', []),
+        generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date']
+    )
+
+
 @router.get("/random/", response_model=IdeaCardResponse)
-async def get_random_idea_endpoint():
+async def get_random_idea_endpoint(
+    industry: Optional[List[str]] = Query(None, description="Industry filters"),
+    target_market: Optional[List[str]] = Query(None, description="Target market filters"),
+    complexity: Optional[List[str]] = Query(None, description="Complexity filters"),
+    technology: Optional[List[str]] = Query(None, description="Technology filters")
+):
     """
-    Retrieve a random idea for inspiration.
+    Retrieve a random idea for inspiration, optionally within tag facets.
+    
+    Args:
+        industry: List of industry filters
+        target_market: List of target market filters
+        complexity: List of complexity filters
+        technology: List of technology filters
     
     Returns:
         IdeaCardResponse: Random idea card
@@ -196,20 +287,18 @@ async def get_random_idea_endpoint():
         HTTPException: 404 if no ideas available
     """
     try:
-        idea = get_random_idea()
+        filters = {
+            'industry': industry,
+            'target_market': target_market,
+            'complexity': complexity,
+            'technology': technology
+        }
+        idea = await run_read(get_random_idea, filters, cards=True)
         
         if not idea:
             raise HTTPException(status_code=404, detail="No ideas available")
             
-        summary = idea['summary'][:150] + '...' if len(idea['summary']) > 150 else idea['summary']
-        
-        return IdeaCardResponse(
-            id=idea['id'],
-            title=idea['title'],
-            summary=summary,
-            tags=idea.get('tags', []),
-            generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date']
-        )
+        return trusted_json_response(build_idea_card(idea))
         
     except HTTPException:
         raise
@@ -218,6 +307,42 @@ async def get_random_idea_endpoint():
         raise HTTPException(status_code=500, detail="Failed to get random idea")
 
 
+@router.get("/random/sample/", response_model=List[IdeaCardResponse])
+async def get_random_ideas_sample(
+    n: int = Query(5, ge=1, le=20, description="Number of distinct ideas to return"),
+    industry: Optional[List[str]] = Query(None, description="Industry filters"),
+    target_market: Optional[List[str]] = Query(None, description="Target market filters"),
+    complexity: Optional[List[str]] = Query(None, description="Complexity filters"),
+    technology: Optional[List[str]] = Query(None, description="Technology filters")
+):
+    """
+    Retrieve several distinct random ideas ("inspire me" batches).
+    
+    Args:
+        n: Number of ideas to sample
+        industry: List of industry filters
+        target_market: List of target market filters
+        complexity: List of complexity filters
+        technology: List of technology filters
+        
+    Returns:
+        List[IdeaCardResponse]: Up to n random idea cards
+    """
+    try:
+        filters = {
+            'industry': industry,
+            'target_market': target_market,
+            'complexity': complexity,
+            'technology': technology
+        }
+        ideas = await run_read(get_random_ideas, n, filters, cards=True)
+        return trusted_json_response([build_idea_card(idea) for idea in ideas])
+        
+    except Exception as e:
+        logger.error(f"Failed to sample random ideas: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to sample random ideas")
+
+
 @router.get("/recent/", response_model=List[IdeaCardResponse])
 async def get_recent_ideas(days: int = Query(7, ge=1, le=30, description="Days to look back")):
     """
@@ -238,22 +363,9 @@ async def get_recent_ideas(days: int = Query(7, ge=1, le=30, description="Days t
             'limit': 100  # Get more recent ideas
         }
         
-        ideas = get_ideas_with_filters(filters)
+        ideas = await run_read(get_idea_cards_with_filters, filters)
         
-        # Convert to card responses
-        card_responses = []
-        for idea in ideas:
-            summary = idea['summary'][:150] + '...' if len(idea['summary']) > 150 else idea['summary']
-            
-            card_responses.append(IdeaCardResponse(
-                id=idea['id'],
-                title=idea['title'],
-                summary=summary,
-                tags=idea.get('tags', []),
-                generated_date=datetime.fromisoformat(idea['generated_date'].replace('Z', '+00:00')) if isinstance(idea['generated_date'], str) else idea['generated_date']
-            ))
-            
-        return card_responses
+        return trusted_json_response([build_idea_card(idea) for idea in ideas])
         
     except Exception as e:
         logger.error(f"Failed to get recent ideas: {str(e)}")
@@ -269,7 +381,7 @@ async def get_system_status():
         SystemStatus: Current system status and stats
     """
     try:
-        stats = get_system_stats()
+        stats = await run_read(get_system_stats)
         
         # Convert last_generation timestamp if it exists
         last_generation = None
@@ -312,12 +424,13 @@ async def generate_new_idea():
             raise HTTPException(status_code=500, detail="Generation script not found")
         
         # Get the current highest idea ID before generation
-        current_ideas = get_ideas_with_filters({'limit': 1, 'offset': 0})
+        current_ideas = await run_read(get_idea_cards_with_filters, {'limit': 1, 'offset': 0})
         max_id_before = current_ideas[0]['id'] if current_ideas else 0
         
         # Run the generation script
         logger.info("Starting idea generation...")
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [sys.executable, str(script_path)],
             cwd=project_root,
             capture_output=True,
@@ -331,6 +444,10 @@ async def generate_new_idea():
         
         logger.info("Idea generated successfully")
         
+        # The script wrote through its own connection; drop cached pages and
+        # ETags now instead of waiting for the data version to be re-read
+        invalidate_caches()
+        
         # Try to extract the idea ID from script output
         generated_idea_id = None
         for line in result.stdout.splitlines():
@@ -344,11 +461,11 @@ async def generate_new_idea():
         
         if generated_idea_id:
             # Get the specific idea that was generated
-            idea_details = get_idea_by_id(generated_idea_id)
+            idea_details = await run_read(get_idea_by_id, generated_idea_id)
         else:
             # Fallback: find the newest idea by ID comparison
             logger.warning("Could not capture idea ID, using fallback method")
-            new_ideas = get_ideas_with_filters({'limit': 10, 'offset': 0})  # Get recent ideas
+            new_ideas = await run_read(get_idea_cards_with_filters, {'limit': 10, 'offset': 0})  # Get recent ideas
             newest_idea = None
             
             for idea in new_ideas:
@@ -363,7 +480,7 @@ async def generate_new_idea():
             if not newest_idea:
                 raise HTTPException(status_code=500, detail="No ideas found after generation")
                 
-            idea_details = get_idea_by_id(newest_idea['id'])
+            idea_details = await run_read(get_idea_by_id, newest_idea['id'])
         
         if not idea_details:
             raise HTTPException(status_code=500, detail="Failed to retrieve generated idea details")
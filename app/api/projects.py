@@ -15,9 +15,8 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
 from pydantic import ValidationError
 
-from ..database import (
-    get_db_cursor, get_idea_by_id, validate_database_schema
-)
+from ..database import validate_database_schema, attach_idea_tags, get_existing_idea_ids
+from ..async_db import read_transaction, write_transaction
 from ..models import (
     ProjectCreate, ProjectResponse, ProjectStatus,
     IdeaProjectConnection, ChatSessionCreate, ChatSessionResponse,
@@ -71,52 +70,50 @@ async def create_project(project: ProjectCreate, background_tasks: BackgroundTas
             raise
         raise HTTPException(status_code=400, detail=f"Invalid folder path: {str(e)}")
     
-    try:
-        with get_db_cursor() as cursor:
-            # Insert project
-            cursor.execute(
-                """
-                INSERT INTO projects (name, description, folder_path, status, repository_url)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    project.name,
-                    project.description,
-                    str(folder_path.absolute()),
-                    project.status.value,
-                    project.repository_url
-                )
-            )
-            project_id = cursor.lastrowid
-            
-            # Connect to ideas if provided
-            idea_count = 0
-            for idea_id in project.idea_ids:
-                # Verify idea exists
-                idea = get_idea_by_id(idea_id)
-                if idea:
-                    cursor.execute(
-                        """
-                        INSERT INTO idea_projects (idea_id, project_id)
-                        VALUES (?, ?)
-                        """,
-                        (idea_id, project_id)
-                    )
-                    idea_count += 1
-            
-            # Get created project
-            cursor.execute(
-                "SELECT * FROM projects WHERE id = ?",
-                (project_id,)
+    def insert_project(cursor) -> dict:
+        cursor.execute(
+            """
+            INSERT INTO projects (name, description, folder_path, status, repository_url)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                project.name,
+                project.description,
+                str(folder_path.absolute()),
+                project.status.value,
+                project.repository_url
             )
-            project_data = dict(cursor.fetchone())
-            project_data['idea_count'] = idea_count
-            project_data['last_analysis'] = None
-            
-            # Schedule initial project analysis
-            background_tasks.add_task(analyze_project_async, project_id)
-            
-            return ProjectResponse(**project_data)
+        )
+        project_id = cursor.lastrowid
+        
+        # Connect to ideas if provided
+        existing_ids = get_existing_idea_ids(cursor, project.idea_ids)
+        idea_ids = [idea_id for idea_id in dict.fromkeys(project.idea_ids) if idea_id in existing_ids]
+        cursor.executemany(
+            """
+            INSERT INTO idea_projects (idea_id, project_id)
+            VALUES (?, ?)
+            """,
+            [(idea_id, project_id) for idea_id in idea_ids]
+        )
+        
+        # Get created project
+        cursor.execute(
+            "SELECT * FROM projects WHERE id = ?",
+            (project_id,)
+        )
+        project_data = dict(cursor.fetchone())
+        project_data['idea_count'] = len(idea_ids)
+        project_data['last_analysis'] = None
+        return project_data
+    
+    try:
+        project_data = await write_transaction(insert_project)
+        
+        # Schedule initial project analysis
+        background_tasks.add_task(analyze_project_async, project_data['id'])
+        
+        return ProjectResponse(**project_data)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
@@ -134,42 +131,44 @@ async def list_projects(status: Optional[ProjectStatus] = None, limit: int = 50)
     Returns:
         List[ProjectResponse]: List of projects
     """
-    try:
-        with get_db_cursor() as cursor:
-            query = "SELECT * FROM projects"
-            params = []
+    def load_projects(cursor) -> List[ProjectResponse]:
+        query = "SELECT * FROM projects"
+        params = []
+        
+        if status:
+            query += " WHERE status = ?"
+            params.append(status.value)
             
-            if status:
-                query += " WHERE status = ?"
-                params.append(status.value)
-                
-            query += " ORDER BY updated_at DESC LIMIT ?"
-            params.append(limit)
+        query += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(limit)
+        
+        cursor.execute(query, params)
+        projects = []
+        
+        for row in cursor.fetchall():
+            project_data = dict(row)
             
-            cursor.execute(query, params)
-            projects = []
+            # Get idea count
+            cursor.execute(
+                "SELECT COUNT(*) FROM idea_projects WHERE project_id = ?",
+                (project_data['id'],)
+            )
+            project_data['idea_count'] = cursor.fetchone()[0]
             
-            for row in cursor.fetchall():
-                project_data = dict(row)
-                
-                # Get idea count
-                cursor.execute(
-                    "SELECT COUNT(*) FROM idea_projects WHERE project_id = ?",
-                    (project_data['id'],)
-                )
-                project_data['idea_count'] = cursor.fetchone()[0]
-                
-                # Get last analysis date
-                cursor.execute(
-                    "SELECT MAX(analysis_date) FROM project_analyses WHERE project_id = ?",
-                    (project_data['id'],)
-                )
-                last_analysis = cursor.fetchone()[0]
-                project_data['last_analysis'] = last_analysis
-                
-                projects.append(ProjectResponse(**project_data))
-                
-            return projects
+            # Get last analysis date
+            cursor.execute(
+                "SELECT MAX(analysis_date) FROM project_analyses WHERE project_id = ?",
+                (project_data['id'],)
+            )
+            last_analysis = cursor.fetchone()[0]
+            project_data['last_analysis'] = last_analysis
+            
+            projects.append(ProjectResponse(**project_data))
+            
+        return projects
+    
+    try:
+        return await read_transaction(load_projects)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list projects: {str(e)}")
@@ -189,32 +188,34 @@ async def get_project(project_id: int):
     Raises:
         HTTPException: If project not found
     """
-    try:
-        with get_db_cursor() as cursor:
-            cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
-            project_row = cursor.fetchone()
-            
-            if not project_row:
-                raise HTTPException(status_code=404, detail="Project not found")
-                
-            project_data = dict(project_row)
-            
-            # Get idea count
-            cursor.execute(
-                "SELECT COUNT(*) FROM idea_projects WHERE project_id = ?",
-                (project_id,)
-            )
-            project_data['idea_count'] = cursor.fetchone()[0]
-            
-            # Get last analysis date
-            cursor.execute(
-                "SELECT MAX(analysis_date) FROM project_analyses WHERE project_id = ?",
-                (project_id,)
-            )
-            last_analysis = cursor.fetchone()[0]
-            project_data['last_analysis'] = last_analysis
+    def load_project(cursor) -> ProjectResponse:
+        cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
+        project_row = cursor.fetchone()
+        
+        if not project_row:
+            raise HTTPException(status_code=404, detail="Project not found")
             
-            return ProjectResponse(**project_data)
+        project_data = dict(project_row)
+        
+        # Get idea count
+        cursor.execute(
+            "SELECT COUNT(*) FROM idea_projects WHERE project_id = ?",
+            (project_id,)
+        )
+        project_data['idea_count'] = cursor.fetchone()[0]
+        
+        # Get last analysis date
+        cursor.execute(
+            "SELECT MAX(analysis_date) FROM project_analyses WHERE project_id = ?",
+            (project_id,)
+        )
+        last_analysis = cursor.fetchone()[0]
+        project_data['last_analysis'] = last_analysis
+        
+        return ProjectResponse(**project_data)
+    
+    try:
+        return await read_transaction(load_project)
             
     except HTTPException:
         raise
@@ -237,46 +238,47 @@ async def update_project(project_id: int, project_update: ProjectCreate):
     Raises:
         HTTPException: If project not found or update fails
     """
-    try:
-        with get_db_cursor() as cursor:
-            # Check if project exists
-            cursor.execute("SELECT id FROM projects WHERE id = ?", (project_id,))
-            if not cursor.fetchone():
-                raise HTTPException(status_code=404, detail="Project not found")
-                
-            # Validate folder path
-            folder_path = Path(project_update.folder_path)
-            if not folder_path.exists() or not folder_path.is_dir():
-                raise HTTPException(status_code=400, detail="Invalid folder path")
-            
-            # Update project
-            cursor.execute(
-                """
-                UPDATE projects 
-                SET name = ?, description = ?, folder_path = ?, status = ?, 
-                    repository_url = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (
-                    project_update.name,
-                    project_update.description,
-                    str(folder_path.absolute()),
-                    project_update.status.value,
-                    project_update.repository_url,
-                    project_id
-                )
+    # Validate folder path before taking a place in the write queue
+    folder_path = Path(project_update.folder_path)
+    if not folder_path.exists() or not folder_path.is_dir():
+        raise HTTPException(status_code=400, detail="Invalid folder path")
+    
+    def save_project(cursor) -> None:
+        # Check if project exists
+        cursor.execute("SELECT id FROM projects WHERE id = ?", (project_id,))
+        if not cursor.fetchone():
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        # Update project
+        cursor.execute(
+            """
+            UPDATE projects 
+            SET name = ?, description = ?, folder_path = ?, status = ?, 
+                repository_url = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            """,
+            (
+                project_update.name,
+                project_update.description,
+                str(folder_path.absolute()),
+                project_update.status.value,
+                project_update.repository_url,
+                project_id
             )
-            
-            # Update idea connections
-            cursor.execute("DELETE FROM idea_projects WHERE project_id = ?", (project_id,))
-            for idea_id in project_update.idea_ids:
-                if get_idea_by_id(idea_id):  # Verify idea exists
-                    cursor.execute(
-                        "INSERT INTO idea_projects (idea_id, project_id) VALUES (?, ?)",
-                        (idea_id, project_id)
-                    )
-            
-            return await get_project(project_id)
+        )
+        
+        # Update idea connections
+        cursor.execute("DELETE FROM idea_projects WHERE project_id = ?", (project_id,))
+        existing_ids = get_existing_idea_ids(cursor, project_update.idea_ids)
+        cursor.executemany(
+            "INSERT INTO idea_projects (idea_id, project_id) VALUES (?, ?)",
+            [(idea_id, project_id) for idea_id in dict.fromkeys(project_update.idea_ids)
+             if idea_id in existing_ids]
+        )
+    
+    try:
+        await write_transaction(save_project)
+        return await get_project(project_id)
             
     except HTTPException:
         raise
@@ -298,20 +300,20 @@ async def delete_project(project_id: int):
     Raises:
         HTTPException: If project not found
     """
-    try:
-        with get_db_cursor() as cursor:
-            cursor.execute("SELECT name FROM projects WHERE id = ?", (project_id,))
-            project = cursor.fetchone()
-            
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
-                
-            project_name = project[0]
-            
-            # Delete project (CASCADE will handle related data)
-            cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+    def remove_project(cursor) -> str:
+        cursor.execute("SELECT name FROM projects WHERE id = ?", (project_id,))
+        project = cursor.fetchone()
+        
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
             
-            return {"message": f"Project '{project_name}' deleted successfully"}
+        # Delete project (CASCADE will handle related data)
+        cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+        return project[0]
+    
+    try:
+        project_name = await write_transaction(remove_project)
+        return {"message": f"Project '{project_name}' deleted successfully"}
             
     except HTTPException:
         raise
@@ -330,42 +332,31 @@ async def get_project_ideas(project_id: int):
     Returns:
         dict: Project ideas and connection info
     """
+    def load_connected_ideas(cursor) -> List[Dict]:
+        cursor.execute(
+            """
+            SELECT i.*, ip.connection_date, ip.relevance_notes
+            FROM ideas i
+            JOIN idea_projects ip ON i.id = ip.idea_id
+            WHERE ip.project_id = ?
+            ORDER BY ip.connection_date DESC
+            """,
+            (project_id,)
+        )
+        
+        connected_ideas = [dict(row) for row in cursor.fetchall()]
+        
+        # Get tags for all connected ideas in one query
+        return attach_idea_tags(cursor, connected_ideas)
+    
     try:
-        with get_db_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT i.*, ip.connection_date, ip.relevance_notes
-                FROM ideas i
-                JOIN idea_projects ip ON i.id = ip.idea_id
-                WHERE ip.project_id = ?
-                ORDER BY ip.connection_date DESC
-                """,
-                (project_id,)
-            )
+        connected_ideas = await read_transaction(load_connected_ideas)
             
-            connected_ideas = []
-            for row in cursor.fetchall():
-                idea_data = dict(row)
-                
-                # Get idea tags
-                cursor.execute(
-                    """
-                    SELECT t.category, t.value 
-                    FROM tags t
-                    JOIN idea_tags it ON t.id = it.tag_id
-                    WHERE it.idea_id = ?
-                    """,
-                    (idea_data['id'],)
-                )
-                idea_data['tags'] = [{'category': r[0], 'value': r[1]} for r in cursor.fetchall()]
-                
-                connected_ideas.append(idea_data)
-                
-            return {
-                "project_id": project_id,
-                "connected_ideas": connected_ideas,
-                "total_count": len(connected_ideas)
-            }
+        return {
+            "project_id": project_id,
+            "connected_ideas": connected_ideas,
+            "total_count": len(connected_ideas)
+        }
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get project ideas: {str(e)}")
@@ -388,34 +379,35 @@ async def connect_idea_to_project(
     Returns:
         dict: Success message
     """
+    def connect(cursor) -> None:
+        # Verify both exist
+        cursor.execute("SELECT id FROM projects WHERE id = ?", (project_id,))
+        if not cursor.fetchone():
+            raise HTTPException(status_code=404, detail="Project not found")
+            
+        if not get_existing_idea_ids(cursor, [idea_id]):
+            raise HTTPException(status_code=404, detail="Idea not found")
+        
+        # Check if already connected
+        cursor.execute(
+            "SELECT 1 FROM idea_projects WHERE idea_id = ? AND project_id = ?",
+            (idea_id, project_id)
+        )
+        if cursor.fetchone():
+            raise HTTPException(status_code=400, detail="Idea already connected to project")
+        
+        # Create connection
+        cursor.execute(
+            """
+            INSERT INTO idea_projects (idea_id, project_id, relevance_notes)
+            VALUES (?, ?, ?)
+            """,
+            (idea_id, project_id, relevance_notes)
+        )
+    
     try:
-        with get_db_cursor() as cursor:
-            # Verify both exist
-            cursor.execute("SELECT id FROM projects WHERE id = ?", (project_id,))
-            if not cursor.fetchone():
-                raise HTTPException(status_code=404, detail="Project not found")
-                
-            if not get_idea_by_id(idea_id):
-                raise HTTPException(status_code=404, detail="Idea not found")
-            
-            # Check if already connected
-            cursor.execute(
-                "SELECT 1 FROM idea_projects WHERE idea_id = ? AND project_id = ?",
-                (idea_id, project_id)
-            )
-            if cursor.fetchone():
-                raise HTTPException(status_code=400, detail="Idea already connected to project")
-            
-            # Create connection
-            cursor.execute(
-                """
-                INSERT INTO idea_projects (idea_id, project_id, relevance_notes)
-                VALUES (?, ?, ?)
-                """,
-                (idea_id, project_id, relevance_notes)
-            )
-            
-            return {"message": "Idea connected to project successfully"}
+        await write_transaction(connect)
+        return {"message": "Idea connected to project successfully"}
             
     except HTTPException:
         raise
@@ -435,14 +427,14 @@ async def analyze_project(project_id: int, background_tasks: BackgroundTasks):
     Returns:
         ProjectAnalysis: Analysis results
     """
+    def load_project_row(cursor):
+        cursor.execute("SELECT folder_path FROM projects WHERE id = ?", (project_id,))
+        return cursor.fetchone()
+    
     try:
         # Verify project exists
-        with get_db_cursor() as cursor:
-            cursor.execute("SELECT folder_path FROM projects WHERE id = ?", (project_id,))
-            project = cursor.fetchone()
-            
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        if not await read_transaction(load_project_row):
+            raise HTTPException(status_code=404, detail="Project not found")
         
         # Run analysis in background
         background_tasks.add_task(analyze_project_async, project_id)
@@ -462,45 +454,50 @@ async def analyze_project_async(project_id: int):
     Args:
         project_id: Project to analyze
     """
-    try:
-        with get_db_cursor() as cursor:
-            # Get project and connected ideas
-            cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
-            project = dict(cursor.fetchone())
-            
-            cursor.execute(
-                """
-                SELECT i.* FROM ideas i
-                JOIN idea_projects ip ON i.id = ip.idea_id
-                WHERE ip.project_id = ?
-                """,
-                (project_id,)
-            )
-            connected_ideas = [dict(row) for row in cursor.fetchall()]
-            
-            # Analyze project directory
-            project_path = Path(project['folder_path'])
-            analysis_results = await analyze_project_directory(project_path, connected_ideas)
-            
-            # Store analysis results
-            cursor.execute(
-                """
-                INSERT INTO project_analyses 
-                (project_id, idea_alignment_score, implemented_features, missing_features,
-                 divergent_features, technical_debt_score, completion_estimate, recommendations)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    project_id,
-                    analysis_results['idea_alignment_score'],
-                    json.dumps(analysis_results['implemented_features']),
-                    json.dumps(analysis_results['missing_features']),
-                    json.dumps(analysis_results['divergent_features']),
-                    analysis_results['technical_debt_score'],
-                    analysis_results['completion_estimate'],
-                    json.dumps(analysis_results['recommendations'])
-                )
+    def load_project_and_ideas(cursor):
+        # Get project and connected ideas
+        cursor.execute("SELECT * FROM projects WHERE id = ?", (project_id,))
+        project = dict(cursor.fetchone())
+        
+        cursor.execute(
+            """
+            SELECT i.* FROM ideas i
+            JOIN idea_projects ip ON i.id = ip.idea_id
+            WHERE ip.project_id = ?
+            """,
+            (project_id,)
+        )
+        return project, [dict(row) for row in cursor.fetchall()]
+    
+    def store_analysis(cursor, analysis_results: Dict) -> None:
+        cursor.execute(
+            """
+            INSERT INTO project_analyses 
+            (project_id, idea_alignment_score, implemented_features, missing_features,
+             divergent_features, technical_debt_score, completion_estimate, recommendations)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                project_id,
+                analysis_results['idea_alignment_score'],
+                json.dumps(analysis_results['implemented_features']),
+                json.dumps(analysis_results['missing_features']),
+                json.dumps(analysis_results['divergent_features']),
+                analysis_results['technical_debt_score'],
+                analysis_results['completion_estimate'],
+                json.dumps(analysis_results['recommendations'])
             )
+        )
+    
+    try:
+        project, connected_ideas = await read_transaction(load_project_and_ideas)
+        
+        # Analyze project directory without holding a database connection
+        project_path = Path(project['folder_path'])
+        analysis_results = await analyze_project_directory(project_path, connected_ideas)
+        
+        # Store analysis results
+        await write_transaction(lambda cursor: store_analysis(cursor, analysis_results))
             
     except Exception as e:
         print(f"Project analysis failed: {e}")
@@ -577,33 +574,36 @@ async def get_project_analysis(project_id: int, limit: int = 5):
     Returns:
         dict: Analysis history
     """
+    def load_analyses(cursor) -> List[Dict]:
+        cursor.execute(
+            """
+            SELECT * FROM project_analyses 
+            WHERE project_id = ?
+            ORDER BY analysis_date DESC
+            LIMIT ?
+            """,
+            (project_id, limit)
+        )
+        
+        analyses = []
+        for row in cursor.fetchall():
+            analysis = dict(row)
+            # Parse JSON fields
+            analysis['implemented_features'] = json.loads(analysis['implemented_features'] or '[]')
+            analysis['missing_features'] = json.loads(analysis['missing_features'] or '[]')
+            analysis['divergent_features'] = json.loads(analysis['divergent_features'] or '[]')
+            analysis['recommendations'] = json.loads(analysis['recommendations'] or '[]')
+            analyses.append(analysis)
+        return analyses
+    
     try:
-        with get_db_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT * FROM project_analyses 
-                WHERE project_id = ?
-                ORDER BY analysis_date DESC
-                LIMIT ?
-                """,
-                (project_id, limit)
-            )
-            
-            analyses = []
-            for row in cursor.fetchall():
-                analysis = dict(row)
-                # Parse JSON fields
-                analysis['implemented_features'] = json.loads(analysis['implemented_features'] or '[]')
-                analysis['missing_features'] = json.loads(analysis['missing_features'] or '[]')
-                analysis['divergent_features'] = json.loads(analysis['divergent_features'] or '[]')
-                analysis['recommendations'] = json.loads(analysis['recommendations'] or '[]')
-                analyses.append(analysis)
-            
-            return {
-                "project_id": project_id,
-                "analyses": analyses,
-                "total_count": len(analyses)
-            }
+        analyses = await read_transaction(load_analyses)
+        
+        return {
+            "project_id": project_id,
+            "analyses": analyses,
+            "total_count": len(analyses)
+        }
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get analysis: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,362 @@
+"""
+Async database access for FastAPI handlers.
+
+sqlite3 calls block, so running them directly in `async def` routes
+stalls the event loop and every other request and WebSocket with it.
+This module runs them on worker threads instead: reads go to a small
+reader thread pool, and writes go to a single writer thread. SQLite
+allows only one writer at a time, so serializing writes in-process means
+they queue up here instead of contending for the database lock.
+
+The writer thread owns one connection and drains its queue in batches:
+every write_transaction() job waiting in the queue runs in its own
+savepoint inside one shared transaction, which is committed once (group
+commit). A failing job only rolls back its own savepoint.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from . import database
+from .database import get_db_cursor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Number of threads serving read queries (0 runs them inline on the event loop)
+DATABASE_READER_THREADS = int(os.getenv("DAILY_INSPO_DB_READER_THREADS", "4"))
+# Most queued write jobs committed together in one transaction
+WRITE_QUEUE_MAX_BATCH = int(os.getenv("DAILY_INSPO_DB_WRITE_BATCH", "64"))
+
+
+class WriteQueue:
+    """
+    Single writer thread applying queued write jobs with group commits.
+    
+    Jobs are either transactional (a function of a cursor, run in a
+    savepoint of the current group transaction) or standalone (a plain
+    function that manages its own connection, run between groups).
+    Callers receive a concurrent.futures.Future resolved after the job's
+    transaction has committed.
+    """
+    
+    def __init__(self, max_batch: int = 64):
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[Tuple[bool, Callable, Future]]]" = queue.Queue()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._stats = {
+            'jobs': 0, 'failed_jobs': 0, 'batches': 0, 'largest_batch': 0,
+            'grouped_jobs': 0, 'max_queue_depth': 0, 'busy_retries': 0,
+        }
+        self._thread.start()
+    
+    def submit(self, func: Callable, transactional: bool = True) -> Future:
+        """
+        Queue a write job.
+        
+        Args:
+            func: func(cursor) for transactional jobs, func() otherwise
+            transactional: Run inside the shared group transaction
+            
+        Returns:
+            Future: Resolves to the job's return value or exception
+        """
+        future: Future = Future()
+        self._queue.put((transactional, func, future))
+        self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._queue.qsize())
+        return future
+    
+    def _connection(self) -> sqlite3.Connection:
+        database_path = str(database.DATABASE_PATH)
+        if self._conn is None or self._conn_path != database_path:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = database.get_db_connection(check_same_thread=False)
+            self._conn.isolation_level = None  # Transactions are managed explicitly
+            self._conn_path = database_path
+        return self._conn
+    
+    def _begin(self, cursor: sqlite3.Cursor) -> None:
+        # The connection's busy timeout already waits for other processes;
+        # retry a few times on top of that before failing the batch
+        for attempt in range(3):
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e).lower() or attempt == 2:
+                    raise
+                self._stats['busy_retries'] += 1
+                time.sleep(0.1 * (attempt + 1))
+    
+    def _run_group(self, jobs: List[Tuple[Callable, Future]]) -> None:
+        try:
+            cursor = self._connection().cursor()
+            self._begin(cursor)
+        except Exception as e:
+            logger.error(f"Database operation failed: {e}")
+            for _, future in jobs:
+                future.set_exception(e)
+            return
+            
+        completed = []
+        try:
+            for func, future in jobs:
+                cursor.execute("SAVEPOINT write_job")
+                try:
+                    result = func(cursor)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO write_job")
+                    cursor.execute("RELEASE write_job")
+                    self._stats['failed_jobs'] += 1
+                    future.set_exception(e)
+                    continue
+                cursor.execute("RELEASE write_job")
+                completed.append((future, result))
+                
+            cursor.execute("COMMIT")
+        except Exception as e:
+            # The group transaction itself failed: nothing from it was kept
+            logger.error(f"Database operation failed: {e}")
+            if self._conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            for _, future in jobs:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        self._stats['batches'] += 1
+        self._stats['grouped_jobs'] += len(jobs)
+        self._stats['largest_batch'] = max(self._stats['largest_batch'], len(jobs))
+        for future, result in completed:
+            future.set_result(result)
+    
+    def _run_standalone(self, func: Callable, future: Future) -> None:
+        try:
+            future.set_result(func())
+        except Exception as e:
+            self._stats['failed_jobs'] += 1
+            future.set_exception(e)
+    
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+                
+            group: List[Tuple[Callable, Future]] = []
+            pending = [job]
+            while pending:
+                transactional, func, future = pending.pop()
+                self._stats['jobs'] += 1
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if transactional:
+                    group.append((func, future))
+                else:
+                    # Keep ordering: commit the jobs queued before this one first
+                    if group:
+                        self._run_group(group)
+                        group = []
+                    self._run_standalone(func, future)
+                    
+                if len(group) < self.max_batch:
+                    try:
+                        next_job = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if next_job is None:
+                        self._queue.put(None)  # Stop after this batch
+                        break
+                    pending.append(next_job)
+                    
+            if group:
+                self._run_group(group)
+                
+        if self._conn is not None:
+            self._conn.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get write queue metrics.
+        
+        Returns:
+            Dict[str, Any]: Current and peak queue depth, job and batch counters
+        """
+        batches = self._stats['batches']
+        return {
+            'queue_depth': self._queue.qsize(),
+            **self._stats,
+            'average_batch': round(self._stats['grouped_jobs'] / batches, 2) if batches else 0,
+        }
+    
+    def close(self) -> None:
+        """
+        Apply every queued job, then stop the writer thread.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+
+_readers: Optional[ThreadPoolExecutor] = None
+_writer: Optional[WriteQueue] = None
+_executor_lock = threading.Lock()
+_stats = {'reads': 0, 'writes': 0, 'reads_in_flight': 0, 'writes_in_flight': 0}
+
+
+def _get_executors() -> tuple:
+    global _readers, _writer
+    with _executor_lock:
+        if _writer is None:
+            _readers = ThreadPoolExecutor(
+                max_workers=DATABASE_READER_THREADS, thread_name_prefix="db-reader"
+            ) if DATABASE_READER_THREADS > 0 else None
+            _writer = WriteQueue(max_batch=WRITE_QUEUE_MAX_BATCH)
+        return _readers, _writer
+
+
+async def _run(executor: Optional[ThreadPoolExecutor], kind: str, func: Callable[..., T], *args, **kwargs) -> T:
+    _stats[f'{kind}s'] += 1
+    _stats[f'{kind}s_in_flight'] += 1
+    try:
+        call = functools.partial(func, *args, **kwargs)
+        if executor is None:
+            return call()
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+    finally:
+        _stats[f'{kind}s_in_flight'] -= 1
+
+
+async def _queue_write(transactional: bool, func: Callable[..., T]) -> T:
+    _, writer = _get_executors()
+    _stats['writes'] += 1
+    _stats['writes_in_flight'] += 1
+    try:
+        return await asyncio.wrap_future(writer.submit(func, transactional))
+    finally:
+        _stats['writes_in_flight'] -= 1
+
+
+async def run_read(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call a blocking read function on the reader thread pool.
+
+    Args:
+        func: Database function to call
+        *args: Positional arguments for `func`
+        **kwargs: Keyword arguments for `func`
+
+    Returns:
+        Whatever `func` returns; its exceptions propagate to the caller
+    """
+    readers, _ = _get_executors()
+    return await _run(readers, 'read', func, *args, **kwargs)
+
+
+async def run_write(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call a blocking write function on the writer thread.
+
+    `func` manages its own connection and transaction (for example
+    bulk_insert_ideas), so it runs on its own between group commits.
+
+    Args:
+        func: Database function to call
+        *args: Positional arguments for `func`
+        **kwargs: Keyword arguments for `func`
+
+    Returns:
+        Whatever `func` returns; its exceptions propagate to the caller
+    """
+    return await _queue_write(False, functools.partial(func, *args, **kwargs))
+
+
+def _in_transaction(func: Callable[[sqlite3.Cursor], T]) -> T:
+    with get_db_cursor() as cursor:
+        return func(cursor)
+
+
+async def read_transaction(func: Callable[[sqlite3.Cursor], T]) -> T:
+    """
+    Run `func(cursor)` inside get_db_cursor() on the reader thread pool.
+
+    Args:
+        func: Function taking an open cursor
+
+    Returns:
+        Whatever `func` returns
+    """
+    return await run_read(_in_transaction, func)
+
+
+async def write_transaction(func: Callable[[sqlite3.Cursor], T]) -> T:
+    """
+    Run `func(cursor)` as a job of the writer thread's next group commit.
+
+    The job runs in its own savepoint: if it raises, only its changes are
+    rolled back. The call returns once the group transaction has committed.
+
+    Args:
+        func: Function taking an open cursor
+
+    Returns:
+        Whatever `func` returns
+    """
+    return await _queue_write(True, func)
+
+
+async def database_maintenance_loop(interval: float) -> None:
+    """
+    Periodically checkpoint the WAL and run PRAGMA optimize.
+
+    Runs on the writer thread so maintenance never competes with queued
+    writes for the database lock. Cancel the task to stop it.
+
+    Args:
+        interval: Seconds between maintenance runs
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_write(database.run_database_maintenance, "PASSIVE")
+        except Exception as e:
+            logger.warning(f"Database maintenance failed: {e}")
+
+
+def get_executor_stats() -> Dict[str, Any]:
+    """
+    Get async database executor counters.
+
+    Returns:
+        Dict[str, Any]: Reader thread count, read/write call counters and
+        write queue metrics
+    """
+    stats = {'reader_threads': DATABASE_READER_THREADS, **_stats}
+    if _writer is not None:
+        stats['write_queue'] = _writer.stats()
+    return stats
+
+
+def shutdown_executors() -> None:
+    """
+    Wait for queued database calls to finish and stop the worker threads.
+    """
+    global _readers, _writer
+    with _executor_lock:
+        if _readers is not None:
+            _readers.shutdown(wait=True)
+        if _writer is not None:
+            _writer.close()
+        _readers = None
+        _writer = None
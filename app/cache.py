@@ -0,0 +1,206 @@
+"""
+In-process caching utilities.
+
+Provides a TTL cache whose entries are also invalidated when the shared
+database data version changes, so results computed in this process are
+dropped when another process (e.g. the idea generator) writes new data,
+and a byte-bounded LRU cache for serialized responses.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedTTLCache:
+    """
+    Cache of computed values keyed by name.
+
+    An entry is served while it is younger than `ttl` seconds and the data
+    version it was computed at is still current. The data version is read
+    through `version_provider` at most once per `version_check_interval`
+    seconds; local writes call invalidate() to take effect immediately.
+    """
+
+    def __init__(self, version_provider: Callable[[], int], ttl: float = 300.0,
+                 version_check_interval: float = 1.0):
+        self.version_provider = version_provider
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[Any, int, float]] = {}
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def current_version(self) -> int:
+        """
+        Get the data version, re-reading it when the check interval has passed.
+
+        Returns:
+            int: Current data version
+        """
+        now = time.monotonic()
+        if self._version is None or now - self._version_checked_at >= self.version_check_interval:
+            version = self.version_provider()
+            with self._lock:
+                if version != self._version:
+                    self._entries.clear()
+                self._version = version
+                self._version_checked_at = now
+        return self._version
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, computing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        version = self.current_version()
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, entry_version, created_at = entry
+            if entry_version == version and time.monotonic() - created_at < self.ttl:
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = (value, version, time.monotonic())
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one entry, or everything, and re-read the data version next time.
+
+        Args:
+            key: Entry to drop; all entries when omitted
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._version = None
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Entry count, hits, misses and current data version
+        """
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'data_version': self._version,
+        }
+
+
+class ByteLRUCache:
+    """
+    Least-recently-used cache bounded by the total size of its values.
+
+    Each entry records the data version it was stored at; get() treats an
+    entry from another version as a miss and drops it, so entries never
+    outlive a write even when clear() is not called (e.g. after a write
+    by another process). With a `ttl`, entries also expire after `ttl`
+    seconds, as a safety net for writers that do not bump the version.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        """
+        Look up a value stored at `version`.
+
+        Args:
+            key: Cache key
+            version: Current data version
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != version or (self.ttl is not None and time.monotonic() >= entry[3]):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, version: int, value: Any, size: int) -> None:
+        """
+        Store a value, evicting least recently used entries to make room.
+
+        Values larger than the whole cache are not stored.
+
+        Args:
+            key: Cache key
+            version: Data version the value was computed at
+            value: Value to cache
+            size: Size of the value in bytes
+        """
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+            self._entries[key] = (value, version, size, expires_at)
+            self._bytes += size
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dict[str, Any]: Entry count, bytes used and limit, hits, misses
+            and evictions
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
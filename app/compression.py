@@ -0,0 +1,307 @@
+"""
+HTTP response compression.
+
+CompressionMiddleware compresses text-like responses (JSON, HTML, CSS,
+JavaScript) above a size threshold with brotli when the client accepts it,
+and with gzip otherwise. `brotli` is in requirements.txt; without it only
+gzip is offered.
+
+Compressed responses get an encoding-specific strong ETag (`"<etag>-gzip"`,
+`"<etag>-br"`), so a cache never confuses the compressed and identity
+representations. The suffix is stripped from `If-None-Match` before the
+request reaches the application, so ConditionalGetMiddleware and the
+static file handler still answer revalidations with 304. Because an ETag
+identifies its bytes, compressed bodies of responses that carry one are
+kept in a small LRU and not compressed again.
+
+Static assets are precompressed at build time instead (see
+app/static_assets.py); responses that already have a Content-Encoding are
+passed through untouched.
+"""
+
+import gzip
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import database
+from .cache import ByteLRUCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Set DAILY_INSPO_COMPRESSION=0 to disable response compression
+COMPRESSION_ENABLED = os.environ.get("DAILY_INSPO_COMPRESSION", "1") != "0"
+# Smaller payloads are sent as is; compression would barely shrink them
+COMPRESSION_MIN_SIZE = int(os.environ.get("DAILY_INSPO_COMPRESSION_MIN_SIZE", "1024"))
+# Per-request levels favour speed; build-time levels (static assets) favour size
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+# Memory for compressed bodies of responses with an ETag (0 disables)
+COMPRESSION_CACHE_MAX_BYTES = int(os.environ.get("DAILY_INSPO_COMPRESSION_CACHE_BYTES", str(4 * 1024 * 1024)))
+
+COMPRESSIBLE_TYPES = frozenset({
+    'application/json', 'application/javascript', 'application/xml', 'image/svg+xml',
+    'text/css', 'text/html', 'text/javascript', 'text/plain', 'text/xml',
+})
+
+# Encodings this process can produce, in order of preference
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Compressed bodies keyed by (path, ETag, encoding); the ETag already
+# identifies the data version, so entries are stored at a fixed version
+compression_cache = ByteLRUCache(max_bytes=COMPRESSION_CACHE_MAX_BYTES)
+database.add_invalidation_hook(compression_cache.clear)
+
+_stats = {'compressed': 0, 'bytes_in': 0, 'bytes_out': 0}
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """
+    Pick a content coding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, deflate, br;q=0.9"
+        available: Encodings that can be served, in order of preference
+
+    Returns:
+        Optional[str]: Highest-weighted available encoding, or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress_body(body: bytes, encoding: str, static: bool = False) -> bytes:
+    """
+    Compress a response body.
+
+    Args:
+        body: Uncompressed bytes
+        encoding: 'br' or 'gzip'
+        static: Use the slower build-time levels
+
+    Returns:
+        bytes: Compressed bytes
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    # mtime=0 keeps the output deterministic for a given body
+    return gzip.compress(body, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """
+    Check whether a Content-Type is worth compressing.
+
+    Args:
+        content_type: Content-Type header value
+
+    Returns:
+        bool: True for text-like media types
+    """
+    if not content_type:
+        return False
+    return content_type.split(';', 1)[0].strip().lower() in COMPRESSIBLE_TYPES
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    """
+    Add Accept-Encoding to a response's Vary header once.
+
+    Args:
+        headers: Response headers
+    """
+    vary = headers.get('vary', '')
+    if 'accept-encoding' not in vary.lower():
+        headers.add_vary_header('Accept-Encoding')
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Derive the ETag of a compressed representation.
+
+    Args:
+        etag: ETag of the identity response (StaticFiles sends it unquoted)
+        encoding: Content coding
+
+    Returns:
+        str: ETag with an encoding suffix, inside the quotes if quoted
+    """
+    if etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return f'{etag}-{encoding}'
+
+
+def strip_encoded_etags(if_none_match: str) -> Tuple[str, Optional[str]]:
+    """
+    Remove encoding suffixes from the ETags in an If-None-Match header.
+
+    Args:
+        if_none_match: Header value
+
+    Returns:
+        Tuple[str, Optional[str]]: Header value with identity ETags, and the
+        encoding of the last suffixed ETag (None if there was none)
+    """
+    tags = []
+    found = None
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        quote = '"' if tag.endswith('"') else ''
+        for encoding in ('br', 'gzip'):
+            suffix = f'-{encoding}{quote}'
+            if tag.endswith(suffix):
+                tag = tag[:-len(suffix)] + quote
+                found = encoding
+                break
+        tags.append(tag)
+    return ', '.join(tags), found
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing text-like responses.
+
+    Only responses sent in a single body message are compressed; streamed
+    responses (large files, event streams) are passed through.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get('accept-encoding'))
+
+        # Revalidation of a compressed copy: hand the identity ETag to the
+        # application and restore the suffix on its 304
+        client_encoding = None
+        if_none_match = request_headers.get('if-none-match')
+        if if_none_match:
+            stripped, client_encoding = strip_encoded_etags(if_none_match)
+            if client_encoding is not None:
+                scope = dict(scope)
+                scope['headers'] = [(name, value) for name, value in scope['headers'] if name != b'if-none-match']
+                scope['headers'].append((b'if-none-match', stripped.encode('latin-1')))
+
+        start_message: Optional[Message] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message['headers'])
+                if message['status'] == 304:
+                    etag = headers.get('etag')
+                    if client_encoding and etag:
+                        response_headers = MutableHeaders(scope=message)
+                        response_headers['ETag'] = encoded_etag(etag, client_encoding)
+                        add_vary_accept_encoding(response_headers)
+                elif (message['status'] == 200 and 'content-encoding' not in headers
+                        and is_compressible(headers.get('content-type'))):
+                    # Hold the headers until the body shows whether to compress
+                    start_message = message
+                    return
+                await send(message)
+                return
+
+            if start_message is None:
+                await send(message)
+                return
+
+            held, start_message = start_message, None
+            body = message.get('body', b'')
+            if message.get('more_body', False) or len(body) < self.minimum_size:
+                if not message.get('more_body', False):
+                    add_vary_accept_encoding(MutableHeaders(scope=held))
+                await send(held)
+                await send(message)
+                return
+
+            response_headers = MutableHeaders(scope=held)
+            add_vary_accept_encoding(response_headers)
+            if encoding is not None:
+                body = self.compress(body, encoding, scope['path'], response_headers.get('etag'))
+                response_headers['Content-Encoding'] = encoding
+                response_headers['Content-Length'] = str(len(body))
+                if 'etag' in response_headers:
+                    response_headers['ETag'] = encoded_etag(response_headers['etag'], encoding)
+            await send(held)
+            await send({'type': 'http.response.body', 'body': body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def compress(self, body: bytes, encoding: str, path: str, etag: Optional[str]) -> bytes:
+        """
+        Compress a body, reusing the cached result for a known ETag.
+
+        Args:
+            body: Uncompressed response body
+            encoding: Negotiated content coding
+            path: Request path (StaticFiles ETags only cover mtime and size)
+            etag: Identity ETag of the response, if any
+
+        Returns:
+            bytes: Compressed body
+        """
+        key = (path, etag, encoding)
+        if etag is not None and not etag.startswith('W/'):
+            cached = compression_cache.get(key, 0)
+            if cached is not None:
+                return cached
+
+        compressed = compress_body(body, encoding)
+        _stats['compressed'] += 1
+        _stats['bytes_in'] += len(body)
+        _stats['bytes_out'] += len(compressed)
+        if etag is not None and not etag.startswith('W/'):
+            compression_cache.put(key, 0, compressed, len(compressed))
+        return compressed
+
+
+def get_compression_stats() -> Dict[str, Any]:
+    """
+    Get compression counters.
+
+    Returns:
+        Dict[str, Any]: Available encodings, bodies compressed, bytes before
+        and after, and compression cache counters
+    """
+    return {
+        'enabled': COMPRESSION_ENABLED,
+        'encodings': list(SUPPORTED_ENCODINGS),
+        **_stats,
+        'cache': compression_cache.stats(),
+    }
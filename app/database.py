@@ -6,47 +6,281 @@ Handles SQLite database operations, connections, and schema management.
 
 import sqlite3
 import json
+import base64
+import binascii
 import logging
+import os
+import random
+import re
+import queue
+import threading
+import time
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple, Iterable
 from datetime import datetime, timedelta
 
+from .cache import VersionedTTLCache
+from .tag_index import tag_bitmap_index, bitmap_to_ids, ids_to_bitmap, FACET_CATEGORIES
+
 # Database configuration
 DATABASE_PATH = Path("daily_ideas.db")
 
+# Connection pool configuration (a pool size of 0 disables pooling)
+DATABASE_POOL_SIZE = int(os.environ.get("DAILY_INSPO_DB_POOL_SIZE", "5"))
+DATABASE_POOL_HEALTH_CHECK_INTERVAL = float(os.environ.get("DAILY_INSPO_DB_POOL_HEALTH_CHECK_SECONDS", "30"))
+
+# In-memory tag bitmap index (set DAILY_INSPO_TAG_INDEX=0 to disable)
+TAG_INDEX_ENABLED = os.environ.get("DAILY_INSPO_TAG_INDEX", "1") != "0"
+# Tag-filtered results up to this size are resolved to an ID list before querying SQLite
+TAG_INDEX_MAX_CANDIDATES = 2000
+
+# Lifetime of cached tag lists and system stats
+QUERY_CACHE_TTL = float(os.environ.get("DAILY_INSPO_CACHE_TTL_SECONDS", "300"))
+
+# Performance PRAGMAs applied to every new connection (WAL makes synchronous=NORMAL
+# safe against corruption; only the last transactions can be lost on power failure)
+DATABASE_PRAGMA_PROFILE = {
+    'synchronous': os.environ.get("DAILY_INSPO_DB_SYNCHRONOUS", "NORMAL"),
+    'cache_size': -int(os.environ.get("DAILY_INSPO_DB_CACHE_SIZE_KB", "16384")),
+    'mmap_size': int(os.environ.get("DAILY_INSPO_DB_MMAP_SIZE", str(128 * 1024 * 1024))),
+    'temp_store': os.environ.get("DAILY_INSPO_DB_TEMP_STORE", "MEMORY"),
+    'wal_autocheckpoint': int(os.environ.get("DAILY_INSPO_DB_WAL_AUTOCHECKPOINT", "1000")),
+}
+# Seconds between background WAL checkpoints and PRAGMA optimize runs (0 disables)
+DATABASE_MAINTENANCE_INTERVAL = float(os.environ.get("DAILY_INSPO_DB_MAINTENANCE_SECONDS", "600"))
+
 logger = logging.getLogger(__name__)
 
 
-def get_db_connection() -> sqlite3.Connection:
+def get_db_connection(check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Create and return a database connection.
     
+    Args:
+        check_same_thread: Restrict the connection to the creating thread
+        
     Returns:
         sqlite3.Connection: Database connection with row factory configured
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = sqlite3.connect(DATABASE_PATH, check_same_thread=check_same_thread)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
         conn.execute("PRAGMA journal_mode = WAL")  # Better performance for concurrent access
+        apply_pragma_profile(conn)
         return conn
     except sqlite3.Error as e:
         logger.error(f"Failed to connect to database: {e}")
         raise
 
 
+def apply_pragma_profile(conn: sqlite3.Connection, profile: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Apply performance PRAGMAs to a connection.
+    
+    Args:
+        conn: Connection to configure
+        profile: PRAGMA names and values (defaults to DATABASE_PRAGMA_PROFILE)
+    """
+    profile = DATABASE_PRAGMA_PROFILE if profile is None else profile
+    for name, value in profile.items():
+        if not re.fullmatch(r"[a-z_]+", name) or not re.fullmatch(r"-?\w+", str(value)):
+            raise ValueError(f"Invalid PRAGMA setting: {name} = {value}")
+        conn.execute(f"PRAGMA {name} = {value}")
+
+
+class ConnectionPool:
+    """
+    Bounded pool of pre-configured SQLite connections.
+    
+    Each checkout hands a connection to exactly one thread until it is
+    released. When every pooled connection is checked out an overflow
+    connection is opened instead of blocking (nested get_db_cursor() calls
+    and long-running chat handlers would otherwise deadlock the event loop);
+    overflow connections are closed on release so at most `max_size`
+    connections are kept open.
+    """
+    
+    def __init__(self, database_path: Path, max_size: int, health_check_interval: float = 30.0):
+        self.database_path = database_path
+        self.max_size = max_size
+        self.health_check_interval = health_check_interval
+        self._idle: "queue.LifoQueue[tuple]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._open_count = 0
+        self._checked_out: Dict[int, int] = {}
+        self._closed = False
+    
+    def _create_connection(self) -> sqlite3.Connection:
+        return get_db_connection(check_same_thread=False)
+    
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+    
+    def acquire(self) -> sqlite3.Connection:
+        """
+        Check out a connection for the calling thread.
+        
+        Returns:
+            sqlite3.Connection: Connection reserved for the caller until release()
+        """
+        while True:
+            try:
+                conn, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - last_used < self.health_check_interval or self._is_healthy(conn):
+                self._checked_out[id(conn)] = threading.get_ident()
+                return conn
+            logger.warning("Discarding unhealthy pooled database connection")
+            self._discard(conn)
+        
+        conn = self._create_connection()
+        with self._lock:
+            self._open_count += 1
+        self._checked_out[id(conn)] = threading.get_ident()
+        return conn
+    
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a connection to the pool.
+        
+        Args:
+            conn: Connection previously obtained from acquire()
+        """
+        self._checked_out.pop(id(conn), None)
+        if conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+        
+        if self._closed or self._idle.qsize() >= self.max_size:
+            self._discard(conn)
+        else:
+            self._idle.put((conn, time.monotonic()))
+    
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._open_count -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def close(self) -> None:
+        """Close all idle connections and stop pooling released ones."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool occupancy counters.
+        
+        Returns:
+            Dict[str, int]: Open, idle and checked-out connection counts
+        """
+        return {
+            'max_size': self.max_size,
+            'open': self._open_count,
+            'idle': self._idle.qsize(),
+            'checked_out': len(self._checked_out)
+        }
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> Optional[ConnectionPool]:
+    """
+    Get the process-wide connection pool, creating it on first use.
+    
+    The pool is rebuilt if DATABASE_PATH has been changed since it was created.
+    
+    Returns:
+        Optional[ConnectionPool]: Shared pool, or None if pooling is disabled
+    """
+    global _pool
+    if DATABASE_POOL_SIZE <= 0:
+        return None
+    
+    pool = _pool
+    if pool is not None and pool.database_path == DATABASE_PATH:
+        return pool
+    
+    with _pool_lock:
+        if _pool is None or _pool.database_path != DATABASE_PATH:
+            if _pool is not None:
+                _pool.close()
+            _pool = ConnectionPool(DATABASE_PATH, DATABASE_POOL_SIZE, DATABASE_POOL_HEALTH_CHECK_INTERVAL)
+        return _pool
+
+
+def close_connection_pool() -> None:
+    """
+    Close the process-wide connection pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def run_database_maintenance(checkpoint_mode: str = "PASSIVE") -> Dict[str, Any]:
+    """
+    Checkpoint the WAL and refresh query planner statistics.
+    
+    PASSIVE checkpoints never wait for readers or writers; TRUNCATE (used
+    at shutdown) also resets the WAL file to zero bytes.
+    
+    Args:
+        checkpoint_mode: PASSIVE, FULL, RESTART or TRUNCATE
+        
+    Returns:
+        Dict[str, Any]: Checkpoint result (busy flag, WAL pages, pages checkpointed)
+    """
+    if checkpoint_mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+        raise ValueError(f"Invalid checkpoint mode: {checkpoint_mode}")
+        
+    conn = get_db_connection()
+    try:
+        busy, wal_pages, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({checkpoint_mode})").fetchone()
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+        
+    logger.info(f"Database maintenance: {checkpoint_mode} checkpoint of {checkpointed}/{wal_pages} WAL pages")
+    return {'busy': bool(busy), 'wal_pages': wal_pages, 'checkpointed_pages': checkpointed}
+
+
 @contextmanager
 def get_db_cursor():
     """
     Context manager for database operations.
     
+    Connections are checked out of the process-wide pool and returned to it
+    when the block exits.
+    
     Yields:
         sqlite3.Cursor: Database cursor for executing queries
     """
+    pool = get_connection_pool()
     conn = None
     try:
-        conn = get_db_connection()
+        conn = pool.acquire() if pool else get_db_connection()
         cursor = conn.cursor()
         yield cursor
         conn.commit()
@@ -57,19 +291,27 @@ def get_db_cursor():
         raise
     finally:
         if conn:
-            conn.close()
+            if pool:
+                pool.release(conn)
+            else:
+                conn.close()
 
 
 def initialize_database() -> bool:
     """
     Initialize database with required tables and indexes.
     
+    Applies any pending schema migrations (see app/migrations.py), which
+    create the baseline schema on a new database.
+    
     Returns:
         bool: True if initialization successful, False otherwise
     """
+    from .migrations import run_migrations  # migrations builds on this module
+    
     try:
-        create_tables()
-        create_indexes()
+        run_migrations()
+        warm_tag_id_cache()
         logger.info("Database initialized successfully")
         return True
     except Exception as e:
@@ -87,6 +329,7 @@ def create_tables() -> None:
         - idea_tags: Many-to-many relationship table
         - market_data: Supporting market analysis data
         - generation_log: Idea generation history
+        - app_meta: Shared counters such as the data version
     """
     table_schemas = [
         """
@@ -197,6 +440,12 @@ def create_tables() -> None:
         )
         """,
         """
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        """
         CREATE TABLE IF NOT EXISTS project_analyses (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             project_id INTEGER,
@@ -224,7 +473,6 @@ def create_indexes() -> None:
     Create database indexes for optimal query performance.
     
     Indexes:
-        - ideas.generated_date for date filtering
         - idea_tags.idea_id for tag lookups
         - idea_tags.tag_value for filter queries
     """
@@ -244,7 +492,7 @@ def create_indexes() -> None:
         "CREATE INDEX IF NOT EXISTS idx_project_snapshots_project_id ON project_snapshots(project_id)",
         "CREATE INDEX IF NOT EXISTS idx_project_snapshots_date ON project_snapshots(snapshot_date DESC)",
         "CREATE INDEX IF NOT EXISTS idx_chat_sessions_project_id ON chat_sessions(project_id)",
-        "CREATE INDEX IF NOT EXISTS idx_chat_messages_session_id ON chat_messages(session_id)",
+        "CREATE INDEX IF NOT EXISTS idx_chat_messages_session_timestamp ON chat_messages(session_id, timestamp)",
         "CREATE INDEX IF NOT EXISTS idx_chat_messages_timestamp ON chat_messages(timestamp DESC)",
         "CREATE INDEX IF NOT EXISTS idx_project_analyses_project_id ON project_analyses(project_id)",
         "CREATE INDEX IF NOT EXISTS idx_project_analyses_date ON project_analyses(analysis_date DESC)"
@@ -256,6 +504,179 @@ def create_indexes() -> None:
         logger.info("Database indexes created successfully")
 
 
+def get_data_version() -> int:
+    """
+    Read the shared data version counter.
+    
+    Every process that changes ideas, tags or generation logs bumps this
+    counter, so caches in other processes can detect stale data.
+    
+    Returns:
+        int: Current data version (0 if never bumped)
+    """
+    try:
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT value FROM app_meta WHERE key = 'data_version'")
+            row = cursor.fetchone()
+            return row[0] if row else 0
+    except sqlite3.OperationalError:
+        # app_meta does not exist yet on databases created before it
+        return 0
+
+
+def bump_data_version(cursor: sqlite3.Cursor) -> None:
+    """
+    Increment the shared data version inside the caller's transaction.
+    
+    app_meta is created by initialize_database, which every writing
+    process runs first.
+    
+    Args:
+        cursor: Cursor of the transaction making the change
+    """
+    cursor.execute(
+        """
+        INSERT INTO app_meta (key, value) VALUES ('data_version', 1)
+        ON CONFLICT (key) DO UPDATE SET value = value + 1
+        """
+    )
+
+
+# Cache for aggregate read queries, invalidated by data version changes
+query_cache = VersionedTTLCache(get_data_version, ttl=QUERY_CACHE_TTL)
+
+
+# Extra callbacks run by invalidate_caches (e.g. the HTTP response cache)
+_invalidation_hooks: List[Callable[[], None]] = []
+
+
+def add_invalidation_hook(hook: Callable[[], None]) -> None:
+    """
+    Run `hook` whenever cached results are invalidated by a local write.
+    
+    Args:
+        hook: Zero-argument callback
+    """
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_caches() -> None:
+    """
+    Drop cached query results after a write in this process.
+    """
+    query_cache.invalidate()
+    for hook in _invalidation_hooks:
+        hook()
+
+
+# Databases known to have the ideas_fts full-text index
+_search_index_available: Dict[str, bool] = {}
+
+
+def create_search_index() -> bool:
+    """
+    Create the FTS5 full-text index over ideas and keep it in sync.
+    
+    Creates an external-content ideas_fts table over title, summary and
+    description plus triggers that mirror inserts, updates and deletes.
+    When the table is created for the first time it is backfilled from
+    existing ideas.
+    
+    Returns:
+        bool: True if the index is available, False if FTS5 is unsupported
+    """
+    triggers = [
+        """
+        CREATE TRIGGER IF NOT EXISTS ideas_fts_ai AFTER INSERT ON ideas BEGIN
+            INSERT INTO ideas_fts (rowid, title, summary, description)
+            VALUES (new.id, new.title, new.summary, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS ideas_fts_ad AFTER DELETE ON ideas BEGIN
+            INSERT INTO ideas_fts (ideas_fts, rowid, title, summary, description)
+            VALUES ('delete', old.id, old.title, old.summary, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS ideas_fts_au AFTER UPDATE OF title, summary, description ON ideas BEGIN
+            INSERT INTO ideas_fts (ideas_fts, rowid, title, summary, description)
+            VALUES ('delete', old.id, old.title, old.summary, old.description);
+            INSERT INTO ideas_fts (rowid, title, summary, description)
+            VALUES (new.id, new.title, new.summary, new.description);
+        END
+        """
+    ]
+    
+    try:
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ideas_fts'")
+            exists = cursor.fetchone() is not None
+            
+            cursor.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS ideas_fts USING fts5(
+                    title, summary, description,
+                    content = 'ideas', content_rowid = 'id'
+                )
+                """
+            )
+            for trigger in triggers:
+                cursor.execute(trigger)
+                
+            # Backfill rows that predate the index
+            if not exists:
+                cursor.execute("INSERT INTO ideas_fts (ideas_fts) VALUES ('rebuild')")
+                logger.info("Full-text search index created and backfilled")
+                
+        _search_index_available[str(DATABASE_PATH)] = True
+        return True
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, falling back to LIKE search: {e}")
+        _search_index_available[str(DATABASE_PATH)] = False
+        return False
+
+
+def has_search_index(cursor: sqlite3.Cursor) -> bool:
+    """
+    Check whether the current database has the ideas_fts index.
+    
+    Args:
+        cursor: Open database cursor
+        
+    Returns:
+        bool: True if full-text search queries can be used
+    """
+    key = str(DATABASE_PATH)
+    if key not in _search_index_available:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ideas_fts'")
+        _search_index_available[key] = cursor.fetchone() is not None
+    return _search_index_available[key]
+
+
+def build_fts_query(search: str) -> Optional[str]:
+    """
+    Translate a user search string into an FTS5 MATCH expression.
+    
+    Double-quoted text is matched as an exact phrase; every other word is
+    matched as a prefix. All terms must match.
+    
+    Args:
+        search: Raw search text
+        
+    Returns:
+        Optional[str]: FTS5 query, or None if the text contains no searchable terms
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"?|(\S+)', search):
+        text = phrase or word.rstrip('*')
+        if not re.search(r'\w', text):
+            continue
+        quoted = '"' + text.replace('"', '""') + '"'
+        terms.append(quoted if phrase else quoted + '*')
+    return " AND ".join(terms) if terms else None
+
+
 def validate_database_schema() -> bool:
     """
     Validate that database schema matches expected structure.
@@ -279,6 +700,13 @@ def validate_database_schema() -> bool:
                 logger.warning(f"Missing tables: {missing_tables}")
                 return False
                 
+            from .migrations import get_latest_version
+            cursor.execute("PRAGMA user_version")
+            schema_version = cursor.fetchone()[0]
+            if schema_version < get_latest_version():
+                logger.warning(f"Schema version {schema_version} is behind {get_latest_version()}: run scripts/migrate.py")
+                return False
+                
             logger.info("Database schema validation successful")
             return True
     except Exception as e:
@@ -286,10 +714,108 @@ def validate_database_schema() -> bool:
         return False
 
 
+class TagIdCache:
+    """
+    Process-wide intern table mapping (category, value) to tag ID.
+    
+    Tags are never deleted, so a tag ID stays valid once committed. IDs
+    learned inside a transaction are only published with remember() after
+    that transaction commits, so a rollback cannot leave dangling IDs.
+    The table is dropped when DATABASE_PATH changes.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self._database_key: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+    
+    def _check_database(self) -> None:
+        database_key = str(DATABASE_PATH)
+        if self._database_key != database_key:
+            self._ids = {}
+            self._database_key = database_key
+    
+    def warm(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Load every existing tag.
+        
+        Args:
+            cursor: Open database cursor
+        """
+        cursor.execute("SELECT category, value, id FROM tags")
+        rows = cursor.fetchall()
+        with self._lock:
+            self._check_database()
+            self._ids.update(((category, value), tag_id) for category, value, tag_id in rows)
+        logger.info(f"Tag ID cache warmed with {len(rows)} tags")
+    
+    def get(self, key: Tuple[str, str]) -> Optional[int]:
+        """
+        Look up a committed tag ID.
+        
+        Args:
+            key: (category, value) pair
+            
+        Returns:
+            Optional[int]: Tag ID, or None if not interned yet
+        """
+        with self._lock:
+            self._check_database()
+            tag_id = self._ids.get(key)
+        if tag_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return tag_id
+    
+    def remember(self, tag_ids: Dict[Tuple[str, str], int]) -> None:
+        """
+        Publish tag IDs resolved by a committed transaction.
+        
+        Args:
+            tag_ids: Map of (category, value) to tag ID
+        """
+        with self._lock:
+            self._check_database()
+            self._ids.update(tag_ids)
+    
+    def invalidate(self) -> None:
+        """
+        Forget all interned tag IDs.
+        """
+        with self._lock:
+            self._ids = {}
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get intern table counters.
+        
+        Returns:
+            Dict[str, Any]: Interned tag count, hits and misses
+        """
+        return {'tags': len(self._ids), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide tag ID intern table used by the write paths
+tag_id_cache = TagIdCache()
+
+
+def warm_tag_id_cache() -> None:
+    """
+    Load existing tag IDs into the intern table.
+    """
+    with get_db_cursor() as cursor:
+        tag_id_cache.warm(cursor)
+
+
 def insert_idea(idea_data: Dict[str, Any]) -> int:
     """
     Insert new idea into database.
     
+    The idea, its tags and its market data are written in one transaction.
+    
     Args:
         idea_data: Dictionary containing idea information
         
@@ -299,6 +825,8 @@ def insert_idea(idea_data: Dict[str, Any]) -> int:
     Raises:
         sqlite3.Error: If database operation fails
     """
+    tags = idea_data.get('tags') or []
+    
     with get_db_cursor() as cursor:
         cursor.execute(
             """
@@ -316,75 +844,253 @@ def insert_idea(idea_data: Dict[str, Any]) -> int:
         idea_id = cursor.lastrowid
         
         # Insert tags if provided
-        if 'tags' in idea_data and idea_data['tags']:
-            insert_idea_tags(idea_id, idea_data['tags'])
+        tag_ids = write_idea_tags(cursor, [(idea_id, tags)]) if tags else {}
             
         # Insert market data if provided
-        if 'market_data' in idea_data and idea_data['market_data']:
-            insert_market_data(idea_id, idea_data['market_data'])
+        if idea_data.get('market_data'):
+            write_market_data(cursor, [(idea_id, idea_data['market_data'])])
             
+        bump_data_version(cursor)
         logger.info(f"Inserted new idea with ID {idea_id}: {idea_data['title']}")
-        return idea_id
+        
+    tag_id_cache.remember(tag_ids)
+    tag_bitmap_index.add_tags(idea_id, tags)
+    invalidate_caches()
+    return idea_id
 
 
-def insert_idea_tags(idea_id: int, tags: List[Dict[str, str]]) -> None:
+def bulk_insert_ideas(ideas: Iterable[Dict[str, Any]]) -> List[int]:
     """
-    Insert tags associated with an idea.
+    Insert many ideas with their tags and market data in one transaction.
+    
+    Rows are written with executemany and each distinct tag is resolved
+    once. Either every idea is stored or, on error, none are.
     
     Args:
-        idea_id: ID of the idea
-        tags: List of tag dictionaries with 'category' and 'value' keys
+        ideas: Dictionaries in the insert_idea format
+        
+    Returns:
+        List[int]: IDs of the inserted ideas, in input order
+        
+    Raises:
+        sqlite3.Error: If database operation fails
     """
+    ideas = list(ideas)
+    if not ideas:
+        return []
+        
     with get_db_cursor() as cursor:
-        for tag in tags:
-            # Insert or get existing tag
-            cursor.execute(
-                "INSERT OR IGNORE INTO tags (category, value) VALUES (?, ?)",
-                (tag['category'], tag['value'])
-            )
+        # Take the write lock first so the IDs reserved below cannot be claimed elsewhere
+        bump_data_version(cursor)
+        cursor.execute(
+            """
+            SELECT MAX(COALESCE((SELECT MAX(id) FROM ideas), 0),
+                       COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'ideas'), 0))
+            """
+        )
+        first_id = cursor.fetchone()[0] + 1
+        idea_ids = list(range(first_id, first_id + len(ideas)))
+        
+        now = datetime.now()
+        cursor.executemany(
+            """
+            INSERT INTO ideas (id, title, summary, description, supporting_logic, generated_date)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    idea_id,
+                    idea['title'],
+                    idea['summary'],
+                    idea['description'],
+                    idea['supporting_logic'],
+                    idea.get('generated_date', now)
+                )
+                for idea_id, idea in zip(idea_ids, ideas)
+            ]
+        )
+        
+        tag_ids = write_idea_tags(cursor, [(idea_id, idea['tags']) for idea_id, idea in zip(idea_ids, ideas) if idea.get('tags')])
+        write_market_data(cursor, [(idea_id, idea['market_data']) for idea_id, idea in zip(idea_ids, ideas) if idea.get('market_data')])
+        logger.info(f"Bulk inserted {len(ideas)} ideas (IDs {idea_ids[0]}-{idea_ids[-1]})")
+        
+    tag_id_cache.remember(tag_ids)
+    for idea_id, idea in zip(idea_ids, ideas):
+        tag_bitmap_index.add_tags(idea_id, idea.get('tags') or [])
+    invalidate_caches()
+    return idea_ids
+
+
+def resolve_tag_ids(cursor: sqlite3.Cursor, tags: Iterable[Dict[str, str]],
+                    tag_ids: Dict[Tuple[str, str], int]) -> None:
+    """
+    Look up (creating as needed) the IDs of tags missing from `tag_ids`.
+    
+    Interned IDs cost no statement; other tags are resolved with a single
+    upsert that returns the ID whether the tag is new or already exists.
+    
+    Args:
+        cursor: Cursor of the current write transaction
+        tags: Tag dictionaries with 'category' and 'value' keys
+        tag_ids: Map of (category, value) to tag ID, filled in place
+    """
+    for tag in tags:
+        key = (tag['category'], tag['value'])
+        if key in tag_ids:
+            continue
             
-            # Get tag ID
+        tag_id = tag_id_cache.get(key)
+        if tag_id is None:
             cursor.execute(
-                "SELECT id FROM tags WHERE category = ? AND value = ?",
-                (tag['category'], tag['value'])
+                """
+                INSERT INTO tags (category, value) VALUES (?, ?)
+                ON CONFLICT (category, value) DO UPDATE SET value = excluded.value
+                RETURNING id
+                """,
+                key
             )
             tag_id = cursor.fetchone()[0]
-            
-            # Link idea to tag
-            cursor.execute(
-                "INSERT OR IGNORE INTO idea_tags (idea_id, tag_id) VALUES (?, ?)",
-                (idea_id, tag_id)
-            )
+        tag_ids[key] = tag_id
 
 
-def insert_market_data(idea_id: int, market_data: Dict[str, Any]) -> None:
+def write_idea_tags(cursor: sqlite3.Cursor, idea_tags: List[Tuple[int, List[Dict[str, str]]]]) -> Dict[Tuple[str, str], int]:
     """
-    Insert market analysis data for an idea.
+    Link ideas to their tags inside the caller's transaction.
     
     Args:
-        idea_id: ID of the idea
-        market_data: Dictionary containing market analysis information
+        cursor: Cursor of the current write transaction
+        idea_tags: (idea_id, tags) pairs
+        
+    Returns:
+        Dict: Tag IDs used, to pass to tag_id_cache.remember() after commit
     """
-    with get_db_cursor() as cursor:
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO market_data 
-            (idea_id, market_size, competitors, technical_feasibility, development_timeline)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+    tag_ids: Dict[Tuple[str, str], int] = {}
+    links = []
+    for idea_id, tags in idea_tags:
+        resolve_tag_ids(cursor, tags, tag_ids)
+        links.extend((idea_id, tag_ids[(tag['category'], tag['value'])]) for tag in tags)
+        
+    cursor.executemany("INSERT OR IGNORE INTO idea_tags (idea_id, tag_id) VALUES (?, ?)", links)
+    return tag_ids
+
+
+def write_market_data(cursor: sqlite3.Cursor, market_data: List[Tuple[int, Dict[str, Any]]]) -> None:
+    """
+    Store market analysis rows inside the caller's transaction.
+    
+    Args:
+        cursor: Cursor of the current write transaction
+        market_data: (idea_id, market data dictionary) pairs
+    """
+    cursor.executemany(
+        """
+        INSERT OR REPLACE INTO market_data 
+        (idea_id, market_size, competitors, technical_feasibility, development_timeline)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [
             (
                 idea_id,
-                market_data.get('market_size'),
-                json.dumps(market_data.get('competitors', [])),
-                market_data.get('technical_feasibility'),
-                market_data.get('development_timeline')
+                data.get('market_size'),
+                json.dumps(data.get('competitors', [])),
+                data.get('technical_feasibility'),
+                data.get('development_timeline')
             )
-        )
+            for idea_id, data in market_data
+        ]
+    )
 
 
-def get_idea_by_id(idea_id: int) -> Optional[Dict[str, Any]]:
+def insert_idea_tags(idea_id: int, tags: List[Dict[str, str]]) -> None:
     """
-    Retrieve complete idea data by ID.
+    Insert tags associated with an idea.
+    
+    Args:
+        idea_id: ID of the idea
+        tags: List of tag dictionaries with 'category' and 'value' keys
+    """
+    with get_db_cursor() as cursor:
+        tag_ids = write_idea_tags(cursor, [(idea_id, tags)])
+        bump_data_version(cursor)
+    
+    # Keep the in-memory tag index and caches current once the links are committed
+    tag_id_cache.remember(tag_ids)
+    tag_bitmap_index.add_tags(idea_id, tags)
+    invalidate_caches()
+
+
+def insert_market_data(idea_id: int, market_data: Dict[str, Any]) -> None:
+    """
+    Insert market analysis data for an idea.
+    
+    Args:
+        idea_id: ID of the idea
+        market_data: Dictionary containing market analysis information
+    """
+    with get_db_cursor() as cursor:
+        write_market_data(cursor, [(idea_id, market_data)])
+
+
+# Fully hydrated idea: market data via LEFT JOIN and tags aggregated to JSON
+IDEA_DETAIL_SELECT = """
+    SELECT i.*,
+           md.id AS market_data_id,
+           md.market_size,
+           md.competitors,
+           md.technical_feasibility,
+           md.development_timeline,
+           (SELECT json_group_array(json_object('category', t.category, 'value', t.value))
+            FROM idea_tags it
+            JOIN tags t ON t.id = it.tag_id
+            WHERE it.idea_id = i.id) AS tags_json
+    FROM ideas i
+    LEFT JOIN market_data md ON md.idea_id = i.id
+"""
+
+IDEA_DETAIL_EXTRA_COLUMNS = frozenset((
+    'market_data_id', 'market_size', 'competitors', 'technical_feasibility',
+    'development_timeline', 'tags_json'
+))
+
+
+def hydrate_idea_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """
+    Build a complete idea dictionary from an IDEA_DETAIL_SELECT row.
+    
+    JSON columns (tags and competitors) are decoded here and nowhere else.
+    
+    Args:
+        row: Result row of IDEA_DETAIL_SELECT
+        
+    Returns:
+        Dict[str, Any]: Idea data with 'tags' and 'market_data'
+    """
+    idea = {column: row[column] for column in row.keys() if column not in IDEA_DETAIL_EXTRA_COLUMNS}
+    idea['tags'] = json.loads(row['tags_json']) if row['tags_json'] else []
+    
+    if row['market_data_id'] is None:
+        idea['market_data'] = None
+        return idea
+        
+    try:
+        competitors = json.loads(row['competitors']) if row['competitors'] else []
+    except json.JSONDecodeError:
+        competitors = []
+        
+    idea['market_data'] = {
+        'id': row['market_data_id'],
+        'idea_id': row['id'],
+        'market_size': row['market_size'],
+        'competitors': competitors,
+        'technical_feasibility': row['technical_feasibility'],
+        'development_timeline': row['development_timeline']
+    }
+    return idea
+
+
+def get_idea_by_id(idea_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve complete idea data by ID.
     
     Args:
         idea_id: Unique idea identifier
@@ -393,57 +1099,316 @@ def get_idea_by_id(idea_id: int) -> Optional[Dict[str, Any]]:
         Optional[Dict]: Complete idea data or None if not found
     """
     with get_db_cursor() as cursor:
-        # Get main idea data
-        cursor.execute(
-            "SELECT * FROM ideas WHERE id = ?",
-            (idea_id,)
-        )
-        idea_row = cursor.fetchone()
+        cursor.execute(IDEA_DETAIL_SELECT + " WHERE i.id = ?", (idea_id,))
+        row = cursor.fetchone()
         
-        if not idea_row:
-            return None
-            
-        # Convert to dictionary
-        idea = dict(idea_row)
+        return hydrate_idea_row(row) if row else None
+
+
+def get_ideas_by_ids(idea_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Retrieve complete idea data for several IDs.
+    
+    Runs one hydrated query per SQL_IN_BATCH_SIZE IDs on a single connection.
+    
+    Args:
+        idea_ids: Idea identifiers; duplicates are ignored
         
-        # Get associated tags
+    Returns:
+        List[Dict]: Complete idea data in the order of `idea_ids`, skipping
+        IDs that do not exist
+    """
+    unique_ids = list(dict.fromkeys(idea_ids))
+    ideas_by_id: Dict[int, Dict[str, Any]] = {}
+    
+    with get_db_cursor() as cursor:
+        for start in range(0, len(unique_ids), SQL_IN_BATCH_SIZE):
+            batch = unique_ids[start:start + SQL_IN_BATCH_SIZE]
+            cursor.execute(
+                IDEA_DETAIL_SELECT + f" WHERE i.id IN ({','.join(['?'] * len(batch))})",
+                batch
+            )
+            for row in cursor.fetchall():
+                ideas_by_id[row['id']] = hydrate_idea_row(row)
+                
+    return [ideas_by_id[idea_id] for idea_id in unique_ids if idea_id in ideas_by_id]
+
+
+def get_existing_idea_ids(cursor: sqlite3.Cursor, idea_ids: List[int]) -> set:
+    """
+    Find which of the given idea IDs exist.
+    
+    Args:
+        cursor: Open database cursor (reused so callers stay in their transaction)
+        idea_ids: Idea identifiers to check
+        
+    Returns:
+        set: Subset of `idea_ids` present in the ideas table
+    """
+    unique_ids = list(dict.fromkeys(idea_ids))
+    existing = set()
+    
+    for start in range(0, len(unique_ids), SQL_IN_BATCH_SIZE):
+        batch = unique_ids[start:start + SQL_IN_BATCH_SIZE]
         cursor.execute(
-            """
-            SELECT t.category, t.value 
-            FROM tags t
-            JOIN idea_tags it ON t.id = it.tag_id
-            WHERE it.idea_id = ?
-            """,
-            (idea_id,)
+            f"SELECT id FROM ideas WHERE id IN ({','.join(['?'] * len(batch))})",
+            batch
         )
-        idea['tags'] = [{'category': row[0], 'value': row[1]} for row in cursor.fetchall()]
+        existing.update(row[0] for row in cursor.fetchall())
         
-        # Get market data
-        cursor.execute(
-            "SELECT * FROM market_data WHERE idea_id = ?",
-            (idea_id,)
+    return existing
+
+
+# Tag categories that can be used as filters
+TAG_FILTER_CATEGORIES = FACET_CATEGORIES
+
+# Filter parameters clients may set; idea_ids, cursor, sort and the
+# pagination keys are set by the API itself
+PUBLIC_FILTER_KEYS = TAG_FILTER_CATEGORIES + ('search', 'date_from', 'date_to')
+
+# Idea cards show at most this many summary characters, followed by '...'
+CARD_SUMMARY_LENGTH = 150
+
+# SQL equivalent of truncate_card_summary (format with the summary expression,
+# e.g. new.summary in triggers)
+CARD_SUMMARY_SQL = (
+    f"CASE WHEN length({{summary}}) > {CARD_SUMMARY_LENGTH} "
+    f"THEN substr({{summary}}, 1, {CARD_SUMMARY_LENGTH}) || '...' ELSE {{summary}} END"
+)
+
+# Columns of the idea_cards table, which holds everything needed to render a card
+IDEA_CARD_COLUMNS = "i.id, i.title, i.card_summary, i.tags_json, i.generated_date"
+
+# JSON array of an idea's tags in link order, as stored in idea_cards.tags_json
+# (format with the SQL expression for the idea ID)
+IDEA_TAGS_JSON_SQL = """(
+    SELECT json_group_array(json_object('category', category, 'value', value))
+    FROM (
+        SELECT t.category, t.value FROM idea_tags it
+        JOIN tags t ON t.id = it.tag_id
+        WHERE it.idea_id = {idea_id}
+        ORDER BY it.rowid
+    )
+)"""
+
+
+def truncate_card_summary(summary: str) -> str:
+    """
+    Shorten a summary to the length shown on idea cards.
+    
+    Args:
+        summary: Full idea summary
+        
+    Returns:
+        str: Summary cut to CARD_SUMMARY_LENGTH characters plus '...' when longer
+    """
+    return summary[:CARD_SUMMARY_LENGTH] + '...' if len(summary) > CARD_SUMMARY_LENGTH else summary
+
+
+def build_idea_filter_query(filters: Dict[str, Any], select: str, use_search_index: bool = False,
+                            table: str = "ideas") -> Tuple[str, List[Any]]:
+    """
+    Build the FROM/WHERE part of an idea query for the given filters.
+    
+    Shared by get_ideas_with_filters and count_ideas_with_filters so that
+    listings and counts always apply the same predicates.
+    
+    Args:
+        filters: Dictionary of filter parameters
+        select: Select list, e.g. "i.*" or "COUNT(*)"
+        use_search_index: Match 'search' against ideas_fts instead of LIKE
+        table: Table aliased as i, "ideas" or "idea_cards"
+        
+    Returns:
+        Tuple[str, List[Any]]: (query, params) without ORDER BY or pagination
+    """
+    query = f"SELECT {select} FROM {table} i"
+    joins: List[str] = []
+    where_conditions = []
+    params = []
+    
+    # Add tag filtering: each category is a semi-join on idea_tags, so
+    # categories are AND'ed and values within a category are OR'ed
+    for category in TAG_FILTER_CATEGORIES:
+        if not filters.get(category):
+            continue
+        values = filters[category] if isinstance(filters[category], list) else [filters[category]]
+        where_conditions.append(
+            f"""i.id IN (
+                SELECT it.idea_id FROM idea_tags it
+                JOIN tags t ON t.id = it.tag_id
+                WHERE t.category = ? AND t.value IN ({','.join(['?'] * len(values))})
+            )"""
         )
-        market_row = cursor.fetchone()
-        
-        if market_row:
-            market_data = dict(market_row)
-            # Parse competitors JSON
-            if market_data['competitors']:
-                try:
-                    market_data['competitors'] = json.loads(market_data['competitors'])
-                except json.JSONDecodeError:
-                    market_data['competitors'] = []
-            idea['market_data'] = market_data
+        params.append(category)
+        params.extend(values)
+    
+    # Restrict to candidate IDs already resolved from the tag index
+    if filters.get('idea_ids') is not None:
+        where_conditions.append("i.id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(filters['idea_ids'])))
+    
+    # Add text search, using the full-text index when available
+    if filters.get('search'):
+        fts_query = build_fts_query(filters['search']) if use_search_index else None
+        if fts_query:
+            joins.append("JOIN ideas_fts ON ideas_fts.rowid = i.id")
+            where_conditions.append("ideas_fts MATCH ?")
+            params.append(fts_query)
         else:
-            idea['market_data'] = None
-            
-        return idea
+            search_term = f"%{filters['search']}%"
+            if table == "ideas":
+                where_conditions.append("(i.title LIKE ? OR i.summary LIKE ? OR i.description LIKE ?)")
+            else:
+                # Only ideas has the full text columns
+                where_conditions.append(
+                    "i.id IN (SELECT id FROM ideas WHERE title LIKE ? OR summary LIKE ? OR description LIKE ?)"
+                )
+            params.extend([search_term, search_term, search_term])
+    
+    # Seek past the previous page when paginating with a cursor
+    if filters.get('cursor'):
+        cursor_date, cursor_id = decode_idea_cursor(filters['cursor'])
+        where_conditions.append("i.generated_date <= ? AND (i.generated_date < ? OR i.id > ?)")
+        params.extend([cursor_date, cursor_date, cursor_id])
+    
+    # Add date filters
+    if filters.get('date_from'):
+        where_conditions.append("i.generated_date >= ?")
+        params.append(filters['date_from'])
+        
+    if filters.get('date_to'):
+        where_conditions.append("i.generated_date <= ?")
+        params.append(filters['date_to'])
+    
+    # Build complete query
+    if joins:
+        query += " " + " ".join(joins)
+    if where_conditions:
+        query += " WHERE " + " AND ".join(where_conditions)
+        
+    return query, params
+
+
+def encode_idea_cursor(idea: Dict[str, Any]) -> str:
+    """
+    Build an opaque pagination cursor pointing just after an idea.
+    
+    Args:
+        idea: Last idea of the current page (needs 'generated_date' and 'id')
+        
+    Returns:
+        str: URL-safe cursor token
+    """
+    generated_date = idea['generated_date']
+    if isinstance(generated_date, datetime):
+        generated_date = str(generated_date)
+    payload = json.dumps([generated_date, idea['id']], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_idea_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a cursor produced by encode_idea_cursor.
+    
+    Args:
+        cursor: Cursor token from a previous page
+        
+    Returns:
+        Tuple[str, int]: (generated_date, id) of the last idea already returned
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        generated_date, idea_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(generated_date, str) or not isinstance(idea_id, int):
+            raise ValueError("unexpected cursor payload")
+        return generated_date, idea_id
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def resolve_tag_candidates(cursor: sqlite3.Cursor, filters: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    Resolve tag filters against the in-memory bitmap index.
+    
+    When the matching set is small, the tag predicates are replaced by an
+    explicit 'idea_ids' list so SQLite only visits candidate rows.
+    
+    Args:
+        cursor: Open database cursor
+        filters: Dictionary of filter parameters
+        
+    Returns:
+        Tuple[Dict, Optional[int]]: (filters to query with, candidate bitset
+        or None when no tag filter applies or the index is disabled)
+    """
+    if not TAG_INDEX_ENABLED or not any(filters.get(category) for category in TAG_FILTER_CATEGORIES):
+        return filters, None
+    
+    tag_bitmap_index.sync(cursor, str(DATABASE_PATH))
+    candidates = tag_bitmap_index.match(filters)
+    
+    if candidates.bit_count() <= TAG_INDEX_MAX_CANDIDATES:
+        filters = {key: value for key, value in filters.items() if key not in TAG_FILTER_CATEGORIES}
+        filters['idea_ids'] = bitmap_to_ids(candidates)
+        
+    return filters, candidates
+
+
+def query_idea_page(cursor: sqlite3.Cursor, filters: Dict[str, Any], select: str,
+                    table: str = "ideas") -> List[sqlite3.Row]:
+    """
+    Run a filtered, ordered and paginated idea query.
+    
+    Results are newest first unless filters['sort'] is 'relevance' and a
+    full-text search is applied, in which case they are ordered by bm25.
+    Date-ordered pages can be fetched with filters['cursor'] (from
+    encode_idea_cursor) instead of an offset; ties on generated_date are
+    broken by id so every idea appears exactly once.
+    Tag filters must match in every requested category (any value within
+    a category).
+    
+    Args:
+        cursor: Open database cursor
+        filters: Dictionary of filter parameters
+        select: Columns to return (must include i.id and i.generated_date)
+        table: "ideas" or "idea_cards"
+        
+    Returns:
+        List[sqlite3.Row]: Rows of the requested page
+    """
+    filters, candidates = resolve_tag_candidates(cursor, filters)
+    if candidates == 0:
+        return []
+        
+    use_search_index = bool(filters.get('search')) and has_search_index(cursor)
+    query, params = build_idea_filter_query(filters, select, use_search_index, table)
+    
+    # Rank by bm25 relevance when requested for a full-text search
+    if filters.get('sort') == 'relevance' and 'ideas_fts MATCH' in query:
+        query += " ORDER BY bm25(ideas_fts), i.generated_date DESC, i.id"
+    else:
+        query += " ORDER BY i.generated_date DESC, i.id"
+    
+    # Add pagination (a cursor replaces the offset)
+    limit = filters.get('limit', 50)
+    offset = 0 if filters.get('cursor') else filters.get('offset', 0)
+    query += " LIMIT ? OFFSET ?"
+    params.extend([limit, offset])
+    
+    cursor.execute(query, params)
+    return cursor.fetchall()
 
 
 def get_ideas_with_filters(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Retrieve ideas matching specified filters.
     
+    See query_idea_page for ordering and pagination.
+    
     Args:
         filters: Dictionary of filter parameters
         
@@ -451,93 +1416,159 @@ def get_ideas_with_filters(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         List[Dict]: List of matching ideas
     """
     with get_db_cursor() as cursor:
-        # Base query
-        query = "SELECT DISTINCT i.* FROM ideas i"
-        joins = []
-        where_conditions = []
-        params = []
-        
-        # Add tag filtering
-        if filters.get('industry') or filters.get('target_market') or filters.get('complexity') or filters.get('technology'):
-            joins.append("JOIN idea_tags it ON i.id = it.idea_id")
-            joins.append("JOIN tags t ON it.tag_id = t.id")
+        ideas = [dict(row) for row in query_idea_page(cursor, filters, "i.*")]
+        
+        # Enrich the whole page with tags in one query
+        attach_idea_tags(cursor, ideas)
             
-            tag_conditions = []
-            if filters.get('industry'):
-                industry_values = filters['industry'] if isinstance(filters['industry'], list) else [filters['industry']]
-                tag_conditions.append(f"(t.category = 'industry' AND t.value IN ({','.join(['?'] * len(industry_values))}))") 
-                params.extend(industry_values)
-                
-            if filters.get('target_market'):
-                market_values = filters['target_market'] if isinstance(filters['target_market'], list) else [filters['target_market']]
-                tag_conditions.append(f"(t.category = 'target_market' AND t.value IN ({','.join(['?'] * len(market_values))}))") 
-                params.extend(market_values)
-                
-            if filters.get('complexity'):
-                complexity_values = filters['complexity'] if isinstance(filters['complexity'], list) else [filters['complexity']]
-                tag_conditions.append(f"(t.category = 'complexity' AND t.value IN ({','.join(['?'] * len(complexity_values))}))") 
-                params.extend(complexity_values)
-                
-            if filters.get('technology'):
-                tech_values = filters['technology'] if isinstance(filters['technology'], list) else [filters['technology']]
-                tag_conditions.append(f"(t.category = 'technology' AND t.value IN ({','.join(['?'] * len(tech_values))}))") 
-                params.extend(tech_values)
-                
-            if tag_conditions:
-                where_conditions.append(f"({' OR '.join(tag_conditions)})")
+        return ideas
+
+
+def hydrate_idea_card(row: sqlite3.Row) -> Dict[str, Any]:
+    """
+    Build a card dictionary from an idea_cards row.
+    
+    Args:
+        row: Row selected with IDEA_CARD_COLUMNS
         
-        # Add text search
-        if filters.get('search'):
-            search_term = f"%{filters['search']}%"
-            where_conditions.append("(i.title LIKE ? OR i.summary LIKE ? OR i.description LIKE ?)")
-            params.extend([search_term, search_term, search_term])
+    Returns:
+        Dict[str, Any]: id, title, card_summary, generated_date and decoded tags
+    """
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'card_summary': row['card_summary'],
+        'generated_date': row['generated_date'],
+        'tags': json.loads(row['tags_json']),
+    }
+
+
+def get_idea_cards_with_filters(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Retrieve idea cards matching filters.
+    
+    Same filtering, ordering and pagination as get_ideas_with_filters, but
+    served from the idea_cards table: a date-ordered page is one range scan
+    of its (generated_date DESC, id) primary key, with tags already
+    attached as JSON.
+    
+    Args:
+        filters: Dictionary of filter parameters
         
-        # Add date filters
-        if filters.get('date_from'):
-            where_conditions.append("i.generated_date >= ?")
-            params.append(filters['date_from'])
-            
-        if filters.get('date_to'):
-            where_conditions.append("i.generated_date <= ?")
-            params.append(filters['date_to'])
-        
-        # Build complete query
-        if joins:
-            query += " " + " ".join(joins)
-        if where_conditions:
-            query += " WHERE " + " AND ".join(where_conditions)
-            
-        query += " ORDER BY i.generated_date DESC"
+    Returns:
+        List[Dict]: Cards with id, title, card_summary, generated_date and tags
+    """
+    with get_db_cursor() as cursor:
+        rows = query_idea_page(cursor, filters, IDEA_CARD_COLUMNS, table="idea_cards")
+        return [hydrate_idea_card(row) for row in rows]
+
+
+def get_idea_cards_by_ids(cursor: sqlite3.Cursor, idea_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Load idea cards by ID, in the order given.
+    
+    Args:
+        cursor: Open database cursor
+        idea_ids: Idea IDs (missing ones are skipped)
         
-        # Add pagination
-        limit = filters.get('limit', 50)
-        offset = filters.get('offset', 0)
-        query += " LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
+    Returns:
+        List[Dict]: Cards as returned by hydrate_idea_card
+    """
+    cards: Dict[int, Dict[str, Any]] = {}
+    for start in range(0, len(idea_ids), SQL_IN_BATCH_SIZE):
+        batch = idea_ids[start:start + SQL_IN_BATCH_SIZE]
+        cursor.execute(
+            f"SELECT {IDEA_CARD_COLUMNS} FROM idea_cards i WHERE i.id IN ({','.join(['?'] * len(batch))})",
+            batch
+        )
+        for row in cursor.fetchall():
+            cards[row['id']] = hydrate_idea_card(row)
+    return [cards[idea_id] for idea_id in idea_ids if idea_id in cards]
+
+
+def rebuild_idea_cards() -> int:
+    """
+    Recompute the idea_cards table from ideas, idea_tags and tags.
+    
+    Triggers keep idea_cards current; this is for recovery if it ever
+    drifts. The rebuild runs in one transaction, so readers see either
+    the old or the new table, never a partial one.
+    
+    Returns:
+        int: Number of cards written
+    """
+    with get_db_cursor() as cursor:
+        cursor.execute("DELETE FROM idea_cards")
+        cursor.execute(
+            f"""
+            INSERT INTO idea_cards (id, title, card_summary, tags_json, generated_date)
+            SELECT i.id, i.title, {CARD_SUMMARY_SQL.format(summary='i.summary')}, {IDEA_TAGS_JSON_SQL.format(idea_id='i.id')},
+                   COALESCE(i.generated_date, '')
+            FROM ideas i
+            """
+        )
+        count = cursor.rowcount
+        bump_data_version(cursor)
+        logger.info(f"Rebuilt {count} idea cards")
         
-        cursor.execute(query, params)
-        ideas = [dict(row) for row in cursor.fetchall()]
+    invalidate_caches()
+    return count
+
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lists
+SQL_IN_BATCH_SIZE = 500
+
+
+def attach_idea_tags(cursor: sqlite3.Cursor, ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Populate the 'tags' list of each idea using a single batched query.
+    
+    Args:
+        cursor: Open database cursor
+        ideas: Idea dictionaries containing an 'id' key
         
-        # Enrich with tags for each idea
-        for idea in ideas:
-            cursor.execute(
-                """
-                SELECT t.category, t.value 
-                FROM tags t
-                JOIN idea_tags it ON t.id = it.tag_id
-                WHERE it.idea_id = ?
-                """,
-                (idea['id'],)
-            )
-            idea['tags'] = [{'category': row[0], 'value': row[1]} for row in cursor.fetchall()]
-            
-        return ideas
+    Returns:
+        List[Dict]: The same idea dictionaries, enriched in place
+    """
+    tags_by_idea: Dict[int, List[Dict[str, str]]] = {}
+    for idea in ideas:
+        idea['tags'] = tags_by_idea.setdefault(idea['id'], [])
+    
+    idea_ids = list(tags_by_idea)
+    for start in range(0, len(idea_ids), SQL_IN_BATCH_SIZE):
+        batch = idea_ids[start:start + SQL_IN_BATCH_SIZE]
+        cursor.execute(
+            f"""
+            SELECT it.idea_id, t.category, t.value 
+            FROM idea_tags it
+            JOIN tags t ON t.id = it.tag_id
+            WHERE it.idea_id IN ({','.join(['?'] * len(batch))})
+            """,
+            batch
+        )
+        for idea_id, category, value in cursor.fetchall():
+            tags_by_idea[idea_id].append({'category': category, 'value': value})
+    
+    return ideas
 
 
 def get_available_tags() -> Dict[str, List[str]]:
     """
     Get all available tags grouped by category.
     
+    Results are cached until the data version changes or the cache TTL
+    expires; callers must not modify the returned dictionary.
+    
+    Returns:
+        Dict[str, List[str]]: Tags grouped by category
+    """
+    return query_cache.get('available_tags', query_available_tags)
+
+
+def query_available_tags() -> Dict[str, List[str]]:
+    """
+    Query all available tags grouped by category, bypassing the cache.
+    
     Returns:
         Dict[str, List[str]]: Tags grouped by category
     """
@@ -561,10 +1592,101 @@ def get_available_tags() -> Dict[str, List[str]]:
         return result
 
 
+def get_facet_counts(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get per-value idea counts for every tag category in one pass.
+    
+    Counts come from the tag bitmap index, or from SQL when it is disabled
+    (see query_facet_counts). Each category's counts respect all applied
+    filters except that category's own tag filter. Search and date filters
+    are resolved with a single ID query first.
+    
+    Args:
+        filters: Dictionary of filter parameters
+        
+    Returns:
+        Dict[str, Any]: 'facets' (category -> value -> count) and 'total_count'
+    """
+    with get_db_cursor() as cursor:
+        if not TAG_INDEX_ENABLED:
+            return query_facet_counts(cursor, filters)
+            
+        tag_bitmap_index.sync(cursor, str(DATABASE_PATH))
+        
+        restrict = None
+        other_filters = {key: filters.get(key) for key in ('search', 'date_from', 'date_to') if filters.get(key)}
+        if other_filters:
+            use_search_index = bool(other_filters.get('search')) and has_search_index(cursor)
+            query, params = build_idea_filter_query(other_filters, "i.id", use_search_index)
+            cursor.execute(query, params)
+            restrict = ids_to_bitmap(row[0] for row in cursor.fetchall())
+            
+        return {
+            'facets': tag_bitmap_index.facet_counts(filters, restrict),
+            'total_count': tag_bitmap_index.count(filters, restrict)
+        }
+
+
+def query_facet_counts(cursor: sqlite3.Cursor, filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get facet counts with SQL GROUP BY queries instead of the tag index.
+    
+    Categories without a tag filter of their own are counted against all
+    applied filters in one query; each filtered category needs its own.
+    
+    Args:
+        cursor: Open database cursor
+        filters: Dictionary of filter parameters
+        
+    Returns:
+        Dict[str, Any]: Same shape as get_facet_counts
+    """
+    use_search_index = bool(filters.get('search')) and has_search_index(cursor)
+    filtered = [category for category in TAG_FILTER_CATEGORIES if filters.get(category)]
+    groups = [(filters, f"t.category NOT IN ({','.join(['?'] * len(filtered))})", filtered)]
+    for category in filtered:
+        other_filters = {key: value for key, value in filters.items() if key != category}
+        groups.append((other_filters, "t.category = ?", [category]))
+        
+    facets: Dict[str, Dict[str, int]] = {}
+    for group_filters, category_condition, category_params in groups:
+        query, params = build_idea_filter_query(group_filters, "DISTINCT i.id", use_search_index)
+        cursor.execute(
+            f"""
+            SELECT t.category, t.value, COUNT(DISTINCT matches.id)
+            FROM tags t
+            JOIN idea_tags it ON it.tag_id = t.id
+            LEFT JOIN ({query}) matches ON matches.id = it.idea_id
+            WHERE {category_condition}
+            GROUP BY t.id
+            """,
+            params + category_params
+        )
+        for category, value, count in cursor.fetchall():
+            facets.setdefault(category, {})[value] = count
+            
+    query, params = build_idea_filter_query(filters, "COUNT(DISTINCT i.id)", use_search_index)
+    cursor.execute(query, params)
+    return {'facets': facets, 'total_count': cursor.fetchone()[0]}
+
+
 def get_system_stats() -> Dict[str, Any]:
     """
     Get system statistics and status information.
     
+    Results are cached like get_available_tags; callers must not modify
+    the returned dictionary.
+    
+    Returns:
+        Dict[str, Any]: System statistics
+    """
+    return query_cache.get('system_stats', query_system_stats)
+
+
+def query_system_stats() -> Dict[str, Any]:
+    """
+    Query system statistics, bypassing the cache.
+    
     Returns:
         Dict[str, Any]: System statistics
     """
@@ -633,12 +1755,15 @@ def log_generation_attempt(success: bool, error_message: Optional[str] = None, e
             """,
             (success, error_message, execution_time, idea_id)
         )
+        bump_data_version(cursor)
         
         log_level = "INFO" if success else "ERROR"
         logger.log(
             getattr(logging, log_level),
             f"Generation attempt logged: success={success}, time={execution_time}s, idea_id={idea_id}"
         )
+        
+    invalidate_caches()
 
 
 def cleanup_old_logs(days_to_keep: int = 90) -> None:
@@ -661,22 +1786,116 @@ def cleanup_old_logs(days_to_keep: int = 90) -> None:
             logger.info(f"Cleaned up {deleted_count} old log entries older than {days_to_keep} days")
 
 
-def get_random_idea() -> Optional[Dict[str, Any]]:
+def get_all_idea_ids() -> List[int]:
     """
-    Get a random idea from the database.
+    Get the dense list of all idea IDs.
+    
+    The list is cached and refreshed when the data version changes, so
+    random selection never has to scan or sort the ideas table.
     
     Returns:
-        Optional[Dict]: Random idea data or None if no ideas exist
+        List[int]: All idea IDs in ascending order
+    """
+    def load_ids() -> List[int]:
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT id FROM ideas ORDER BY id")
+            return [row[0] for row in cursor.fetchall()]
+            
+    return query_cache.get('idea_ids', load_ids)
+
+
+def get_filtered_idea_ids(filters: Dict[str, Any]) -> List[int]:
+    """
+    Get the IDs of all ideas matching filters, in no particular order.
+    
+    Pure tag filters are resolved from the tag bitmap index; other filters
+    run a single ID-only query.
+    
+    Args:
+        filters: Dictionary of filter parameters
+        
+    Returns:
+        List[int]: Matching idea IDs
     """
     with get_db_cursor() as cursor:
-        cursor.execute(
-            "SELECT id FROM ideas ORDER BY RANDOM() LIMIT 1"
-        )
-        result = cursor.fetchone()
+        resolved, candidates = resolve_tag_candidates(cursor, filters)
+        if candidates is not None and not any(filters.get(key) for key in ('search', 'date_from', 'date_to')):
+            return bitmap_to_ids(candidates)
+            
+        use_search_index = bool(resolved.get('search')) and has_search_index(cursor)
+        query, params = build_idea_filter_query(resolved, "i.id", use_search_index)
+        cursor.execute(query, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def get_random_ideas(count: int = 1, filters: Optional[Dict[str, Any]] = None, max_attempts: int = 3,
+                     cards: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get up to `count` distinct random ideas, optionally within filters.
+    
+    IDs are sampled from the cached ID list (or the filter's candidate set)
+    and then loaded; IDs deleted by another process since the list was
+    cached are dropped and re-sampled, so only existing ideas are returned.
+    
+    Args:
+        count: Number of distinct ideas wanted
+        filters: Optional filter parameters (tags, search, dates)
+        max_attempts: Sampling rounds before giving up on missing IDs
+        cards: Load idea cards (see hydrate_idea_card) instead of full rows
         
-        if result:
-            return get_idea_by_id(result[0])
-        return None
+    Returns:
+        List[Dict]: Random ideas with tags (fewer than `count` if not enough match)
+    """
+    has_filters = bool(filters) and any(
+        filters.get(key) for key in PUBLIC_FILTER_KEYS
+    )
+    
+    selected: List[Dict[str, Any]] = []
+    excluded = set()
+    for _ in range(max_attempts):
+        pool = get_filtered_idea_ids(filters) if has_filters else get_all_idea_ids()
+        available = [idea_id for idea_id in pool if idea_id not in excluded] if excluded else pool
+        wanted = min(count - len(selected), len(available))
+        if wanted <= 0:
+            break
+            
+        sample = random.sample(available, wanted)
+        with get_db_cursor() as cursor:
+            if cards:
+                ideas = get_idea_cards_by_ids(cursor, sample)
+            else:
+                cursor.execute(
+                    f"SELECT * FROM ideas WHERE id IN ({','.join(['?'] * len(sample))})",
+                    sample
+                )
+                rows = {row['id']: dict(row) for row in cursor.fetchall()}
+                ideas = [rows[idea_id] for idea_id in sample if idea_id in rows]
+                attach_idea_tags(cursor, ideas)
+            
+        selected.extend(ideas)
+        excluded.update(sample)
+        if len(ideas) == len(sample):
+            break
+            
+        # Some sampled IDs no longer exist; refresh the cached ID list and retry
+        query_cache.invalidate('idea_ids')
+        
+    return selected
+
+
+def get_random_idea(filters: Optional[Dict[str, Any]] = None, cards: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get a random idea from the database.
+    
+    Args:
+        filters: Optional filter parameters to pick within (e.g. one tag facet)
+        cards: Load the idea card instead of the full row
+    
+    Returns:
+        Optional[Dict]: Random idea data with tags, or None if no ideas match
+    """
+    ideas = get_random_ideas(1, filters, cards=cards)
+    return ideas[0] if ideas else None
 
 
 def count_ideas_with_filters(filters: Dict[str, Any]) -> int:
@@ -689,14 +1908,20 @@ def count_ideas_with_filters(filters: Dict[str, Any]) -> int:
     Returns:
         int: Total count of matching ideas
     """
-    # Create a modified version of the filters query for counting
-    temp_filters = filters.copy()
-    temp_filters.pop('limit', None)
-    temp_filters.pop('offset', None)
+    # Count the whole result set, not just what lies past a pagination cursor
+    filters = {key: value for key, value in filters.items() if key != 'cursor'}
     
-    # Get the ideas (inefficient but simple for prototype)
-    ideas = get_ideas_with_filters(temp_filters)
-    return len(ideas)
+    with get_db_cursor() as cursor:
+        filters, candidates = resolve_tag_candidates(cursor, filters)
+        
+        # Pure tag filters are answered by the bitmap index alone
+        if candidates is not None and not any(filters.get(key) for key in ('search', 'date_from', 'date_to')):
+            return candidates.bit_count()
+            
+        use_search_index = bool(filters.get('search')) and has_search_index(cursor)
+        query, params = build_idea_filter_query(filters, "COUNT(*)", use_search_index)
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
 
 
 def delete_idea(idea_id: int) -> bool:
@@ -721,16 +1946,29 @@ def delete_idea(idea_id: int) -> bool:
             
             idea_title = idea[0]
             
+            # Take the write lock, then bring the tag index up to date so
+            # remove_idea below drops exactly the links the index counted
+            bump_data_version(cursor)
+            if TAG_INDEX_ENABLED:
+                tag_bitmap_index.sync(cursor, str(DATABASE_PATH))
+            
             # Delete the idea (CASCADE will handle related records)
             cursor.execute("DELETE FROM ideas WHERE id = ?", (idea_id,))
             
             if cursor.rowcount > 0:
                 logger.info(f"Successfully deleted idea ID {idea_id}: {idea_title}")
-                return True
+                deleted = True
             else:
                 logger.error(f"Failed to delete idea ID {idea_id}")
                 return False
                 
+            cursor.execute("SELECT COALESCE(MAX(rowid), 0) FROM idea_tags")
+            max_link_rowid = cursor.fetchone()[0]
+            
+        tag_bitmap_index.remove_idea(idea_id, max_link_rowid)
+        invalidate_caches()
+        return deleted
+        
     except Exception as e:
         logger.error(f"Error deleting idea ID {idea_id}: {e}")
         return False
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""
+HTTP conditional GET support for read endpoints.
+
+Idea listings, details, filters and stats only change when ideas are
+written, which bumps the shared database data version. The middleware
+derives a strong ETag from that version plus the request's route and
+query, so it can answer `If-None-Match` with 304 Not Modified before the
+handler runs: no database query and no response model is built for a
+client that already has the current representation.
+
+For the hottest routes the serialized response itself is also kept in a
+byte-bounded LRU, so repeated unconditional requests skip SQLite and
+Pydantic as well.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Pattern
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import database
+from .async_db import run_read
+from .cache import ByteLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Set DAILY_INSPO_HTTP_CACHE=0 to disable ETags and Cache-Control headers
+HTTP_CACHE_ENABLED = os.environ.get("DAILY_INSPO_HTTP_CACHE", "1") != "0"
+# Memory for cached response bodies and headers (0 disables the response cache)
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("DAILY_INSPO_RESPONSE_CACHE_BYTES", str(8 * 1024 * 1024)))
+# Upper bound on how long a cached response is served, like query_cache
+RESPONSE_CACHE_TTL = float(os.environ.get("DAILY_INSPO_RESPONSE_CACHE_TTL", str(database.QUERY_CACHE_TTL)))
+
+
+class CachePolicy(NamedTuple):
+    """
+    Caching rules for the routes matching `pattern`.
+
+    `etag_lifetime` bounds how long an ETag stays valid for responses that
+    also depend on the clock (e.g. stats computed over the last 7 days).
+    `cache_body` keeps serialized 200 responses in the response cache.
+    """
+    pattern: Pattern[str]
+    cache_control: str
+    etag_lifetime: Optional[float] = None
+    cache_body: bool = False
+
+
+# First matching policy wins; unmatched routes (random picks, /recent/ which
+# is relative to now, writes) are passed through untouched
+CACHE_POLICIES: List[CachePolicy] = [
+    CachePolicy(re.compile(r"^/api/ideas/stats/$"), "no-cache", etag_lifetime=database.QUERY_CACHE_TTL),
+    CachePolicy(re.compile(r"^/api/ideas/$"), "no-cache", cache_body=True),
+    CachePolicy(re.compile(r"^/api/ideas/search/$"), "no-cache"),
+    # Ideas do not change once generated; clients may reuse them briefly
+    CachePolicy(re.compile(r"^/api/ideas/\d+$"), "max-age=300, must-revalidate", cache_body=True),
+    CachePolicy(re.compile(r"^/api/filters/tags/$"), "max-age=60, must-revalidate", cache_body=True),
+    CachePolicy(re.compile(r"^/api/filters/(?!validate/)"), "max-age=60, must-revalidate"),
+]
+
+# Serialized responses of cache_body routes: (raw headers, body) per path and query.
+# Writers bump the data version; the TTL bounds staleness if one does not.
+response_cache = ByteLRUCache(max_bytes=RESPONSE_CACHE_MAX_BYTES, ttl=RESPONSE_CACHE_TTL)
+database.add_invalidation_hook(response_cache.clear)
+
+
+def match_cache_policy(path: str, policies: Optional[List[CachePolicy]] = None) -> Optional[CachePolicy]:
+    """
+    Find the cache policy for a request path.
+
+    Args:
+        path: Request path
+        policies: Policies to search (defaults to CACHE_POLICIES)
+
+    Returns:
+        Optional[CachePolicy]: First matching policy, or None
+    """
+    for policy in CACHE_POLICIES if policies is None else policies:
+        if policy.pattern.search(path):
+            return policy
+    return None
+
+
+def build_etag(data_version: int, path: str, query_string: str, policy: CachePolicy) -> str:
+    """
+    Build the strong ETag for a response.
+
+    Args:
+        data_version: Current database data version
+        path: Request path
+        query_string: Raw query string
+        policy: Policy of the route
+
+    Returns:
+        str: Quoted ETag value
+    """
+    key = f"{data_version}:{path}?{query_string}"
+    if policy.etag_lifetime:
+        key += f":{int(time.time() // policy.etag_lifetime)}"
+    return '"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    '*' is not matched here: it only applies when the resource exists,
+    which is not known until the handler has run.
+
+    Args:
+        if_none_match: Header value, possibly a comma-separated list
+        etag: Current quoted ETag
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        if candidate.strip().removeprefix('W/') == etag:
+            return True
+    return False
+
+
+_stats = {'not_modified': 0, 'full_responses': 0}
+
+
+async def get_current_data_version() -> int:
+    """
+    Get the data version, re-read from the database at most once a second.
+
+    Returns:
+        int: Current data version
+    """
+    return await run_read(database.query_cache.current_version)
+
+
+class ConditionalGetMiddleware:
+    """
+    ASGI middleware adding ETag/Cache-Control headers and 304 responses.
+
+    Only GET and HEAD requests on routes with a CachePolicy are handled;
+    ETag and Cache-Control are added to their 200 responses only.
+    """
+
+    def __init__(self, app: ASGIApp, policies: Optional[List[CachePolicy]] = None,
+                 version_provider: Callable[[], Awaitable[int]] = get_current_data_version):
+        self.app = app
+        self.policies = policies
+        self.version_provider = version_provider
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD') or not HTTP_CACHE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        policy = match_cache_policy(scope['path'], self.policies)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        # The version is read before the handler runs, so a body is never
+        # older than the ETag it is sent with
+        data_version = await self.version_provider()
+        etag = build_etag(data_version, scope['path'], scope['query_string'].decode('latin-1'), policy)
+
+        not_modified_headers = [(b'etag', etag.encode('ascii')),
+                                (b'cache-control', policy.cache_control.encode('ascii'))]
+        if_none_match = Headers(scope=scope).get('if-none-match')
+        if etag_matches(if_none_match, etag):
+            _stats['not_modified'] += 1
+            await send({'type': 'http.response.start', 'status': 304, 'headers': not_modified_headers})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        # "If-None-Match: *" means "any current representation": answer 304
+        # once a 200 shows the resource exists, pass errors (404) through
+        wildcard = if_none_match is not None and if_none_match.strip() == '*'
+
+        cache_key = (scope['path'], scope['query_string'])
+        cache_body = policy.cache_body and scope['method'] == 'GET'
+        if cache_body:
+            cached = response_cache.get(cache_key, data_version)
+            if cached is not None:
+                headers, body = cached
+                if wildcard:
+                    _stats['not_modified'] += 1
+                    headers, body, status = not_modified_headers, b'', 304
+                else:
+                    status = 200
+                await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+                await send({'type': 'http.response.body', 'body': body})
+                return
+
+        start_message: Optional[Message] = None
+        chunks: List[bytes] = []
+        suppress_body = False
+
+        async def send_with_cache_headers(message: Message) -> None:
+            nonlocal start_message, suppress_body
+            if message['type'] == 'http.response.start' and message['status'] == 200 and wildcard:
+                _stats['not_modified'] += 1
+                suppress_body = True
+                message = {'type': 'http.response.start', 'status': 304, 'headers': not_modified_headers}
+            elif message['type'] == 'http.response.start' and message['status'] == 200:
+                headers = MutableHeaders(scope=message)
+                headers['ETag'] = etag
+                headers['Cache-Control'] = policy.cache_control
+                if cache_body:
+                    start_message = message
+            elif message['type'] == 'http.response.body' and suppress_body:
+                if message.get('more_body', False):
+                    return
+                message = {'type': 'http.response.body', 'body': b''}
+            elif message['type'] == 'http.response.body' and start_message is not None:
+                chunks.append(message.get('body', b''))
+                if not message.get('more_body', False):
+                    body = b''.join(chunks)
+                    headers = list(start_message['headers'])
+                    size = len(body) + sum(len(name) + len(value) for name, value in headers)
+                    response_cache.put(cache_key, data_version, (headers, body), size)
+            await send(message)
+
+        _stats['full_responses'] += 1
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+def get_http_cache_stats() -> Dict[str, Any]:
+    """
+    Get conditional request counters.
+
+    Returns:
+        Dict[str, Any]: 304 and full response counts on cacheable routes,
+        and response cache counters
+    """
+    return {'enabled': HTTP_CACHE_ENABLED, **_stats, 'response_cache': response_cache.stats()}
@@ -6,16 +6,25 @@ Handles idea retrieval, filtering, and detailed view requests.
 """
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from typing import List, Optional
+import asyncio
 import logging
 from pathlib import Path
 
-from .database import validate_database_schema
+from .database import (
+    get_idea_by_id, validate_database_schema, close_connection_pool, initialize_database,
+    run_database_maintenance, DATABASE_MAINTENANCE_INTERVAL
+)
+from .async_db import run_read, shutdown_executors, get_executor_stats, database_maintenance_loop
+from .http_cache import ConditionalGetMiddleware, get_http_cache_stats
+from .compression import CompressionMiddleware, get_compression_stats
+from .static_assets import PrecompressedStaticFiles
+from .pages import render_homepage, render_idea_page
+from .responses import dump_trusted_json, get_default_response_class
 from .models import IdeaResponse, FilterParams
-from .api.ideas import router as ideas_router
+from .api.ideas import router as ideas_router, build_idea_response
 from .api.filters import router as filters_router
 from .api.projects import router as projects_router
 from .api.chat import router as chat_router
@@ -23,11 +32,17 @@ from .api.chat import router as chat_router
 app = FastAPI(
     title="Daily Inspo API",
     description="Automated app idea generation and management system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=get_default_response_class()
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Answer conditional GETs on read endpoints with 304 when data is unchanged
+app.add_middleware(ConditionalGetMiddleware)
+# Compress outside the conditional GET layer so cached bodies stay identity-encoded
+app.add_middleware(CompressionMiddleware)
+
+# Mount static files (precompressed siblings are built by scripts/build_static_assets.py)
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 
 # Setup templates
 templates = Jinja2Templates(directory="templates")
@@ -48,9 +63,7 @@ async def serve_homepage(request: Request):
         HTMLResponse: Main application interface
     """
     try:
-        with open("static/index.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
-        return HTMLResponse(content=html_content)
+        return HTMLResponse(content=render_homepage())
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Homepage not found")
 
@@ -66,21 +79,41 @@ async def serve_idea_detail(request: Request, idea_id: int):
     Returns:
         HTMLResponse: Detailed idea view page
     """
-    # For now, redirect to homepage with modal trigger
-    # In a full implementation, this could render a server-side page
+    # The homepage with the idea's modal opened on load; its data is
+    # inlined so the modal does not have to fetch it
+    idea = idea_json = None
     try:
-        with open("static/index.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
-        # Add JavaScript to auto-open the idea modal
-        html_content = html_content.replace(
-            "</body>",
-            f"<script>window.addEventListener('load', () => {{ window.dailyInspoApp?.showIdeaModal({idea_id}); }});</script></body>"
-        )
-        return HTMLResponse(content=html_content)
+        idea = await run_read(get_idea_by_id, idea_id)
+        if idea:
+            idea_json = dump_trusted_json(build_idea_response(idea))
+    except Exception as e:
+        # The page still works without inline data; the modal fetches it
+        logger = logging.getLogger(__name__)
+        logger.warning(f"Could not inline idea {idea_id}: {str(e)}")
+        idea = None
+    
+    try:
+        return HTMLResponse(content=render_idea_page(idea_id, idea, idea_json))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Page not found")
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """
+    Report database executor, write queue, HTTP cache and compression metrics.
+    
+    Returns:
+        dict: Reader/writer call counters, write queue depth and batching,
+        conditional GET counters and compression ratios
+    """
+    return {
+        "database": get_executor_stats(),
+        "http_cache": get_http_cache_stats(),
+        "compression": get_compression_stats()
+    }
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -89,12 +122,22 @@ async def startup_event():
     """
     logger = logging.getLogger(__name__)
     
+    # Apply pending schema migrations (the same runner as scripts/migrate.py)
+    initialize_database()
+    
     # Validate database schema
     if not validate_database_schema():
         logger.warning("Database schema validation failed - some features may not work")
     else:
         logger.info("Database schema validation successful")
         
+    # Checkpoint the WAL and refresh planner statistics in the background
+    app.state.maintenance_task = None
+    if DATABASE_MAINTENANCE_INTERVAL > 0:
+        app.state.maintenance_task = asyncio.create_task(
+            database_maintenance_loop(DATABASE_MAINTENANCE_INTERVAL)
+        )
+        
     logger.info("Daily Inspo application started successfully")
 
 
@@ -105,7 +148,20 @@ async def shutdown_event():
     """
     logger = logging.getLogger(__name__)
     logger.info("Daily Inspo application shutting down")
-    # No specific cleanup needed for SQLite connections
+    
+    maintenance_task = getattr(app.state, "maintenance_task", None)
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+    
+    # Let queued database calls finish, then close pooled SQLite connections
+    shutdown_executors()
+    close_connection_pool()
+    
+    # Fold the WAL back into the database file so the next start opens a small WAL
+    try:
+        run_database_maintenance("TRUNCATE")
+    except Exception as e:
+        logger.warning(f"Final database checkpoint failed: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,330 @@
+"""
+Versioned schema migrations.
+
+The schema version is stored in SQLite's `PRAGMA user_version`. Each
+migration step has a version number; run_migrations() applies every step
+newer than the database's version, in order, and records the version
+after each one so an interrupted run resumes where it stopped.
+
+Steps must be safe to re-run. Schema changes run in one short write
+transaction together with the version bump; data backfills go through
+backfill_in_batches(), which commits every batch so the write lock is
+only held briefly and other writers (the generator, API requests) can
+interleave.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, NamedTuple, Optional, Sequence
+
+from . import database
+
+logger = logging.getLogger(__name__)
+
+# Rows updated per backfill transaction
+MIGRATION_BACKFILL_BATCH_SIZE = int(os.environ.get("DAILY_INSPO_MIGRATION_BATCH_SIZE", "500"))
+# Pause between backfill batches, giving other writers a turn at the lock
+MIGRATION_BACKFILL_PAUSE = float(os.environ.get("DAILY_INSPO_MIGRATION_BATCH_PAUSE_SECONDS", "0.01"))
+
+
+class Migration(NamedTuple):
+    """
+    One ordered schema migration step.
+
+    `apply` receives a connection in autocommit mode and manages its own
+    transactions; `transactional` steps are instead wrapped, together with
+    the version bump, in a single BEGIN IMMEDIATE transaction.
+    """
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+    transactional: bool = True
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, description: str, transactional: bool = True) -> Callable:
+    """
+    Register a function as the migration step for `version`.
+
+    Args:
+        version: Schema version the step upgrades to
+        description: Short description shown by scripts/migrate.py
+        transactional: Run the step and version bump in one transaction
+
+    Returns:
+        Callable: Decorator registering the step
+    """
+    def register(func: Callable[[sqlite3.Connection], None]) -> Callable[[sqlite3.Connection], None]:
+        if any(step.version == version for step in MIGRATIONS):
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS.append(Migration(version, description, func, transactional))
+        MIGRATIONS.sort(key=lambda step: step.version)
+        return func
+    return register
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """
+    Read the schema version recorded in the database.
+
+    Args:
+        conn: Open database connection
+
+    Returns:
+        int: Current `PRAGMA user_version`
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def get_latest_version() -> int:
+    """
+    Get the schema version the registered migrations upgrade to.
+
+    Returns:
+        int: Highest registered migration version
+    """
+    return MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def get_pending_migrations(conn: sqlite3.Connection) -> List[Migration]:
+    """
+    List the migration steps not yet applied to the database.
+
+    Args:
+        conn: Open database connection
+
+    Returns:
+        List[Migration]: Pending steps in the order they will run
+    """
+    current = get_schema_version(conn)
+    return [step for step in MIGRATIONS if step.version > current]
+
+
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection):
+    """
+    Run a block in a BEGIN IMMEDIATE transaction on an autocommit connection.
+
+    Args:
+        conn: Connection with isolation_level=None
+
+    Yields:
+        sqlite3.Connection: The same connection, holding the write lock
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _set_schema_version(conn: sqlite3.Connection, version: int) -> None:
+    # PRAGMA arguments cannot be bound as parameters
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def backfill_in_batches(conn: sqlite3.Connection, select_sql: str, update_sql: str,
+                        transform: Optional[Callable[[sqlite3.Row], Sequence]] = None,
+                        batch_size: Optional[int] = None) -> int:
+    """
+    Update rows in short transactions of at most `batch_size` rows.
+
+    `select_sql` must return the rows still needing the backfill, ordered by
+    a key, and take two parameters: the last key seen and the batch size
+    (e.g. `WHERE id > ? AND col IS NULL ORDER BY id LIMIT ?`). The key is
+    the row's first column. Each batch is read and written with
+    `executemany(update_sql, ...)` in one short transaction, so concurrent
+    writes cannot slip in between, the write lock is released between
+    batches, and the backfill resumes where it stopped after an
+    interruption.
+
+    Args:
+        conn: Connection in autocommit mode (isolation_level=None)
+        select_sql: Keyset-paginated query for rows to update
+        update_sql: Parameterized UPDATE statement
+        transform: Maps a selected row to the UPDATE parameters
+            (defaults to the row's columns rotated so the key comes last)
+        batch_size: Rows per transaction
+
+    Returns:
+        int: Number of rows updated
+    """
+    batch_size = batch_size or MIGRATION_BACKFILL_BATCH_SIZE
+    transform = transform or (lambda row: tuple(row[1:]) + (row[0],))
+    last_key = None
+    updated = 0
+
+    while True:
+        with immediate_transaction(conn):
+            rows = conn.execute(select_sql, (last_key if last_key is not None else -1, batch_size)).fetchall()
+            if rows:
+                conn.executemany(update_sql, [transform(row) for row in rows])
+        if not rows:
+            break
+
+        updated += len(rows)
+        last_key = rows[-1][0]
+        if len(rows) < batch_size:
+            break
+        time.sleep(MIGRATION_BACKFILL_PAUSE)
+
+    return updated
+
+
+def run_migrations(dry_run: bool = False, target_version: Optional[int] = None) -> List[Migration]:
+    """
+    Bring the database schema up to date.
+
+    Args:
+        dry_run: Only report the pending steps, without applying them
+        target_version: Stop after this version (defaults to the latest)
+
+    Returns:
+        List[Migration]: Steps that were applied (or would be, on a dry run)
+    """
+    conn = database.get_db_connection()
+    conn.isolation_level = None  # Steps manage their transactions explicitly
+    try:
+        pending = [
+            step for step in get_pending_migrations(conn)
+            if target_version is None or step.version <= target_version
+        ]
+        if dry_run or not pending:
+            return pending
+
+        applied = []
+        for step in pending:
+            started = time.perf_counter()
+            logger.info(f"Applying migration {step.version}: {step.description}")
+
+            if step.transactional:
+                with immediate_transaction(conn):
+                    # Another process may have applied it while we waited for the lock
+                    if get_schema_version(conn) >= step.version:
+                        continue
+                    step.apply(conn)
+                    _set_schema_version(conn, step.version)
+            else:
+                step.apply(conn)
+                _set_schema_version(conn, step.version)
+
+            applied.append(step)
+            logger.info(f"Migration {step.version} applied in {time.perf_counter() - started:.2f}s")
+
+        if applied:
+            database.invalidate_caches()
+        return applied
+    finally:
+        conn.close()
+
+
+def _execute_all(conn: sqlite3.Connection, statements: Iterable[str]) -> None:
+    for statement in statements:
+        conn.execute(statement)
+
+
+@migration(1, "Baseline schema: tables, indexes and full-text search", transactional=False)
+def _baseline_schema(conn: sqlite3.Connection) -> None:
+    # Databases created before versioning already have most of this; every
+    # statement is IF NOT EXISTS, so the baseline only fills in what is missing
+    database.create_tables()
+    database.create_indexes()
+    database.create_search_index()
+
+
+@migration(2, "Index chat messages by session and timestamp")
+def _chat_messages_session_timestamp(conn: sqlite3.Connection) -> None:
+    # Serves the per-session message listing and "last message" lookups without
+    # a sort; it also covers session_id lookups, so the old index is redundant
+    _execute_all(conn, [
+        "CREATE INDEX IF NOT EXISTS idx_chat_messages_session_timestamp "
+        "ON chat_messages(session_id, timestamp)",
+        "DROP INDEX IF EXISTS idx_chat_messages_session_id",
+    ])
+
+
+@migration(3, "Materialized idea_cards table kept current by triggers", transactional=False)
+def _idea_cards_table(conn: sqlite3.Connection) -> None:
+    # Clustered on the listing order, so a card page is a single range scan;
+    # generated_date is part of the key and cannot be NULL
+    card_summary = database.CARD_SUMMARY_SQL.format(summary='new.summary')
+    tags_json = database.IDEA_TAGS_JSON_SQL
+    with immediate_transaction(conn):
+        _execute_all(conn, [
+            """
+            CREATE TABLE IF NOT EXISTS idea_cards (
+                id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                card_summary TEXT NOT NULL,
+                tags_json TEXT NOT NULL DEFAULT '[]',
+                generated_date DATETIME NOT NULL,
+                PRIMARY KEY (generated_date DESC, id)
+            ) WITHOUT ROWID
+            """,
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_idea_cards_id ON idea_cards(id)",
+            f"""
+            CREATE TRIGGER IF NOT EXISTS idea_cards_ideas_ai AFTER INSERT ON ideas BEGIN
+                INSERT OR REPLACE INTO idea_cards (id, title, card_summary, tags_json, generated_date)
+                VALUES (new.id, new.title, {card_summary}, '[]', COALESCE(new.generated_date, ''));
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS idea_cards_ideas_au
+            AFTER UPDATE OF title, summary, generated_date ON ideas BEGIN
+                UPDATE idea_cards
+                SET title = new.title, card_summary = {card_summary},
+                    generated_date = COALESCE(new.generated_date, '')
+                WHERE id = new.id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS idea_cards_ideas_ad AFTER DELETE ON ideas BEGIN
+                DELETE FROM idea_cards WHERE id = old.id;
+            END
+            """,
+            # Appending keeps tag writes O(1) per link; removals recompute the list
+            """
+            CREATE TRIGGER IF NOT EXISTS idea_cards_idea_tags_ai AFTER INSERT ON idea_tags BEGIN
+                UPDATE idea_cards
+                SET tags_json = json_insert(tags_json, '$[#]', json((
+                    SELECT json_object('category', category, 'value', value) FROM tags WHERE id = new.tag_id
+                )))
+                WHERE id = new.idea_id;
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS idea_cards_idea_tags_ad AFTER DELETE ON idea_tags BEGIN
+                UPDATE idea_cards SET tags_json = {tags_json.format(idea_id='old.idea_id')}
+                WHERE id = old.idea_id;
+            END
+            """,
+            # resolve_tag_ids upserts rewrite tags rows unchanged; only real renames matter
+            f"""
+            CREATE TRIGGER IF NOT EXISTS idea_cards_tags_au AFTER UPDATE OF category, value ON tags
+            WHEN old.category IS NOT new.category OR old.value IS NOT new.value BEGIN
+                UPDATE idea_cards SET tags_json = {tags_json.format(idea_id='idea_cards.id')}
+                WHERE id IN (SELECT idea_id FROM idea_tags WHERE tag_id = new.id);
+            END
+            """,
+        ])
+
+    backfill_in_batches(
+        conn,
+        f"""
+        SELECT i.id, i.title, {database.CARD_SUMMARY_SQL.format(summary='i.summary')},
+               {tags_json.format(idea_id='i.id')}, COALESCE(i.generated_date, '')
+        FROM ideas i
+        WHERE i.id > ? AND NOT EXISTS (SELECT 1 FROM idea_cards c WHERE c.id = i.id)
+        ORDER BY i.id LIMIT ?
+        """,
+        "INSERT OR IGNORE INTO idea_cards (id, title, card_summary, tags_json, generated_date) "
+        "VALUES (?, ?, ?, ?, ?)",
+        transform=tuple,
+    )
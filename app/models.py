@@ -73,6 +73,22 @@ class IdeaCardResponse(BaseModel):
     generated_date: datetime = Field(..., description="Generation date")
 
 
+class IdeaBatchRequest(BaseModel):
+    """Request body for fetching several ideas at once."""
+    ids: List[int] = Field(..., min_length=1, max_length=100, description="Idea identifiers (at most 100)")
+
+
+class IdeaBulkRequest(BaseModel):
+    """Request body for importing many ideas in one transaction."""
+    ideas: List[IdeaCreate] = Field(..., min_length=1, max_length=10000, description="Ideas to insert (at most 10000)")
+
+
+class IdeaBulkResponse(BaseModel):
+    """Result of a bulk idea import."""
+    inserted_count: int = Field(..., description="Number of ideas inserted")
+    ids: List[int] = Field(..., description="IDs of the inserted ideas, in request order")
+
+
 class FilterParams(BaseModel):
     """Model for filtering and search parameters."""
     search: Optional[str] = Field(None, description="Text search query")
@@ -82,8 +98,10 @@ class FilterParams(BaseModel):
     technology: Optional[List[str]] = Field(None, description="Technology filter")
     date_from: Optional[datetime] = Field(None, description="Filter ideas from this date")
     date_to: Optional[datetime] = Field(None, description="Filter ideas to this date")
+    sort: Optional[str] = Field("date", description="Result order: 'date' or 'relevance'")
     limit: Optional[int] = Field(50, description="Maximum results to return")
     offset: Optional[int] = Field(0, description="Results offset for pagination")
+    cursor: Optional[str] = Field(None, description="Pagination cursor from a previous page (replaces offset)")
 
 
 class FilteredIdeasResponse(BaseModel):
@@ -91,6 +109,7 @@ class FilteredIdeasResponse(BaseModel):
     ideas: List[IdeaCardResponse] = Field(..., description="Filtered ideas")
     total_count: int = Field(..., description="Total matching ideas")
     has_more: bool = Field(..., description="Whether more results exist")
+    next_cursor: Optional[str] = Field(None, description="Cursor for fetching the next page")
 
 
 class TagSummary(BaseModel):
@@ -100,6 +119,24 @@ class TagSummary(BaseModel):
     count: int = Field(..., description="Number of ideas with this tag category")
 
 
+class FacetValue(BaseModel):
+    """Tag value with the number of ideas it would match."""
+    value: str = Field(..., description="Tag value")
+    count: int = Field(..., description="Matching ideas given the other applied filters")
+
+
+class Facet(BaseModel):
+    """Filter facet for one tag category."""
+    category: str = Field(..., description="Tag category")
+    values: List[FacetValue] = Field(..., description="Values with conditional idea counts")
+
+
+class FacetsResponse(BaseModel):
+    """All filter facets for the sidebar in one response."""
+    facets: List[Facet] = Field(..., description="Facets by category")
+    total_count: int = Field(..., description="Ideas matching all applied filters")
+
+
 class SystemStatus(BaseModel):
     """System status information."""
     total_ideas: int = Field(..., description="Total ideas in system")
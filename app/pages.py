@@ -0,0 +1,167 @@
+"""
+HTML pages served by the application.
+
+The homepage and the per-idea pages are all built from static/index.html.
+The template is read once and kept in memory as pre-encoded byte segments
+split around the <title> text and </body>. It is reloaded when the file's
+mtime or size changes, or when a static asset build changes the hashed
+asset URLs.
+
+A per-idea page joins those segments with a few small idea-specific ones:
+the idea's title and summary go into <title> and a meta description, and
+the idea's detail JSON is inlined so the modal opens without fetching it.
+"""
+
+import html
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .static_assets import STATIC_DIRECTORY, load_asset_manifest, rewrite_asset_urls
+
+logger = logging.getLogger(__name__)
+
+INDEX_TEMPLATE_PATH = STATIC_DIRECTORY / "index.html"
+SITE_NAME = "Daily Inspo"
+
+
+class PageSegments(NamedTuple):
+    """
+    A page template split into UTF-8 byte segments.
+
+    `head + title + b"</title>" + middle + tail` is the original page:
+    `head` ends with `<title>`, `title` is the default title text, `middle`
+    runs from after `</title>` up to `</body>` and `tail` starts at
+    `</body>`. Without a <title>, `head` is empty, `title` is None and
+    `middle` starts at the beginning of the page.
+    """
+    head: bytes
+    title: Optional[bytes]
+    middle: bytes
+    tail: bytes
+    page: bytes
+
+
+def split_page(source: str) -> PageSegments:
+    """
+    Split a page into the segments idea pages are assembled from.
+
+    Args:
+        source: HTML document
+
+    Returns:
+        PageSegments: Encoded segments; a page without </body> gets an
+        empty tail
+    """
+    title_start = source.find('<title>')
+    title_end = source.find('</title>', title_start)
+    if title_start == -1 or title_end == -1:
+        head, title, middle_start = '', None, 0
+    else:
+        title_start += len('<title>')
+        head, title = source[:title_start], source[title_start:title_end].encode('utf-8')
+        middle_start = title_end + len('</title>')
+
+    body_end = source.rfind('</body>')
+    if body_end < middle_start:
+        body_end = len(source)
+
+    return PageSegments(
+        head=head.encode('utf-8'),
+        title=title,
+        middle=source[middle_start:body_end].encode('utf-8'),
+        tail=source[body_end:].encode('utf-8'),
+        page=source.encode('utf-8'),
+    )
+
+
+class PageTemplate:
+    """
+    In-memory copy of a page template, reloaded when the file changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[int, int, Dict[str, str]]] = None
+        self._segments: Optional[PageSegments] = None
+        self.loads = 0
+
+    def get(self) -> PageSegments:
+        """
+        Get the current segments, reading the file only if it changed.
+
+        Returns:
+            PageSegments: Template segments
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        stat_result = os.stat(self.path)
+        key = (stat_result.st_mtime_ns, stat_result.st_size, load_asset_manifest())
+        segments = self._segments
+        if segments is not None and self._key == key:
+            return segments
+
+        with self._lock:
+            if self._segments is None or self._key != key:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._segments = split_page(rewrite_asset_urls(f.read()))
+                self._key = key
+                self.loads += 1
+                logger.info(f"Loaded page template {self.path}")
+            return self._segments
+
+
+index_template = PageTemplate(INDEX_TEMPLATE_PATH)
+
+
+def render_homepage() -> bytes:
+    """
+    Render the homepage.
+
+    Returns:
+        bytes: Encoded page
+    """
+    return index_template.get().page
+
+
+def render_idea_page(idea_id: int, idea: Optional[Dict[str, Any]] = None,
+                     idea_json: Optional[bytes] = None) -> bytes:
+    """
+    Render the homepage with an idea's modal opened on load.
+
+    Args:
+        idea_id: Idea to open
+        idea: Idea row, used for the page title and description
+        idea_json: Serialized idea detail response to inline, if available
+
+    Returns:
+        bytes: Encoded page
+    """
+    segments = index_template.get()
+    parts = [segments.head]
+    if segments.title is not None:
+        if idea is not None:
+            parts.append(html.escape(f"{idea['title']} - {SITE_NAME}").encode('utf-8'))
+            parts.append(b'</title>\n    <meta name="description" content="')
+            parts.append(html.escape(idea['summary']).encode('utf-8'))
+            parts.append(b'">')
+        else:
+            parts.append(segments.title)
+            parts.append(b'</title>')
+    parts.append(segments.middle)
+
+    parts.append(b'<script>')
+    if idea_json is not None:
+        # "<" only occurs inside JSON strings, where \u003c is equivalent;
+        # this keeps "</script>" in the data from closing the tag
+        parts.append(b'window.dailyInspoInitialIdea = ' + idea_json.replace(b'<', b'\\u003c') + b';')
+    parts.append(
+        f"window.addEventListener('load', () => {{ window.dailyInspoApp?.showIdeaModal({idea_id}, "
+        f"window.dailyInspoInitialIdea); }});</script>".encode('utf-8')
+    )
+    parts.append(segments.tail)
+    return b''.join(parts)
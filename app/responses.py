@@ -0,0 +1,94 @@
+"""
+Fast JSON response helpers.
+
+FastAPI's default path takes a model the handler already validated,
+validates it again against the route's response_model, dumps it to a dict
+and encodes that with the stdlib json module. Two faster paths are
+provided:
+
+- get_default_response_class() returns ORJSONResponse, for routes that
+  keep the default path. orjson is in requirements.txt; without it the
+  stdlib encoder is used.
+- trusted_json_response() serializes response models built from rows we
+  read from our own database straight to JSON bytes with pydantic-core,
+  skipping the second validation and the dict round trip.
+
+The models themselves are still built with their normal constructors:
+with pydantic 2 validating a row in pydantic-core is faster than
+model_construct(), which runs in Python (see the `serialization`
+benchmark in scripts/benchmark.py).
+"""
+
+import functools
+import logging
+import os
+from typing import List, Mapping, Optional, Sequence, Type, Union
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to JSONResponse
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Set DAILY_INSPO_FAST_JSON=0 to keep the stdlib JSON encoder
+FAST_JSON_ENABLED = os.environ.get("DAILY_INSPO_FAST_JSON", "1") != "0"
+
+
+def get_default_response_class() -> Type[JSONResponse]:
+    """
+    Pick the application's default JSON response class.
+
+    Returns:
+        Type[JSONResponse]: ORJSONResponse when enabled and orjson is
+        installed, JSONResponse otherwise
+    """
+    if FAST_JSON_ENABLED and orjson is not None:
+        return ORJSONResponse
+    if FAST_JSON_ENABLED:
+        logger.info("orjson is not installed; using the standard JSON encoder")
+    return JSONResponse
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def dump_trusted_json(content: Union[BaseModel, Sequence[BaseModel]]) -> bytes:
+    """
+    Serialize trusted models to JSON bytes without validating them again.
+
+    Args:
+        content: A model, or a list of models of one type
+
+    Returns:
+        bytes: JSON document
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if content:
+        return _list_adapter(type(content[0])).dump_json(content)
+    return b"[]"
+
+
+def trusted_json_response(content: Union[BaseModel, Sequence[BaseModel]],
+                          headers: Optional[Mapping[str, str]] = None) -> Response:
+    """
+    Serialize trusted models without validating them again.
+
+    Only pass models built from our own database rows; nothing is checked
+    against the route's response_model, which is bypassed by returning a
+    Response and stays in place for the OpenAPI schema.
+
+    Args:
+        content: A model, or a list of models of one type
+        headers: Extra response headers
+
+    Returns:
+        Response: application/json response with the serialized body
+    """
+    return Response(content=dump_trusted_json(content), media_type="application/json", headers=headers)
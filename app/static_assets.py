@@ -0,0 +1,187 @@
+"""
+Fingerprinted, precompressed static assets.
+
+build_static_assets() (run by scripts/build_static_assets.py) copies every
+asset under static/ to static/dist/ with a content hash in its filename,
+writes `.gz` (and `.br`, when brotli is installed) siblings next to each
+copy, and records the logical-to-hashed mapping in static/dist/manifest.json.
+
+PrecompressedStaticFiles serves a sibling by content negotiation.
+Responses for hashed files are cached by clients for a year, since their
+URL changes whenever their content does; rewrite_asset_urls() points the
+HTML pages at the hashed URLs. Without a build everything is served from
+the original files as before.
+"""
+
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from .compression import SUPPORTED_ENCODINGS, compress_body, negotiate_encoding
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIRECTORY = Path("static")
+STATIC_URL_PREFIX = "/static/"
+# Build output, relative to the static directory
+DIST_DIRECTORY = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# index.html is rendered by the application, not served from /static
+ASSET_SUFFIXES = frozenset({'.css', '.js', '.svg', '.json', '.txt'})
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ASSET_HASH_LENGTH = 8
+
+_manifest_cache: Tuple[Optional[float], Dict[str, str]] = (None, {})
+
+
+def iter_source_assets(directory: Path) -> List[Path]:
+    """
+    List the assets to fingerprint, skipping build output.
+
+    Args:
+        directory: Static directory
+
+    Returns:
+        List[Path]: Asset paths, sorted
+    """
+    dist = directory / DIST_DIRECTORY
+    return sorted(
+        path for path in directory.rglob('*')
+        if path.is_file() and path.suffix in ASSET_SUFFIXES and dist not in path.parents
+    )
+
+
+def build_static_assets(directory: Path = STATIC_DIRECTORY) -> Dict[str, str]:
+    """
+    Write hashed copies of static assets with precompressed siblings.
+
+    The previous build output is replaced.
+
+    Args:
+        directory: Static directory
+
+    Returns:
+        Dict[str, str]: Manifest mapping asset paths to hashed paths, both
+        relative to the static directory
+    """
+    dist = directory / DIST_DIRECTORY
+    staging = directory / f".{DIST_DIRECTORY}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    manifest = {}
+    for source in iter_source_assets(directory):
+        relative = source.relative_to(directory)
+        content = source.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()[:ASSET_HASH_LENGTH]
+        hashed = relative.with_name(f"{relative.stem}.{digest}{relative.suffix}")
+
+        target = staging / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        for encoding in SUPPORTED_ENCODINGS:
+            compressed = compress_body(content, encoding, static=True)
+            target.with_name(target.name + ENCODING_SUFFIXES[encoding]).write_bytes(compressed)
+
+        manifest[relative.as_posix()] = f"{DIST_DIRECTORY}/{hashed.as_posix()}"
+
+    (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    shutil.rmtree(dist, ignore_errors=True)
+    staging.rename(dist)
+    logger.info(f"Built {len(manifest)} static assets into {dist}")
+    return manifest
+
+
+def load_asset_manifest(directory: Path = STATIC_DIRECTORY) -> Dict[str, str]:
+    """
+    Load the build manifest, re-reading it only when the file changes.
+
+    Args:
+        directory: Static directory
+
+    Returns:
+        Dict[str, str]: Asset paths to hashed paths; empty without a build
+    """
+    global _manifest_cache
+    path = directory / DIST_DIRECTORY / MANIFEST_NAME
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+
+    cached_mtime, manifest = _manifest_cache
+    if cached_mtime != mtime:
+        try:
+            manifest = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read static asset manifest: {str(e)}")
+            manifest = {}
+        _manifest_cache = (mtime, manifest)
+    return manifest
+
+
+def rewrite_asset_urls(html: str, directory: Path = STATIC_DIRECTORY) -> str:
+    """
+    Point asset URLs in an HTML page at their hashed copies.
+
+    Args:
+        html: Page source referencing /static/<path> URLs
+        directory: Static directory
+
+    Returns:
+        str: Page source with hashed URLs for every built asset
+    """
+    for asset, hashed in load_asset_manifest(directory).items():
+        html = html.replace(f'"{STATIC_URL_PREFIX}{asset}"', f'"{STATIC_URL_PREFIX}{hashed}"')
+    return html
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles serving `.br`/`.gz` siblings by content negotiation.
+
+    A sibling is an independent file with its own ETag, so 304 handling
+    keeps working per encoding. Files under the build directory get a
+    long-lived immutable Cache-Control.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = str(full_path)
+        headers = {}
+        if f"{os.sep}{DIST_DIRECTORY}{os.sep}" in full_path:
+            headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+
+        available = [encoding for encoding in SUPPORTED_ENCODINGS
+                     if os.path.isfile(full_path + ENCODING_SUFFIXES[encoding])]
+        encoding = negotiate_encoding(request_headers.get('accept-encoding'), available)
+        if available:
+            headers['Vary'] = 'Accept-Encoding'
+
+        if encoding is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result,
+                                    method=scope['method'], headers=headers)
+        else:
+            encoded_path = full_path + ENCODING_SUFFIXES[encoding]
+            headers['Content-Encoding'] = encoding
+            response = FileResponse(encoded_path, status_code=status_code, stat_result=os.stat(encoded_path),
+                                    method=scope['method'], headers=headers,
+                                    media_type=mimetypes.guess_type(full_path)[0] or 'text/plain')
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
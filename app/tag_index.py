@@ -0,0 +1,311 @@
+"""
+In-memory tag bitmap index.
+
+Keeps one bitset per (category, value) tag, with bit N set when idea N
+carries the tag. Bitsets are Python integers, so intersections, unions and
+population counts run in C over machine words, giving instant faceted
+filtering and per-facet counts without touching SQLite.
+"""
+
+import sqlite3
+import logging
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Tag categories exposed as filter facets
+FACET_CATEGORIES = ('industry', 'target_market', 'complexity', 'technology')
+
+
+def bitmap_to_ids(bitmap: int, descending: bool = False) -> List[int]:
+    """
+    Expand a bitset into the sorted list of idea IDs it contains.
+
+    Args:
+        bitmap: Bitset with bit N set for idea N
+        descending: Return highest IDs first
+
+    Returns:
+        List[int]: Idea IDs
+    """
+    bits = bin(bitmap)[:1:-1]  # Least significant bit first, without '0b'
+    ids = []
+    position = bits.find('1')
+    while position != -1:
+        ids.append(position)
+        position = bits.find('1', position + 1)
+    if descending:
+        ids.reverse()
+    return ids
+
+
+def ids_to_bitmap(ids: Iterable[int]) -> int:
+    """
+    Build a bitset from idea IDs in a single pass.
+
+    Args:
+        ids: Idea IDs to set
+
+    Returns:
+        int: Bitset with bit N set for every idea N in `ids`
+    """
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for idea_id in ids:
+        buffer[idea_id >> 3] |= 1 << (idea_id & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+class TagBitmapIndex:
+    """
+    Process-wide bitmap index over tags/idea_tags.
+
+    The index is built lazily and kept current three ways: write hooks in
+    this process update it directly, sync() pulls rows added by other
+    processes (the generator) using the ideas id and idea_tags rowid
+    high-water marks, and a periodic full rebuild is the backstop.
+
+    idea_tags has no AUTOINCREMENT key, so SQLite reuses the rowids of its
+    newest rows once they are deleted and the rowid mark alone can miss new
+    links. sync() therefore also loads the links of new ideas by idea id.
+    It also tracks how many ideas and links it has loaded, and rebuilds the
+    index when either count does not add up (deletions made elsewhere).
+    Rows written by add_tags are only counted by the next sync, so deleters
+    in this process sync under their write lock before calling remove_idea.
+    """
+
+    def __init__(self, full_refresh_interval: float = 300.0):
+        self.full_refresh_interval = full_refresh_interval
+        self._lock = threading.RLock()
+        self._bitmaps: Dict[Tuple[str, str], int] = {}
+        self._all_ideas = 0
+        self._database_key: Optional[str] = None
+        self._loaded_at = 0.0
+        self._max_idea_id = 0
+        self._max_link_rowid = 0
+        self._link_count = 0
+        self._idea_count = 0
+        self.loads = 0
+
+    def _set_bit(self, category: str, value: str, idea_id: int) -> None:
+        key = (category, value)
+        self._bitmaps[key] = self._bitmaps.get(key, 0) | (1 << idea_id)
+
+    def _load(self, cursor: sqlite3.Cursor, database_key: str) -> None:
+        self._bitmaps = {}
+        self._all_ideas = 0
+        self._max_idea_id = 0
+        self._max_link_rowid = 0
+        self._link_count = 0
+        self._idea_count = 0
+        self._load_delta(cursor)
+        self._database_key = database_key
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        logger.info(f"Tag bitmap index built: {len(self._bitmaps)} tags, {self._all_ideas.bit_count()} ideas")
+
+    def _load_delta(self, cursor: sqlite3.Cursor) -> None:
+        # Links of new ideas are picked up by idea id as well: ideas ids
+        # (AUTOINCREMENT) are never reused, idea_tags rowids can be
+        max_idea_id = self._max_idea_id
+
+        # Aggregate new links per tag in SQL and build each bitset once
+        cursor.execute(
+            """
+            SELECT t.category, t.value, MAX(it.rowid), COUNT(*), GROUP_CONCAT(it.idea_id)
+            FROM idea_tags it
+            JOIN tags t ON t.id = it.tag_id
+            WHERE it.rowid > ? OR it.idea_id > ?
+            GROUP BY it.tag_id
+            """,
+            (self._max_link_rowid, max_idea_id)
+        )
+        max_link_rowid = self._max_link_rowid
+        for category, value, max_rowid, link_count, idea_ids in cursor.fetchall():
+            bitmap = ids_to_bitmap(int(idea_id) for idea_id in idea_ids.split(','))
+            self._bitmaps[(category, value)] = self._bitmaps.get((category, value), 0) | bitmap
+            max_link_rowid = max(max_link_rowid, max_rowid)
+            self._link_count += link_count
+        self._max_link_rowid = max_link_rowid
+
+        cursor.execute("SELECT id FROM ideas WHERE id > ?", (max_idea_id,))
+        idea_ids = [row[0] for row in cursor.fetchall()]
+        if idea_ids:
+            self._all_ideas |= ids_to_bitmap(idea_ids)
+            self._max_idea_id = max(idea_ids)
+            self._idea_count += len(idea_ids)
+
+    def sync(self, cursor: sqlite3.Cursor, database_key: str) -> None:
+        """
+        Bring the index up to date with the database.
+
+        Args:
+            cursor: Open database cursor
+            database_key: Identifier of the database (its path)
+        """
+        with self._lock:
+            if (self._database_key != database_key
+                    or time.monotonic() - self._loaded_at > self.full_refresh_interval):
+                self._load(cursor, database_key)
+                return
+
+            cursor.execute(
+                "SELECT (SELECT MAX(id) FROM ideas), (SELECT COUNT(*) FROM ideas), "
+                "(SELECT MAX(rowid) FROM idea_tags), (SELECT COUNT(*) FROM idea_tags)"
+            )
+            max_idea_id, idea_count, max_link_rowid, link_count = cursor.fetchone()
+            max_link_rowid = max_link_rowid or 0
+            if ((max_idea_id or 0) <= self._max_idea_id and max_link_rowid == self._max_link_rowid
+                    and idea_count == self._idea_count and link_count == self._link_count):
+                return
+
+            # Links below the rowid mark were deleted (and their rowids
+            # possibly reused); a delta cannot express that
+            if max_link_rowid < self._max_link_rowid:
+                self._load(cursor, database_key)
+                return
+            self._load_delta(cursor)
+            if self._idea_count != idea_count or self._link_count != link_count:
+                self._load(cursor, database_key)
+
+    def invalidate(self) -> None:
+        """
+        Force a full rebuild on the next sync.
+        """
+        with self._lock:
+            self._database_key = None
+
+    def add_tags(self, idea_id: int, tags: Iterable[Dict[str, str]]) -> None:
+        """
+        Record tags linked to an idea by a committed write.
+
+        Args:
+            idea_id: ID of the tagged idea
+            tags: Tag dictionaries with 'category' and 'value' keys
+        """
+        with self._lock:
+            if self._database_key is None:
+                return
+            self._all_ideas |= 1 << idea_id
+            for tag in tags:
+                self._set_bit(tag['category'], tag['value'], idea_id)
+
+    def remove_idea(self, idea_id: int, max_link_rowid: int) -> None:
+        """
+        Drop a deleted idea from every bitset.
+
+        The caller must have synced the index before deleting, under the
+        same write lock, so that the idea and each of its set bits were
+        counted.
+
+        Args:
+            idea_id: ID of the deleted idea
+            max_link_rowid: MAX(rowid) of idea_tags right after the delete
+        """
+        with self._lock:
+            # Deleting the newest links lowers the mark; sync() would
+            # otherwise take that for rowid reuse and rebuild
+            self._max_link_rowid = min(self._max_link_rowid, max_link_rowid)
+            mask = ~(1 << idea_id)
+            if self._all_ideas >> idea_id & 1:
+                self._idea_count -= 1
+            self._all_ideas &= mask
+            for key, bitmap in self._bitmaps.items():
+                if bitmap >> idea_id & 1:
+                    self._bitmaps[key] = bitmap & mask
+                    # Each set bit is one idea_tags row removed by the cascade
+                    self._link_count -= 1
+
+    def _category_bitmap(self, category: str, values: List[str]) -> int:
+        bitmap = 0
+        for value in values:
+            bitmap |= self._bitmaps.get((category, value), 0)
+        return bitmap
+
+    def match(self, filters: Dict[str, Any], exclude_category: Optional[str] = None) -> Optional[int]:
+        """
+        Resolve the tag filters in `filters` to a bitset of idea IDs.
+
+        Values within a category are OR'ed and categories are AND'ed,
+        matching build_idea_filter_query.
+
+        Args:
+            filters: Dictionary of filter parameters
+            exclude_category: Category to ignore (used for facet counts)
+
+        Returns:
+            Optional[int]: Matching bitset, or None if no tag filter applies
+        """
+        result = None
+        for category in FACET_CATEGORIES:
+            if category == exclude_category or not filters.get(category):
+                continue
+            values = filters[category] if isinstance(filters[category], list) else [filters[category]]
+            bitmap = self._category_bitmap(category, [str(getattr(v, 'value', v)) for v in values])
+            result = bitmap if result is None else result & bitmap
+        return result
+
+    def facet_counts(self, filters: Optional[Dict[str, Any]] = None, restrict: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Count ideas per tag value, conditional on the other applied filters.
+
+        Each category's counts apply every tag filter except the category's
+        own, so selecting a value does not hide its alternatives.
+
+        Args:
+            filters: Currently applied filter parameters
+            restrict: Bitset of ideas passing non-tag filters (search, dates)
+
+        Returns:
+            Dict[str, Dict[str, int]]: Idea counts keyed by category then value
+        """
+        filters = filters or {}
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            bases: Dict[str, int] = {}
+            for (category, value), bitmap in self._bitmaps.items():
+                if category not in bases:
+                    base = self.match(filters, exclude_category=category)
+                    base = self._all_ideas if base is None else base
+                    bases[category] = base if restrict is None else base & restrict
+                    counts[category] = {}
+                counts[category][value] = (bitmap & bases[category]).bit_count()
+        return counts
+
+    def count(self, filters: Dict[str, Any], restrict: Optional[int] = None) -> int:
+        """
+        Count ideas matching every tag filter.
+
+        Args:
+            filters: Currently applied filter parameters
+            restrict: Bitset of ideas passing non-tag filters (search, dates)
+
+        Returns:
+            int: Number of matching ideas
+        """
+        with self._lock:
+            bitmap = self.match(filters)
+            bitmap = self._all_ideas if bitmap is None else bitmap
+            return (bitmap if restrict is None else bitmap & restrict).bit_count()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get index size information.
+
+        Returns:
+            Dict[str, Any]: Tag count, idea count and approximate memory use
+        """
+        with self._lock:
+            return {
+                'tags': len(self._bitmaps),
+                'ideas': self._all_ideas.bit_count(),
+                'bytes': sum((bitmap.bit_length() + 7) // 8 for bitmap in self._bitmaps.values()),
+            }
+
+
+# Process-wide index shared by the database layer
+tag_bitmap_index = TagBitmapIndex()
@@ -0,0 +1,815 @@
+#!/usr/bin/env python3
+"""
+Performance benchmark script.
+
+Builds a synthetic idea corpus in a temporary database and measures
+the database layer and API endpoints against it. The real database
+is never touched.
+"""
+
+import sys
+import time
+import random
+import logging
+import tempfile
+import statistics
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app import database
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+TAG_VALUES = {
+    'industry': ['FinTech', 'HealthTech', 'EdTech', 'AgriTech', 'Developer Tools',
+                 'Climate Tech', 'CyberSecurity', 'Retail', 'Logistics', 'Media'],
+    'technology': ['AI/ML', 'Mobile App', 'Web App', 'IoT', 'Blockchain',
+                   'AR/VR', 'Computer Vision', 'NLP', 'APIs', 'Cloud'],
+    'complexity': ['mvp', 'medium', 'complex'],
+    'target_market': ['b2b', 'b2c', 'enterprise', 'consumer'],
+}
+
+WORDS = ['smart', 'platform', 'assistant', 'tracker', 'marketplace', 'coach',
+         'analytics', 'budget', 'climate', 'garden', 'health', 'learning',
+         'security', 'community', 'workflow', 'inventory', 'energy', 'travel']
+
+
+def build_synthetic_database(path: Path, idea_count: int, seed: int = 42) -> None:
+    """
+    Create a database populated with synthetic ideas.
+
+    Each idea gets one complexity and target_market tag and three to five
+    industry and technology tags (about ten tags per idea).
+
+    Args:
+        path: Location of the database file to create
+        idea_count: Number of ideas to generate
+        seed: Random seed for reproducible corpora
+    """
+    rng = random.Random(seed)
+    database.DATABASE_PATH = path
+    database.initialize_database()
+
+    conn = database.get_db_connection()
+    try:
+        tag_ids = {}
+        for category, values in TAG_VALUES.items():
+            for value in values:
+                cursor = conn.execute(
+                    "INSERT INTO tags (category, value) VALUES (?, ?)", (category, value)
+                )
+                tag_ids[(category, value)] = cursor.lastrowid
+
+        start_date = datetime(2024, 1, 1)
+        ideas = []
+        idea_tags = []
+        market_data = []
+        for idea_id in range(1, idea_count + 1):
+            title = ' '.join(rng.choice(WORDS).capitalize() for _ in range(3))
+            summary = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(15, 40)))
+            description = ' '.join(rng.choice(WORDS) for _ in range(120))
+            generated = start_date + timedelta(minutes=idea_id * 7)
+            ideas.append((idea_id, title, summary, description, description[:400], generated))
+
+            for category, values in TAG_VALUES.items():
+                picks = 1 if category in ('complexity', 'target_market') else rng.randint(3, 5)
+                for value in rng.sample(values, picks):
+                    idea_tags.append((idea_id, tag_ids[(category, value)]))
+
+            market_data.append((idea_id, '$1B', '["Acme", "Globex"]', 'High', '6 months'))
+
+        conn.executemany(
+            """
+            INSERT INTO ideas (id, title, summary, description, supporting_logic, generated_date)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            ideas
+        )
+        conn.executemany("INSERT INTO idea_tags (idea_id, tag_id) VALUES (?, ?)", idea_tags)
+        conn.executemany(
+            """
+            INSERT INTO market_data
+            (idea_id, market_size, competitors, technical_feasibility, development_timeline)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            market_data
+        )
+        conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+
+def time_calls(func: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """
+    Time repeated calls of a function.
+
+    Args:
+        func: Zero-argument callable to measure
+        iterations: Number of calls to make
+
+    Returns:
+        Dict[str, float]: Throughput and latency percentiles in milliseconds
+    """
+    func()  # Warm up
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        'per_second': len(samples) / (sum(samples) / 1000),
+        'p50_ms': statistics.median(samples),
+        'p99_ms': samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    }
+
+
+def format_result(label: str, result: Dict[str, float]) -> str:
+    return (
+        f"{label:<52} {result['per_second']:>10.1f}/s"
+        f"   p50 {result['p50_ms']:>8.3f} ms   p99 {result['p99_ms']:>8.3f} ms"
+    )
+
+
+def get_test_client():
+    """
+    Create a FastAPI test client for the application.
+
+    Returns:
+        TestClient: Client bound to app.main.app
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+    return TestClient(app)
+
+
+def benchmark_connection_pool(iterations: int) -> List[str]:
+    """
+    Compare /api/ideas/ throughput with and without the connection pool.
+    """
+    client = get_test_client()
+    pool_size = database.DATABASE_POOL_SIZE
+    lines = []
+
+    for label, size in (("unpooled connections", 0), (f"pooled connections (size {pool_size or 5})", pool_size or 5)):
+        database.close_connection_pool()
+        database.DATABASE_POOL_SIZE = size
+        result = time_calls(lambda: client.get("/api/ideas/?limit=50"), iterations)
+        lines.append(format_result(f"GET /api/ideas/ {label}", result))
+
+    database.DATABASE_POOL_SIZE = pool_size
+    return lines
+
+
+FILTER_SCENARIOS = [
+    {},
+    {'industry': ['FinTech']},
+    {'industry': ['FinTech', 'EdTech'], 'complexity': ['mvp']},
+    {'technology': ['AI/ML'], 'target_market': ['b2b', 'enterprise']},
+    {'search': 'garden'},
+    {'search': 'climate coach', 'industry': ['Climate Tech']},
+    {'date_from': '2024-06-01', 'date_to': '2024-09-01'},
+]
+
+
+def benchmark_count_queries(iterations: int) -> List[str]:
+    """
+    Check COUNT(DISTINCT i.id) against the full listing and time both.
+    
+    Raises:
+        AssertionError: If a count differs from the number of listed ideas
+    """
+    lines = []
+    for filters in FILTER_SCENARIOS:
+        expected = len(database.get_ideas_with_filters({**filters, 'limit': -1}))
+        actual = database.count_ideas_with_filters(filters)
+        assert actual == expected, f"count mismatch for {filters}: {actual} != {expected}"
+
+        listing = time_calls(lambda: database.get_ideas_with_filters({**filters, 'limit': -1}), max(1, iterations // 20))
+        counting = time_calls(lambda: database.count_ideas_with_filters(filters), iterations)
+        lines.append(f"{str(filters) or '{}'} -> {actual} ideas")
+        lines.append(format_result("  len(get_ideas_with_filters)", listing))
+        lines.append(format_result("  count_ideas_with_filters", counting))
+    return lines
+
+
+def benchmark_tag_filters(iterations: int) -> List[str]:
+    """
+    Compare the semi-join tag filter with the previous OR'ed join query.
+
+    Raises:
+        AssertionError: If the tag filter plan does not use idx_idea_tags_tag_id
+    """
+    filters = {'industry': ['FinTech', 'EdTech'], 'technology': ['AI/ML']}
+    legacy_query = """
+        SELECT DISTINCT i.* FROM ideas i
+        JOIN idea_tags it ON i.id = it.idea_id
+        JOIN tags t ON it.tag_id = t.id
+        WHERE ((t.category = 'industry' AND t.value IN (?, ?))
+            OR (t.category = 'technology' AND t.value IN (?)))
+        ORDER BY i.generated_date DESC
+        LIMIT 50
+    """
+    query, params = database.build_idea_filter_query(filters, "i.*")
+    query += " ORDER BY i.generated_date DESC, i.id LIMIT 50"
+
+    with database.get_db_cursor() as cursor:
+        cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+        plan = [row[3] for row in cursor.fetchall()]
+
+    assert any('idx_idea_tags_tag_id' in step for step in plan), f"tag index not used: {plan}"
+
+    def run(sql, sql_params):
+        with database.get_db_cursor() as cursor:
+            cursor.execute(sql, sql_params)
+            cursor.fetchall()
+
+    lines = [f"filters {filters}", "query plan:"] + [f"  {step}" for step in plan]
+    lines.append(format_result("legacy OR join + DISTINCT (any match)", time_calls(lambda: run(legacy_query, ['FinTech', 'EdTech', 'AI/ML']), iterations)))
+    lines.append(format_result("semi-join per category (all match)", time_calls(lambda: run(query, params), iterations)))
+    lines.append(format_result("count_ideas_with_filters", time_calls(lambda: database.count_ideas_with_filters(filters), iterations)))
+    return lines
+
+
+def benchmark_tag_bitmap_index(iterations: int) -> List[str]:
+    """
+    Time the in-memory tag bitmap index against SQL for tag-only filters.
+
+    Raises:
+        AssertionError: If a bitmap count differs from the SQL count
+    """
+    from app.tag_index import tag_bitmap_index
+
+    lines = []
+    tag_bitmap_index.invalidate()
+    with database.get_db_cursor() as cursor:
+        start = time.perf_counter()
+        tag_bitmap_index.sync(cursor, str(database.DATABASE_PATH))
+        lines.append(f"index build: {(time.perf_counter() - start) * 1000:.1f} ms, {tag_bitmap_index.stats()}")
+
+    filters = {'industry': ['FinTech', 'EdTech'], 'technology': ['AI/ML'], 'complexity': ['mvp']}
+    database.TAG_INDEX_ENABLED = False
+    sql_count = database.count_ideas_with_filters(filters)
+    sql_result = time_calls(lambda: database.count_ideas_with_filters(filters), iterations)
+    database.TAG_INDEX_ENABLED = True
+    bitmap_count = database.count_ideas_with_filters(filters)
+    assert bitmap_count == sql_count, f"bitmap count {bitmap_count} != SQL count {sql_count}"
+
+    lines.append(f"filters {filters} -> {sql_count} ideas")
+    lines.append(format_result("count via SQL semi-joins", sql_result))
+    lines.append(format_result("count via bitmap index", time_calls(lambda: database.count_ideas_with_filters(filters), iterations)))
+    lines.append(format_result("bitmap match only", time_calls(lambda: tag_bitmap_index.match(filters), iterations)))
+    lines.append(format_result("facet counts (all categories)", time_calls(lambda: tag_bitmap_index.facet_counts(filters), iterations)))
+    return lines
+
+
+def legacy_get_idea_by_id(idea_id: int):
+    """
+    Previous get_idea_by_id: three statements, competitors decoded per call.
+    """
+    import json
+
+    with database.get_db_cursor() as cursor:
+        cursor.execute("SELECT * FROM ideas WHERE id = ?", (idea_id,))
+        idea_row = cursor.fetchone()
+        if not idea_row:
+            return None
+        idea = dict(idea_row)
+        cursor.execute(
+            """
+            SELECT t.category, t.value
+            FROM tags t
+            JOIN idea_tags it ON t.id = it.tag_id
+            WHERE it.idea_id = ?
+            """,
+            (idea_id,)
+        )
+        idea['tags'] = [{'category': row[0], 'value': row[1]} for row in cursor.fetchall()]
+        cursor.execute("SELECT * FROM market_data WHERE idea_id = ?", (idea_id,))
+        market_row = cursor.fetchone()
+        if market_row:
+            market_data = dict(market_row)
+            if market_data['competitors']:
+                market_data['competitors'] = json.loads(market_data['competitors'])
+            idea['market_data'] = market_data
+        else:
+            idea['market_data'] = None
+        return idea
+
+
+def benchmark_idea_detail(iterations: int) -> List[str]:
+    """
+    Compare the single-query idea detail hydration with the three-statement version.
+
+    Raises:
+        AssertionError: If both versions return different ideas
+    """
+    from app.api import ideas as ideas_api
+
+    rng = random.Random(7)
+    idea_ids = database.get_all_idea_ids()
+    for idea_id in rng.sample(idea_ids, min(50, len(idea_ids))):
+        assert database.get_idea_by_id(idea_id) == legacy_get_idea_by_id(idea_id), f"idea {idea_id} differs"
+
+    client = get_test_client()
+    lines = []
+    for label, loader in (("three statements (before)", legacy_get_idea_by_id),
+                          ("single hydrated query (after)", database.get_idea_by_id)):
+        ideas_api.get_idea_by_id = loader
+        result = time_calls(lambda: client.get(f"/api/ideas/{rng.choice(idea_ids)}"), iterations)
+        lines.append(format_result(f"GET /api/ideas/{{id}} {label}", result))
+    ideas_api.get_idea_by_id = database.get_idea_by_id
+    return lines
+
+
+def benchmark_async_handlers(iterations: int) -> List[str]:
+    """
+    Measure concurrent request handling under mixed read/write load.
+
+    Runs the same batches of concurrent requests (searches, detail views and
+    small bulk inserts) with database calls made inline on the event loop and
+    through the reader pool / writer thread of app.async_db. Reports overall
+    throughput, the latency of detail views measured from when the batch was
+    issued, and the longest event loop stall seen by a 5 ms ticker (what a
+    WebSocket client would experience).
+    """
+    import asyncio
+    import httpx
+    from app import async_db
+    from app.main import app
+
+    rng = random.Random(11)
+    idea_ids = database.get_all_idea_ids()
+    concurrency = 32
+    bulk_idea = {'title': 'Bench idea', 'summary': 'summary', 'description': 'description',
+                 'supporting_logic': 'logic', 'tags': [{'category': 'industry', 'value': 'FinTech'}]}
+
+    def make_request(client):
+        roll = rng.random()
+        if roll < 0.1:
+            return 'write', client.post("/api/ideas/bulk", json={'ideas': [bulk_idea] * 5})
+        if roll < 0.4:
+            return 'search', client.get(f"/api/ideas/search/?q={rng.choice(WORDS)}&limit=20")
+        if roll < 0.6:
+            return 'search', client.get(f"/api/ideas/search/?industry={rng.choice(TAG_VALUES['industry'])}&limit=20")
+        return 'detail', client.get(f"/api/ideas/{rng.choice(idea_ids)}")
+
+    async def run_load():
+        detail_latencies = []
+        request_count = 0
+        max_stall = 0.0
+        running = True
+
+        async def ticker():
+            nonlocal max_stall
+            while running:
+                start = time.perf_counter()
+                await asyncio.sleep(0.005)
+                max_stall = max(max_stall, (time.perf_counter() - start) * 1000 - 5)
+
+        async def timed(batch_start, kind, request):
+            response = await request
+            assert response.status_code == 200, response.text
+            if kind == 'detail':
+                detail_latencies.append((time.perf_counter() - batch_start) * 1000)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            ticker_task = asyncio.create_task(ticker())
+            await asyncio.sleep(0.01)
+            start = time.perf_counter()
+            for _ in range(max(1, iterations // concurrency)):
+                batch_start = time.perf_counter()
+                await asyncio.gather(*(timed(batch_start, *make_request(client)) for _ in range(concurrency)))
+                request_count += concurrency
+            elapsed = time.perf_counter() - start
+            running = False
+            await ticker_task
+
+        detail_latencies.sort()
+        return {
+            'per_second': request_count / elapsed,
+            'p50_ms': statistics.median(detail_latencies),
+            'p99_ms': detail_latencies[min(len(detail_latencies) - 1, int(len(detail_latencies) * 0.99))],
+            'max_stall_ms': max_stall,
+        }
+
+    get_executors = async_db._get_executors
+    lines = [
+        f"{concurrency} concurrent requests: 50% searches, 40% detail views, 10% bulk writes",
+        "throughput is all requests; p50/p99 are detail view latencies from batch start",
+    ]
+    for label, executors in (("inline on event loop (before)", lambda: (None, None)),
+                             (f"{async_db.DATABASE_READER_THREADS} readers + 1 writer thread (after)", get_executors)):
+        async_db._get_executors = executors
+        asyncio.run(run_load())  # Warm up
+        result = asyncio.run(run_load())
+        lines.append(format_result(label, result) + f"   max loop stall {result['max_stall_ms']:.1f} ms")
+    async_db._get_executors = get_executors
+    async_db.shutdown_executors()
+    return lines
+
+
+def benchmark_write_queue(iterations: int) -> List[str]:
+    """
+    Compare chat message inserts committed one by one and as group commits.
+
+    Raises:
+        AssertionError: If a message was lost
+    """
+    import asyncio
+    from app import async_db
+
+    with database.get_db_cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO projects (name, description, folder_path, status) VALUES (?, ?, ?, ?)",
+            ('Benchmark', 'Write queue benchmark', tempfile.gettempdir(), 'planning')
+        )
+        cursor.execute("INSERT INTO chat_sessions (project_id, title) VALUES (?, ?)", (cursor.lastrowid, 'Benchmark'))
+        session_id = cursor.lastrowid
+
+    def insert_message(cursor):
+        cursor.execute(
+            "INSERT INTO chat_messages (session_id, role, content) VALUES (?, 'user', 'hello')",
+            (session_id,)
+        )
+
+    async def run_load():
+        start = time.perf_counter()
+        await asyncio.gather(*(async_db.write_transaction(insert_message) for _ in range(iterations)))
+        return time.perf_counter() - start
+
+    lines = [f"{iterations} concurrent chat message inserts"]
+    max_batch = async_db.WRITE_QUEUE_MAX_BATCH
+    for label, batch in (("one transaction per message", 1), (f"group commits (up to {max_batch})", max_batch)):
+        async_db.shutdown_executors()
+        async_db.WRITE_QUEUE_MAX_BATCH = batch
+        elapsed = asyncio.run(run_load())
+        stats = async_db.get_executor_stats()['write_queue']
+        lines.append(
+            f"{label:<52} {iterations / elapsed:>10.1f}/s   {stats['batches']} commits, "
+            f"max queue depth {stats['max_queue_depth']}"
+        )
+    async_db.WRITE_QUEUE_MAX_BATCH = max_batch
+    async_db.shutdown_executors()
+
+    with database.get_db_cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM chat_messages WHERE session_id = ?", (session_id,))
+        stored = cursor.fetchone()[0]
+    assert stored == 2 * iterations, f"expected {2 * iterations} messages, found {stored}"
+    return lines
+
+
+PRAGMA_PROFILES = {
+    'sqlite defaults': {'synchronous': 'FULL', 'cache_size': -2000, 'mmap_size': 0,
+                        'temp_store': 'DEFAULT', 'wal_autocheckpoint': 1000},
+    'configured profile': dict(database.DATABASE_PRAGMA_PROFILE),
+}
+
+
+def benchmark_pragma_profiles(iterations: int) -> List[str]:
+    """
+    Compare read and write performance under different PRAGMA profiles.
+    """
+    configured = database.DATABASE_PRAGMA_PROFILE
+    new_idea = {'title': 'Profile idea', 'summary': 'summary', 'description': 'description',
+                'supporting_logic': 'logic', 'tags': [{'category': 'industry', 'value': 'FinTech'}]}
+    lines = []
+
+    for name, profile in PRAGMA_PROFILES.items():
+        database.close_connection_pool()
+        database.DATABASE_PRAGMA_PROFILE = profile
+        lines.append(f"{name}: {profile}")
+        lines.append(format_result("  insert_idea (one commit each)", time_calls(lambda: database.insert_idea(new_idea), iterations)))
+        lines.append(format_result("  full-text search page", time_calls(
+            lambda: database.get_ideas_with_filters({'search': 'garden coach', 'limit': 20}), iterations)))
+        lines.append(format_result("  tag and date filtered page", time_calls(
+            lambda: database.get_ideas_with_filters({'industry': ['EdTech'], 'date_from': '2024-03-01', 'limit': 50}), iterations)))
+        lines.append(format_result("  full listing with tags", time_calls(
+            lambda: database.get_ideas_with_filters({'limit': -1}), max(1, iterations // 20))))
+
+    database.DATABASE_PRAGMA_PROFILE = configured
+    database.close_connection_pool()
+    return lines
+
+
+def benchmark_card_listing(iterations: int) -> List[str]:
+    """
+    Compare card pages built from full idea rows with the idea_cards table.
+
+    Raises:
+        AssertionError: If the two paths produce different cards
+    """
+    from app.api.ideas import build_idea_card
+
+    def normalized(cards):
+        # Tag order is not part of the API contract
+        return [{**card.model_dump(), 'tags': sorted((tag.category, tag.value) for tag in card.tags)}
+                for card in cards]
+
+    page_filters = [
+        ("first page", {'limit': 50}),
+        ("deep offset page", {'limit': 50, 'offset': 5000}),
+        ("date range page", {'date_from': '2024-02-01', 'date_to': '2024-03-01', 'limit': 50}),
+        ("tag filtered page", {'industry': ['EdTech'], 'complexity': ['mvp'], 'limit': 50}),
+    ]
+    for _, filters in page_filters:
+        full = [build_idea_card(idea) for idea in database.get_ideas_with_filters(filters)]
+        cards = [build_idea_card(idea) for idea in database.get_idea_cards_with_filters(filters)]
+        assert normalized(full) == normalized(cards), f"card pages differ for {filters}"
+
+    conn = database.get_db_connection()
+    try:
+        query, params = database.build_idea_filter_query({}, database.IDEA_CARD_COLUMNS, table="idea_cards")
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {query} ORDER BY i.generated_date DESC, i.id LIMIT 50", params).fetchall()
+    finally:
+        conn.close()
+    lines = [f"card query plan: {' | '.join(row['detail'] for row in plan)}"]
+
+    for label, filters in page_filters:
+        lines.append(format_result(f"{label}: full rows (before)", time_calls(
+            lambda: [build_idea_card(idea) for idea in database.get_ideas_with_filters(filters)], iterations)))
+        lines.append(format_result(f"{label}: idea_cards (after)", time_calls(
+            lambda: [build_idea_card(idea) for idea in database.get_idea_cards_with_filters(filters)], iterations)))
+    return lines
+
+
+def benchmark_dashboard_polling(iterations: int) -> List[str]:
+    """
+    Measure repeated dashboard polling with and without conditional requests.
+
+    Each poll fetches the requests the dashboard makes on load: the first
+    card page, tag lists, facet counts, stats and one idea.
+
+    Raises:
+        AssertionError: If an unchanged resource is not answered with 304
+            or a changed one still is
+    """
+    from app import http_cache
+
+    client = get_test_client()
+    idea_id = database.get_all_idea_ids()[-1]
+    urls = ["/api/ideas/?limit=50", "/api/filters/tags/", "/api/filters/facets/",
+            "/api/ideas/stats/", f"/api/ideas/{idea_id}"]
+
+    etags = {url: client.get(url).headers['etag'] for url in urls}
+    for url in urls:
+        assert client.get(url, headers={'If-None-Match': etags[url]}).status_code == 304, url
+    database.insert_idea({'title': 'Polling idea', 'summary': 'summary', 'description': 'description',
+                          'supporting_logic': 'logic'})
+    assert client.get(urls[0], headers={'If-None-Match': etags[urls[0]]}).status_code == 200
+    etags = {url: client.get(url).headers['etag'] for url in urls}
+
+    def poll(conditional: bool) -> None:
+        for url in urls:
+            client.get(url, headers={'If-None-Match': etags[url]} if conditional else None)
+
+    lines = [f"one poll = {len(urls)} GETs: {', '.join(urls)}"]
+    http_cache.HTTP_CACHE_ENABLED = False
+    lines.append(format_result("full responses, no ETags (before)", time_calls(lambda: poll(False), iterations)))
+    http_cache.HTTP_CACHE_ENABLED = True
+    lines.append(format_result("full responses with ETags", time_calls(lambda: poll(False), iterations)))
+    lines.append(format_result("If-None-Match revalidation, 304s (after)", time_calls(lambda: poll(True), iterations)))
+    return lines
+
+
+def benchmark_response_cache(iterations: int) -> List[str]:
+    """
+    Compare hot read endpoints with and without the serialized response cache.
+
+    Raises:
+        AssertionError: If a cached response differs from a rendered one
+    """
+    from app import http_cache
+
+    client = get_test_client()
+    rng = random.Random(5)
+    idea_ids = database.get_all_idea_ids()
+    hot_ids = rng.sample(idea_ids, min(20, len(idea_ids)))
+    urls = ["/api/ideas/?limit=50", "/api/filters/tags/"] + [f"/api/ideas/{idea_id}" for idea_id in hot_ids]
+
+    max_bytes = http_cache.response_cache.max_bytes
+    http_cache.response_cache.clear()
+    rendered = {url: client.get(url) for url in urls}
+    for url in urls:
+        cached = client.get(url)
+        assert cached.content == rendered[url].content and cached.headers == rendered[url].headers, url
+
+    lines = [f"unconditional GETs over {len(urls)} URLs (card page, tag list, {len(hot_ids)} idea details)"]
+    http_cache.response_cache.max_bytes = 0
+    http_cache.response_cache.clear()
+    lines.append(format_result("rendered by handlers (before)", time_calls(lambda: client.get(rng.choice(urls)), iterations)))
+    http_cache.response_cache.max_bytes = max_bytes
+    lines.append(format_result("served from response cache (after)", time_calls(lambda: client.get(rng.choice(urls)), iterations)))
+    lines.append(f"response cache: {http_cache.response_cache.stats()}")
+    return lines
+
+
+def benchmark_serialization(iterations: int) -> List[str]:
+    """
+    Compare serializing a 100-card page through FastAPI's response_model
+    path with the trusted-rows path. Rows are read once; no database work is
+    timed.
+
+    Raises:
+        AssertionError: If the paths produce different JSON
+    """
+    import asyncio
+    import json
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_response_field
+    from app.api.ideas import build_idea_card
+    from app.models import IdeaCardResponse, Tag
+    from app.responses import orjson, trusted_json_response
+
+    ideas = database.get_idea_cards_with_filters({'limit': 100})
+    field = create_response_field(name="Response_get_ideas", type_=List[IdeaCardResponse])
+    loop = asyncio.new_event_loop()
+
+    def validated_response(response_class) -> bytes:
+        # What FastAPI does with a returned list: re-validate against
+        # response_model, dump to dicts, then encode
+        cards = [build_idea_card(idea) for idea in ideas]
+        content = loop.run_until_complete(serialize_response(field=field, response_content=cards))
+        return response_class(content).body
+
+    def trusted_response() -> bytes:
+        return trusted_json_response([build_idea_card(idea) for idea in ideas]).body
+
+    def constructed_response() -> bytes:
+        # model_construct() skips validation but runs in Python
+        cards = [IdeaCardResponse.model_construct(
+            id=idea['id'], title=idea['title'], summary=database.truncate_card_summary(idea['card_summary']),
+            tags=[Tag.model_construct(**tag) for tag in idea['tags']],
+            generated_date=datetime.fromisoformat(idea['generated_date'])) for idea in ideas]
+        return trusted_json_response(cards).body
+
+    try:
+        expected = json.loads(validated_response(JSONResponse))
+        assert json.loads(trusted_response()) == expected, "trusted serialization differs"
+        assert json.loads(constructed_response()) == expected, "model_construct serialization differs"
+
+        lines = [f"{len(ideas)}-card page, {len(trusted_response())} bytes"]
+        lines.append(format_result("validated models + JSONResponse (before)", time_calls(
+            lambda: validated_response(JSONResponse), iterations)))
+        if orjson is not None:
+            assert json.loads(validated_response(ORJSONResponse)) == expected, "orjson serialization differs"
+            lines.append(format_result("validated models + ORJSONResponse", time_calls(
+                lambda: validated_response(ORJSONResponse), iterations)))
+        else:
+            lines.append("orjson not installed; skipping ORJSONResponse")
+        lines.append(format_result("model_construct + trusted_json_response", time_calls(
+            constructed_response, iterations)))
+        lines.append(format_result("constructor + trusted_json_response (after)", time_calls(
+            trusted_response, iterations)))
+    finally:
+        loop.close()
+    return lines
+
+
+def benchmark_compression(iterations: int) -> List[str]:
+    """
+    Measure response compression of API payloads and static assets.
+
+    Raises:
+        AssertionError: If a compressed response does not decode to the
+            identity response, or revalidation of it is not answered with 304
+    """
+    from app import compression
+
+    client = get_test_client()
+    identity = {'Accept-Encoding': 'identity'}
+    gzipped = {'Accept-Encoding': 'gzip'}
+    urls = ["/api/ideas/?limit=100", "/api/filters/tags/", f"/api/ideas/{database.get_all_idea_ids()[-1]}",
+            "/static/js/app.js", "/static/css/styles.css"]
+
+    lines = []
+    for url in urls:
+        plain = client.get(url, headers=identity)
+        packed = client.get(url, headers=gzipped)
+        # httpx decodes the body; Content-Length is the size on the wire
+        assert packed.content == plain.content, url
+        etag = packed.headers.get('etag')
+        if etag:
+            if 'content-encoding' in packed.headers:
+                assert etag != plain.headers.get('etag'), url
+            assert client.get(url, headers={**gzipped, 'If-None-Match': etag}).status_code == 304, url
+        wire = int(packed.headers['content-length'])
+        lines.append(f"{url}: {len(plain.content)} -> {wire} bytes ({packed.headers.get('content-encoding', 'identity')})")
+
+    card_page = client.get(urls[0], headers=identity).content
+    lines.append(format_result(f"gzip level {compression.GZIP_LEVEL} of a 100-card page", time_calls(
+        lambda: compression.compress_body(card_page, 'gzip'), iterations)))
+    lines.append(format_result("100-card page, identity", time_calls(
+        lambda: client.get(urls[0], headers=identity), iterations)))
+    lines.append(format_result("100-card page, gzip (compressed body cached)", time_calls(
+        lambda: client.get(urls[0], headers=gzipped), iterations)))
+    lines.append(f"compression: {compression.get_compression_stats()}")
+    return lines
+
+
+def benchmark_page_rendering(iterations: int) -> List[str]:
+    """
+    Compare rendering /idea/{id} from disk per request with the cached
+    template segments. The idea lookup is not timed.
+
+    Raises:
+        AssertionError: If the cached homepage differs from index.html
+    """
+    from app import pages
+    from app.api.ideas import build_idea_response
+    from app.responses import dump_trusted_json
+
+    with open(pages.INDEX_TEMPLATE_PATH, "r", encoding="utf-8") as f:
+        assert pages.render_homepage() == f.read().encode('utf-8'), "cached homepage differs"
+
+    def legacy_idea_page(idea_id: int) -> bytes:
+        # What serve_idea_detail did before: read, scan and re-encode the file
+        with open(pages.INDEX_TEMPLATE_PATH, "r", encoding="utf-8") as f:
+            html_content = f.read()
+        html_content = html_content.replace(
+            "</body>",
+            f"<script>window.addEventListener('load', () => {{ window.dailyInspoApp?.showIdeaModal({idea_id}); }});</script></body>"
+        )
+        return html_content.encode('utf-8')
+
+    idea = database.get_idea_by_id(database.get_all_idea_ids()[-1])
+    idea_json = dump_trusted_json(build_idea_response(idea))
+    lines = [f"template {pages.INDEX_TEMPLATE_PATH}: {len(pages.render_homepage())} bytes"]
+    lines.append(format_result("read + replace per request (before)", time_calls(
+        lambda: legacy_idea_page(idea['id']), iterations)))
+    lines.append(format_result("cached segments (after)", time_calls(
+        lambda: pages.render_idea_page(idea['id']), iterations)))
+    lines.append(format_result("cached segments with inlined idea", time_calls(
+        lambda: pages.render_idea_page(idea['id'], idea, idea_json), iterations)))
+    return lines
+
+
+BENCHMARKS = {
+    'pool': benchmark_connection_pool,
+    'count': benchmark_count_queries,
+    'tags': benchmark_tag_filters,
+    'bitmap': benchmark_tag_bitmap_index,
+    'detail': benchmark_idea_detail,
+    'async': benchmark_async_handlers,
+    'writes': benchmark_write_queue,
+    'pragmas': benchmark_pragma_profiles,
+    'cards': benchmark_card_listing,
+    'polling': benchmark_dashboard_polling,
+    'responses': benchmark_response_cache,
+    'serialization': benchmark_serialization,
+    'compression': benchmark_compression,
+    'pages': benchmark_page_rendering,
+}
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Daily Inspo against a synthetic corpus")
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK",
+                        help=f"Benchmarks to run: {', '.join(sorted(BENCHMARKS))} (default: all)")
+    parser.add_argument("--ideas", type=int, default=10000,
+                        help="Number of synthetic ideas to generate")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="Iterations per measurement")
+
+    args = parser.parse_args()
+    selected = args.benchmarks or sorted(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "benchmark.db"
+        print(f"Building synthetic database with {args.ideas} ideas...")
+        start = time.perf_counter()
+        build_synthetic_database(db_path, args.ideas)
+        print(f"Built in {time.perf_counter() - start:.1f}s\n")
+
+        for name in selected:
+            print(f"== {name} ==")
+            for line in BENCHMARKS[name](args.iterations):
+                print(line)
+            print()
+
+        database.close_connection_pool()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
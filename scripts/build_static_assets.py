@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Static asset build script.
+
+Writes content-hashed copies of the CSS and JavaScript under static/ to
+static/dist/, each with precompressed `.gz` and (when brotli is installed)
+`.br` siblings, plus the manifest the application uses to point pages at
+the hashed URLs. Run it after changing any static asset.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.static_assets import STATIC_DIRECTORY, build_static_assets
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress static assets")
+    parser.add_argument("--directory", type=Path,
+                        default=Path(__file__).parent.parent / STATIC_DIRECTORY,
+                        help="Static directory (default: the project's static/)")
+
+    args = parser.parse_args()
+
+    try:
+        manifest = build_static_assets(args.directory)
+        for asset, hashed in sorted(manifest.items()):
+            logger.info(f"{asset} -> {hashed}")
+
+    except Exception as e:
+        logger.error(f"Static asset build failed: {str(e)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
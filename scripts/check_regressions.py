@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Regression check script.
+
+Runs behavioural checks against a small database in a temporary
+directory and reports each as passed or failed. The real database is
+never touched. Exits non-zero if any check fails.
+"""
+
+import sys
+import sqlite3
+import logging
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app import database
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+FINTECH = {'category': 'industry', 'value': 'FinTech'}
+EDTECH = {'category': 'industry', 'value': 'EdTech'}
+MVP = {'category': 'complexity', 'value': 'mvp'}
+
+
+def make_idea(title: str, tags: List[Dict[str, str]]) -> Dict:
+    """
+    Build idea data for insert_idea.
+
+    Args:
+        title: Idea title
+        tags: Tag dictionaries
+
+    Returns:
+        Dict: Idea data
+    """
+    return {'title': title, 'summary': f"{title} summary", 'description': f"{title} description",
+            'supporting_logic': f"{title} logic", 'tags': tags}
+
+
+def insert_idea_out_of_process(title: str, tags: List[Dict[str, str]], notice: bool = True) -> int:
+    """
+    Insert a tagged idea through a separate connection, the way
+    scripts/generate_idea.py does, bypassing this process's write hooks.
+
+    Args:
+        title: Idea title
+        tags: Tag dictionaries
+        notice: Let this process see the new data version right away
+
+    Returns:
+        int: New idea ID
+    """
+    conn = sqlite3.connect(database.DATABASE_PATH)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO ideas (title, summary, description, supporting_logic) VALUES (?, ?, ?, ?)",
+            (title, f"{title} summary", f"{title} description", f"{title} logic")
+        )
+        idea_id = cursor.lastrowid
+        database.write_idea_tags(cursor, [(idea_id, tags)])
+        database.bump_data_version(cursor)
+        conn.commit()
+    finally:
+        conn.close()
+    if notice:
+        # The web process notices the new data version within a second
+        database.query_cache.invalidate()
+    return idea_id
+
+
+def sql_count(filters: Dict) -> int:
+    """
+    Count matching ideas with the tag bitmap index disabled.
+
+    Args:
+        filters: Dictionary of filter parameters
+
+    Returns:
+        int: Number of matching ideas
+    """
+    database.TAG_INDEX_ENABLED = False
+    database.query_cache.invalidate()
+    try:
+        return database.count_ideas_with_filters(filters)
+    finally:
+        database.TAG_INDEX_ENABLED = True
+        database.query_cache.invalidate()
+
+
+def assert_tag_filters_see(idea_id: int, filters: Dict) -> None:
+    """
+    Check that tag-filtered listings, counts and facets include an idea.
+
+    Args:
+        idea_id: Idea expected to match
+        filters: Tag filters the idea matches
+    """
+    cards = database.get_idea_cards_with_filters({**filters, 'limit': 100})
+    assert idea_id in [card['id'] for card in cards], f"idea {idea_id} missing from listing for {filters}"
+    expected = sql_count(filters)
+    count = database.count_ideas_with_filters(filters)
+    assert count == expected, f"count {count} != SQL count {expected} for {filters}"
+    facets = database.get_facet_counts({})['facets']
+    for category, values in filters.items():
+        for value in values:
+            facet_count = facets.get(category, {}).get(value, 0)
+            facet_expected = sql_count({category: [value]})
+            assert facet_count == facet_expected, f"facet {category}={value}: {facet_count} != {facet_expected}"
+
+
+def check_tag_index_delete_then_insert() -> None:
+    """
+    The tag bitmap index picks up ideas inserted after the newest tagged
+    idea was deleted, when SQLite reuses the deleted idea_tags rowids.
+    """
+    filters = {'industry': ['FinTech']}
+    for i in range(3):
+        database.insert_idea(make_idea(f"Seed {i}", [FINTECH, MVP]))
+    assert_tag_filters_see(database.get_all_idea_ids()[-1], filters)
+
+    # Deleted in this process, re-inserted by another
+    newest = database.get_all_idea_ids()[-1]
+    assert database.delete_idea(newest)
+    assert_tag_filters_see(insert_idea_out_of_process("Reinserted", [FINTECH, MVP]), filters)
+
+    # Deleted and re-inserted by other processes with the same link count
+    newest = database.get_all_idea_ids()[-1]
+    conn = sqlite3.connect(database.DATABASE_PATH)
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("DELETE FROM ideas WHERE id = ?", (newest,))
+        conn.commit()
+    finally:
+        conn.close()
+    idea_id = insert_idea_out_of_process("Replaced", [EDTECH, MVP])
+    assert_tag_filters_see(idea_id, {'industry': ['EdTech']})
+    cards = database.get_idea_cards_with_filters({**filters, 'limit': 100})
+    assert newest not in [card['id'] for card in cards], f"deleted idea {newest} still listed"
+
+
+def check_tag_index_counts() -> None:
+    """
+    Deleting ideas in this process does not force a full tag index rebuild,
+    and untagged ideas deleted elsewhere drop out of the index's counts.
+    """
+    from app.tag_index import tag_bitmap_index
+
+    filters = {'industry': ['FinTech']}
+    for i in range(3):
+        database.insert_idea(make_idea(f"Seed {i}", [FINTECH, MVP]))
+    assert_tag_filters_see(database.get_all_idea_ids()[-1], filters)
+
+    # Inserted after the last sync, then deleted; and an already synced idea
+    loads = tag_bitmap_index.loads
+    assert database.delete_idea(database.insert_idea(make_idea("Short-lived", [FINTECH, EDTECH])))
+    assert database.delete_idea(database.get_all_idea_ids()[0])
+    assert_tag_filters_see(database.get_all_idea_ids()[-1], filters)
+    assert tag_bitmap_index.loads == loads, f"{tag_bitmap_index.loads - loads} full rebuilds after deletes"
+
+    # Untagged idea deleted by another process
+    untagged = database.insert_idea(make_idea("Untagged", []))
+    assert database.get_facet_counts({})['total_count'] == 3
+    conn = sqlite3.connect(database.DATABASE_PATH)
+    try:
+        conn.execute("DELETE FROM ideas WHERE id = ?", (untagged,))
+        database.bump_data_version(conn.cursor())
+        conn.commit()
+    finally:
+        conn.close()
+    database.query_cache.invalidate()
+    total = database.get_facet_counts({})['total_count']
+    assert total == 2, f"facets total_count {total} != 2 after deleting an untagged idea elsewhere"
+
+
+def check_dedup_invalidates_caches() -> None:
+    """
+    Ideas deleted by scripts/remove_duplicates.py are no longer served from
+    the response cache, revalidated with 304 or counted by query_cache.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from scripts.remove_duplicates import remove_duplicates
+
+    database.insert_idea(make_idea("Duplicate", [FINTECH]))
+    duplicate_id = database.insert_idea(make_idea("Duplicate", [FINTECH]))
+
+    client = TestClient(app)
+    url = f"/api/ideas/{duplicate_id}"
+    cached = client.get(url)
+    assert cached.status_code == 200 and client.get(url).status_code == 200
+    etag = cached.headers['etag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+    assert client.get("/api/ideas/stats/").json()['total_ideas'] == 2
+
+    remove_duplicates(dry_run=False)
+    # The web process notices the new data version within a second
+    database.query_cache.invalidate()
+
+    assert client.get(url).status_code == 404, "deleted idea served from the response cache"
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 404, "deleted idea revalidated"
+    assert client.get("/api/ideas/stats/").json()['total_ideas'] == 1, "stale cached idea count"
+
+
+def check_wildcard_if_none_match() -> None:
+    """
+    "If-None-Match: *" is answered with 304 only for existing resources.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    idea_id = database.insert_idea(make_idea("Existing", [FINTECH]))
+    client = TestClient(app)
+    wildcard = {'If-None-Match': '*'}
+    for _ in range(2):  # rendered, then from the response cache
+        response = client.get(f"/api/ideas/{idea_id}", headers=wildcard)
+        assert response.status_code == 304 and response.content == b"", f"existing idea: {response.status_code}"
+        assert client.get(f"/api/ideas/{idea_id}").status_code == 200
+    response = client.get(f"/api/ideas/{idea_id + 1}", headers=wildcard)
+    assert response.status_code == 404, f"missing idea answered with {response.status_code}"
+
+
+def check_validate_filters_count() -> None:
+    """
+    POST /api/filters/validate/ counts every match, not just one page, and
+    ignores internal filter keys sent by the client.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    # More matches than the default page size of 50
+    idea_ids = database.bulk_insert_ideas(
+        [make_idea(f"Counted {i}", [FINTECH if i % 3 else EDTECH, MVP]) for i in range(120)]
+    )
+    client = TestClient(app)
+    for filters in ({'industry': ['FinTech']}, {'complexity': ['mvp']}, {'search': 'Counted'},
+                    {'industry': ['FinTech'], 'search': 'Counted'}):
+        expected = sql_count(filters)
+        listed = len(database.get_ideas_with_filters({**filters, 'limit': 1000}))
+        assert expected == listed, f"SQL count {expected} != {listed} listed for {filters}"
+        for extra in ({}, {'limit': 1, 'offset': 5}, {'idea_ids': idea_ids[:1]}, {'cursor': 'not-a-cursor'}):
+            response = client.post("/api/filters/validate/", json={**filters, **extra})
+            assert response.status_code == 200, f"{filters} {extra}: HTTP {response.status_code}"
+            count = response.json()['expected_count']
+            assert count == expected, f"expected_count {count} != {expected} for {filters} {extra}"
+
+
+def check_generate_invalidates_caches() -> None:
+    """
+    Conditional GETs right after POST /api/ideas/generate/ see the generated
+    idea instead of a 304 for the old ETag.
+    """
+    import subprocess
+    from unittest import mock
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    database.insert_idea(make_idea("Existing", [FINTECH]))
+    client = TestClient(app)
+    urls = ["/api/ideas/", "/api/ideas/?industry=FinTech", "/api/ideas/stats/"]
+    etags = {}
+    for url in urls:
+        etags[url] = client.get(url).headers['etag']
+        assert client.get(url, headers={'If-None-Match': etags[url]}).status_code == 304
+
+    def run_generator(args, **kwargs):
+        # Stands in for scripts/generate_idea.py, which writes from its own process
+        idea_id = insert_idea_out_of_process("Generated", [FINTECH], notice=False)
+        return subprocess.CompletedProcess(args, 0, stdout=f"GENERATED_IDEA_ID:{idea_id}\n", stderr="")
+
+    with mock.patch.object(subprocess, 'run', run_generator):
+        response = client.post("/api/ideas/generate/")
+    assert response.status_code == 200, f"generate: HTTP {response.status_code}"
+    generated_id = response.json()['id']
+
+    for url in urls:
+        response = client.get(url, headers={'If-None-Match': etags[url]})
+        assert response.status_code == 200, f"{url}: HTTP {response.status_code} after generating"
+    ids = [idea['id'] for idea in client.get("/api/ideas/").json()]
+    assert generated_id in ids, f"generated idea {generated_id} missing from the listing"
+
+
+def check_facets_without_tag_index() -> None:
+    """
+    Facet counts with DAILY_INSPO_TAG_INDEX=0 come from SQL and match the
+    bitmap index; /api/filters/facets/ lists the default values either way.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    client = TestClient(app)
+    empty = {facet['category']: facet['values'] for facet in client.get("/api/filters/facets/").json()['facets']}
+    assert {'value': 'b2b', 'count': 0} in empty.get('target_market', []), f"no default target markets: {empty}"
+    assert {'value': 'mvp', 'count': 0} in empty.get('complexity', []), f"no default complexity levels: {empty}"
+
+    b2b = {'category': 'target_market', 'value': 'b2b'}
+    for i in range(30):
+        tags = [FINTECH if i % 2 else EDTECH, b2b] + ([MVP] if i % 3 == 0 else [])
+        database.insert_idea(make_idea(f"Faceted {i % 4}", tags))
+
+    for filters in ({}, {'industry': ['FinTech']}, {'industry': ['FinTech', 'EdTech'], 'complexity': ['mvp']},
+                    {'search': 'Faceted 1'}, {'search': 'Faceted', 'complexity': ['mvp']},
+                    {'date_from': '2000-01-01', 'target_market': ['b2b']}):
+        expected = database.get_facet_counts(filters)
+        database.TAG_INDEX_ENABLED = False
+        try:
+            counts = database.get_facet_counts(filters)
+        finally:
+            database.TAG_INDEX_ENABLED = True
+        assert counts == expected, f"SQL facets {counts} != index facets {expected} for {filters}"
+
+    database.TAG_INDEX_ENABLED = False
+    try:
+        response = client.get("/api/filters/facets/?industry=FinTech")
+    finally:
+        database.TAG_INDEX_ENABLED = True
+    assert response.status_code == 200, f"facets without the tag index: HTTP {response.status_code}"
+    assert response.json()['total_count'] == 15, f"total_count {response.json()['total_count']} != 15"
+
+
+CHECKS: Dict[str, Callable[[], None]] = {
+    'tag-index-counts': check_tag_index_counts,
+    'tag-index-delete-insert': check_tag_index_delete_then_insert,
+    'validate-filters-count': check_validate_filters_count,
+    'dedup-invalidates-caches': check_dedup_invalidates_caches,
+    'facets-without-tag-index': check_facets_without_tag_index,
+    'generate-invalidates-caches': check_generate_invalidates_caches,
+    'wildcard-if-none-match': check_wildcard_if_none_match,
+}
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run regression checks against a temporary database")
+    parser.add_argument("checks", nargs="*", metavar="CHECK",
+                        help=f"Checks to run: {', '.join(sorted(CHECKS))} (default: all)")
+
+    args = parser.parse_args()
+    selected = args.checks or sorted(CHECKS)
+    unknown = set(selected) - set(CHECKS)
+    if unknown:
+        parser.error(f"Unknown checks: {', '.join(sorted(unknown))}")
+
+    failures = 0
+    for name in selected:
+        # Each check gets a fresh database
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database.close_connection_pool()
+            database.DATABASE_PATH = Path(temp_dir) / "checks.db"
+            database.invalidate_caches()
+            try:
+                if not database.initialize_database():
+                    raise RuntimeError("database initialization failed")
+                CHECKS[name]()
+                print(f"PASS {name}")
+            except Exception as e:
+                failures += 1
+                print(f"FAIL {name}: {type(e).__name__}: {e}")
+            finally:
+                database.close_connection_pool()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,7 +18,7 @@ from typing import Dict, Any, Optional, List
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.database import insert_idea, log_generation_attempt, get_ideas_with_filters
+from app.database import insert_idea, log_generation_attempt, get_ideas_with_filters, initialize_database
 
 # Configure logging
 logging.basicConfig(
@@ -330,7 +330,7 @@ def store_idea_in_database(idea_data: Dict[str, Any]) -> Optional[int]:
         Optional[int]: Idea ID if successful, None if failed
     """
     import sqlite3
-    from app.database import DATABASE_PATH
+    from app.database import DATABASE_PATH, bump_data_version, write_idea_tags
     
     max_retries = 5
     retry_delay = 1  # seconds
@@ -364,26 +364,10 @@ def store_idea_in_database(idea_data: Dict[str, Any]) -> Optional[int]:
                 
                 # Insert tags if provided
                 if 'tags' in idea_data and idea_data['tags']:
-                    for tag in idea_data['tags']:
-                        # Insert or get existing tag
-                        cursor.execute(
-                            "INSERT OR IGNORE INTO tags (category, value) VALUES (?, ?)",
-                            (tag['category'], tag['value'])
-                        )
-                        
-                        # Get tag ID
-                        cursor.execute(
-                            "SELECT id FROM tags WHERE category = ? AND value = ?",
-                            (tag['category'], tag['value'])
-                        )
-                        tag_result = cursor.fetchone()
-                        if tag_result:
-                            tag_id = tag_result[0]
-                            # Link idea to tag
-                            cursor.execute(
-                                "INSERT OR IGNORE INTO idea_tags (idea_id, tag_id) VALUES (?, ?)",
-                                (idea_id, tag_id)
-                            )
+                    write_idea_tags(cursor, [(idea_id, idea_data['tags'])])
+                
+                # Tell caches in the web app process that data changed
+                bump_data_version(cursor)
                 
                 conn.commit()
                 logger.info(f"Successfully stored idea with ID {idea_id}")
@@ -479,6 +463,11 @@ def main():
     logger.info("Starting daily idea generation")
     
     try:
+        # Create missing tables (app_meta holds the shared data version)
+        if not initialize_database():
+            logger.error("Database initialization failed")
+            return False
+            
         # Load methodology
         methodology = load_claude_methodology()
         logger.info("Methodology loaded successfully")
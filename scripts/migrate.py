@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Database migration script.
+
+Applies pending schema migrations (app/migrations.py) to the database.
+The application runs the same migrations on startup; use this script to
+migrate ahead of a deploy or to see what would change.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app import database
+from app.migrations import get_latest_version, get_schema_version, run_migrations
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Apply pending database schema migrations")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List pending migrations without applying them")
+    parser.add_argument("--target", type=int, default=None,
+                        help="Stop after this schema version (default: latest)")
+    parser.add_argument("--database", type=Path, default=None,
+                        help=f"Database file (default: {database.DATABASE_PATH})")
+
+    args = parser.parse_args()
+    if args.database is not None:
+        database.DATABASE_PATH = args.database
+
+    try:
+        conn = database.get_db_connection()
+        try:
+            current = get_schema_version(conn)
+        finally:
+            conn.close()
+        logger.info(f"Schema version {current}, latest {get_latest_version()}")
+
+        steps = run_migrations(dry_run=args.dry_run, target_version=args.target)
+        if not steps:
+            logger.info("Database schema is up to date")
+        for step in steps:
+            prefix = "Pending" if args.dry_run else "Applied"
+            logger.info(f"{prefix} migration {step.version}: {step.description}")
+
+    except Exception as e:
+        logger.error(f"Migration failed: {str(e)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
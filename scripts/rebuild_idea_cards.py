@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Rebuild the idea_cards table.
+
+Triggers keep idea_cards in sync with ideas and their tags. Run this
+script to recover if the table was edited by hand, restored from an
+inconsistent backup, or is otherwise suspected to have drifted.
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app import database
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main execution function."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Recompute idea_cards from ideas and tags")
+    parser.add_argument("--database", type=Path, default=None,
+                        help=f"Database file (default: {database.DATABASE_PATH})")
+
+    args = parser.parse_args()
+    if args.database is not None:
+        database.DATABASE_PATH = args.database
+
+    try:
+        # Make sure idea_cards and its triggers exist before rebuilding
+        if not database.initialize_database():
+            return 1
+        database.rebuild_idea_cards()
+
+    except Exception as e:
+        logger.error(f"Idea card rebuild failed: {str(e)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,7 +13,7 @@ import logging
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from app.database import DATABASE_PATH, get_db_connection
+from app.database import DATABASE_PATH, bump_data_version, get_db_connection, initialize_database
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -93,6 +93,9 @@ def remove_duplicates(dry_run=True):
                     cursor.execute("DELETE FROM ideas WHERE id = ?", (delete_id,))
                     logger.info(f"  Deleted idea ID {delete_id}")
                 
+                # Tell caches in the web app process that data changed
+                bump_data_version(cursor)
+                
                 conn.commit()
             except Exception as e:
                 conn.rollback()
@@ -121,6 +124,9 @@ def main():
     logger.info("Starting duplicate removal process...")
     
     try:
+        # Create missing tables (app_meta holds the shared data version)
+        if not initialize_database():
+            return 1
         remove_duplicates(dry_run=not args.execute)
         logger.info("Duplicate removal process completed successfully")
         
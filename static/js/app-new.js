@@ -196,17 +196,16 @@ class DailyInspoApp {
      */
     async loadFilterOptions() {
         try {
-            // Load industries
-            const industries = await this.apiRequest('/api/filters/industries/');
-            this.populateSelect('industry-filter', industries);
-            
-            // Load technologies
-            const technologies = await this.apiRequest('/api/filters/technologies/');
-            this.populateSelect('technology-filter', technologies);
+            // Load every facet in a single request
+            const { facets } = await this.apiRequest('/api/filters/facets/');
+            const valuesFor = (category) => {
+                const facet = facets.find(f => f.category === category);
+                return facet ? facet.values.map(v => v.value) : [];
+            };
             
-            // Load target markets
-            const targetMarkets = await this.apiRequest('/api/filters/target-markets/');
-            this.populateSelect('market-filter', targetMarkets);
+            this.populateSelect('industry-filter', valuesFor('industry'));
+            this.populateSelect('technology-filter', valuesFor('technology'));
+            this.populateSelect('market-filter', valuesFor('target_market'));
             
             // Complexity is already populated in HTML
         } catch (error) {
@@ -311,14 +310,17 @@ class DailyInspoApp {
     }
 
     /**
-     * Show detailed idea modal
+     * Show detailed idea modal, using preloaded data (inlined by the
+     * /idea/{id} page) when given
      */
-    async showIdeaModal(ideaId) {
+    async showIdeaModal(ideaId, preloadedIdea = null) {
         try {
             this.showLoading();
             
-            // Fetch detailed idea data
-            const idea = await this.apiRequest(`/api/ideas/${ideaId}`);
+            // Fetch detailed idea data unless the page already carries it
+            const idea = preloadedIdea?.id === ideaId ?
+                preloadedIdea :
+                await this.apiRequest(`/api/ideas/${ideaId}`);
             
             // Populate modal content
             document.getElementById('modal-title').textContent = idea.title;